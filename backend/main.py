@@ -2,7 +2,10 @@
 
 import sys
 import os
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional, Dict, List
 import asyncio
@@ -31,7 +34,13 @@ from services.recipe_scraper_pipeline import scrape_recipe_via_mcp
 # --------------------------------------------------
 # Logging
 # --------------------------------------------------
-logging.basicConfig(level=logging.INFO)
+# LOG_LEVEL=DEBUG brings back the per-query pipeline traces.
+# Request threads only enqueue records; a listener thread does the stderr writes.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("CulinaraAI")
 
 # --------------------------------------------------
@@ -79,7 +88,7 @@ async def startup():
 
         # Get recipe count from Supabase
         stats = rag_engine.get_statistics()
-        logger.info(f"📊 Supabase has {stats['total_recipes']} recipes, {stats['total_embeddings']} embeddings")
+        logger.info("📊 Supabase has %s recipes, %s embeddings", stats['total_recipes'], stats['total_embeddings'])
 
         if stats['total_recipes'] == 0:
             logger.warning("⚠️  Supabase has no recipes! Run GitHub Actions scraper or scripts/scrape_recipes.py")
@@ -135,9 +144,10 @@ def mcp_process_query(query: str, preferences: Optional[UserPreferences] = None)
         raise RuntimeError("MCP Orchestrator not initialized")
 
     logger.info("=" * 60)
-    logger.info(f"🎯 MCP Orchestrator Processing: '{query}'")
+    logger.info("🎯 MCP Orchestrator Processing: '%s'", query)
     if preferences:
-        logger.info(f"👤 User Preferences: diets={preferences.diets}, skill={preferences.skill}, servings={preferences.servings}, goal={preferences.goal}")
+        logger.info("👤 User Preferences: diets=%s, skill=%s, servings=%s, goal=%s",
+                    preferences.diets, preferences.skill, preferences.servings, preferences.goal)
     logger.info("=" * 60)
 
     # Step 1: Process query via MCP orchestrator
@@ -161,7 +171,7 @@ def mcp_process_query(query: str, preferences: Optional[UserPreferences] = None)
                 "source": meta.get("url", "database"),
                 "score": score_percentage
             })
-        logger.info(f"✅ Added {len(recipes_list)} recipes from database")
+        logger.info("✅ Added %d recipes from database", len(recipes_list))
 
     # Step 3: If no RAG DB results, use pre-scraped and filtered recipes from orchestrator
     elif orchestrator_result.get("has_web_results"):
@@ -172,7 +182,7 @@ def mcp_process_query(query: str, preferences: Optional[UserPreferences] = None)
         web_recipes = web_results.get("recipes", [])
 
         if web_recipes:
-            logger.info(f"✅ Using {len(web_recipes)} pre-scraped recipes from orchestrator")
+            logger.info("✅ Using %d pre-scraped recipes from orchestrator", len(web_recipes))
             for recipe in web_recipes:
                 recipes_list.append({
                     "title": recipe.get("title", "Recipe"),
@@ -182,15 +192,15 @@ def mcp_process_query(query: str, preferences: Optional[UserPreferences] = None)
                     "source": recipe.get("source", "web"),
                     "score": 95.0  # High score for web results since they matched search
                 })
-                logger.info(f"  ✅ Added recipe: {recipe.get('title', 'Unknown')[:50]}")
+                logger.debug("  ✅ Added recipe: %.50s", recipe.get('title', 'Unknown'))
         else:
             logger.warning("⚠️ No recipes available from web search after filtering")
 
-    logger.info(f"💡 Generated {len(facts_list)} culinary facts")
+    logger.info("💡 Generated %d culinary facts", len(facts_list))
     if facts_list:
-        logger.info("📋 Facts being returned:")
+        logger.debug("📋 Facts being returned:")
         for i, fact in enumerate(facts_list, 1):
-            logger.info(f"   {i}. {fact[:100]}")
+            logger.debug("   %d. %.100s", i, fact)
     else:
         logger.warning("⚠️ No facts generated for this query!")
 
@@ -211,8 +221,8 @@ def health():
 @app.post("/api/chat", response_model=ChatResponse)
 def chat(req: ChatRequest):
     # Start timing
-    start_time = time.time()
-    logger.info(f"⏱️  Query started at {time.strftime('%H:%M:%S')}: '{req.message[:50]}...'")
+    start_time = time.perf_counter()
+    logger.info("⏱️  Query started at %s: '%.50s...'", time.strftime('%H:%M:%S'), req.message)
 
     if not rag_engine or not mcp_orchestrator:
         raise HTTPException(status_code=500, detail="Engines not initialized")
@@ -224,14 +234,14 @@ def chat(req: ChatRequest):
         result = mcp_process_query(req.message.strip(), preferences=req.preferences)
 
         # Calculate elapsed time
-        elapsed_time = time.time() - start_time
-        logger.info(f"⏱️  Query completed in {elapsed_time:.2f} seconds")
+        elapsed_time = time.perf_counter() - start_time
+        logger.info("⏱️  Query completed in %.2f seconds", elapsed_time)
 
         # Log warning if query took too long
         if elapsed_time > 8.0:
-            logger.warning(f"⚠️  Query exceeded 8 second target! Took {elapsed_time:.2f}s")
+            logger.warning("⚠️  Query exceeded 8 second target! Took %.2fs", elapsed_time)
         else:
-            logger.info(f"✅ Query completed within target time ({elapsed_time:.2f}s < 8s)")
+            logger.info("✅ Query completed within target time (%.2fs < 8s)", elapsed_time)
         
         # Ensure recipes have proper structure and valid scores
         validated_recipes = []
@@ -261,7 +271,7 @@ def chat(req: ChatRequest):
             "collection_pages": result.get("collection_pages", [])
         }
 
-        logger.info(f"📤 Sending response with {len(response_data['facts'])} facts")
+        logger.info("📤 Sending response with %d facts", len(response_data['facts']))
 
         return response_data
     except Exception as e:
@@ -311,7 +321,7 @@ def save_preferences(req: SavePreferencesRequest):
 
         result = supabase.table("user_preferences").upsert(data).execute()
 
-        logger.info(f"💾 Saved preferences for session {req.session_id[:8]}...")
+        logger.info("💾 Saved preferences for session %.8s...", req.session_id)
 
         return PreferencesResponse(
             success=True,
@@ -356,7 +366,7 @@ def get_preferences(session_id: str):
                 goal=prefs_data["goal"]
             )
 
-            logger.info(f"📥 Retrieved preferences for session {session_id[:8]}...")
+            logger.info("📥 Retrieved preferences for session %.8s...", session_id)
 
             return PreferencesResponse(
                 success=True,
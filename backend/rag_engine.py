@@ -1,16 +1,142 @@
 import os
+import re
+import json
+import asyncio
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+try:
+    import simsimd  # Optional SIMD cosine kernels
+except ImportError:
+    simsimd = None
+
 # MCP tools
 from services.mcp_tools import get_mcp_tools
 from services.mcp_orchestrator import MCPOrchestrator
+from utils.cache import EmbeddingCache, SemanticResultCache, SimpleCache
+from utils.fast_json import json_loads
+from utils.gemini import configure_gemini, get_generative_model
 
 load_dotenv()
 
+logger = logging.getLogger("CulinaraAI.rag")
+
+# Max concurrent embed + Chroma searches in search_many
+EMBED_CONCURRENCY = int(os.getenv("EMBED_CONCURRENCY", "3"))
+
+# Search results are reused for QUERY_CACHE_TTL seconds, for the same query or
+# one whose embedding is at least QUERY_CACHE_SIMILARITY similar
+QUERY_CACHE_TTL = int(os.getenv("QUERY_CACHE_TTL", "600"))
+QUERY_CACHE_SIMILARITY = float(os.getenv("QUERY_CACHE_SIMILARITY", "0.97"))
+
+# Tokenizer used to turn candidate text into a set for keyword matching
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Tokenizer for user queries (keeps hyphenated terms like "stir-fry")
+_QUERY_TOKEN_RE = re.compile(r"[a-z][a-z\-]+")
+
+# Search vocabularies used by _extract_key_terms
+_COMMON_INGREDIENTS = frozenset({
+    "chicken", "beef", "pork", "lamb", "fish", "salmon", "tuna",
+    "shrimp", "prawn", "paneer", "tofu", "cheese", "mushroom",
+    "tomato", "potato", "onion", "garlic", "ginger", "rice",
+    "pasta", "noodle", "bread", "egg", "spinach", "beans",
+    "lentil", "dal", "curry", "tikka", "masala", "biryani",
+})
+
+_COOKING_METHODS = frozenset({
+    "grilled", "fried", "baked", "roasted", "steamed", "boiled",
+    "sauteed", "stir-fry", "slow-cook", "instant", "quick",
+})
+
+_MEAL_TYPES = frozenset({
+    "breakfast", "lunch", "dinner", "snack", "appetizer",
+    "dessert", "soup", "salad", "main", "side",
+})
+
+_STOP_WORDS = frozenset({
+    "how", "to", "make", "recipe", "for", "a", "an",
+    "the", "with", "and", "or", "of", "in", "some", "get", "me",
+})
+
+# Ingredients that conflict with a requested ingredient (soft penalty only)
+_INGREDIENT_CONFLICTS = {
+    "chicken": ("tofu", "vegan", "vegetarian"),
+    "tofu": ("chicken", "beef", "pork", "meat"),
+    "paneer": (),  # Paneer rarely conflicts
+    "beef": ("vegan", "vegetarian"),
+    "pork": ("halal", "kosher"),
+}
+
+
+@lru_cache(maxsize=512)
+def _term_matcher(words: Tuple[str, ...]):
+    """
+    Compile a single alternation matching any of words as a whole token
+    (same boundaries as _TOKEN_RE), optionally pluralized ("egg" -> "eggs",
+    "tomato" -> "tomatoes"); findall() returns the matched word itself.
+    None when there is nothing to match.
+    """
+    if not words:
+        return None
+    alternation = "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+    return re.compile(rf"(?<![a-z0-9])({alternation})(?:e?s)?(?![a-z0-9])")
+
+
+def _safe_float(value) -> float:
+    """float() that returns NaN instead of raising on bad values"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _batch_cosine(q: np.ndarray, mat: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity of query vector q against every row of mat.
+    Uses SimSIMD when installed, otherwise a NumPy matmul.
+    """
+    q = np.asarray(q, dtype=np.float32)
+    mat = np.asarray(mat, dtype=np.float32)
+    if mat.size == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    if simsimd is not None:
+        return 1.0 - np.asarray(simsimd.cdist(q[None, :], mat, metric="cosine"), dtype=np.float32)[0]
+
+    norms = np.linalg.norm(mat, axis=1) * np.linalg.norm(q)
+    return (mat @ q) / np.where(norms == 0, 1.0, norms)
+
+
+@lru_cache(maxsize=512)
+def _extract_key_terms(query: str):
+    """
+    Extract searchable terms from query
+    Returns tuples (all_terms, ingredients, methods, meal_type)
+    """
+    # Extract words
+    words = [
+        w for w in _QUERY_TOKEN_RE.findall(query.lower())
+        if len(w) > 2 and w not in _STOP_WORDS
+    ]
+
+    # Categorize terms
+    ingredients = tuple(w for w in words if w in _COMMON_INGREDIENTS)
+    methods = tuple(w for w in words if w in _COOKING_METHODS)
+    meal_type = tuple(w for w in words if w in _MEAL_TYPES)
+
+    # All searchable terms (ingredients/methods/meal types are already in words)
+    all_terms = tuple(dict.fromkeys(words))
+
+    return all_terms, ingredients, methods, meal_type
+
 
 class RecipeRAGEngine:
     """
@@ -26,7 +152,7 @@ class RecipeRAGEngine:
         chroma_collection: chromadb.api.models.Collection.Collection
         """
         # ---------------- Gemini ----------------
-        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+        configure_gemini()
 
         self.embedding_model = "models/text-embedding-004"
         self.generation_model = "gemini-2.0-flash-exp"
@@ -38,6 +164,16 @@ class RecipeRAGEngine:
         self.mcp_tools = get_mcp_tools()
         self.mcp_orchestrator: Optional[MCPOrchestrator] = None
 
+        # ---------------- Caches ----------------
+        self._embedding_cache = EmbeddingCache()  # Exact float32 memo; int8 only in the similarity tier
+        self._meta_cache: Dict[str, Dict] = {}  # recipe id -> parsed metadata
+        self._stats_cache: Optional[Tuple[int, Dict]] = None  # (collection count, stats)
+        self._search_cache = SemanticResultCache(
+            ttl_seconds=QUERY_CACHE_TTL, max_entries=512, threshold=QUERY_CACHE_SIMILARITY,
+            namespace="rag:chroma",  # Shared across workers when REDIS_URL is set
+        )
+        self._context_cache = SimpleCache(ttl_seconds=QUERY_CACHE_TTL, max_entries=256)  # recipe ids -> LLM context
+
     # -------------------- MCP Orchestrator --------------------
 
     def setup_mcp_orchestrator(self):
@@ -47,57 +183,60 @@ class RecipeRAGEngine:
     # -------------------- Embeddings --------------------
 
     def embed_query(self, query: str) -> np.ndarray:
+        cached = self._embedding_cache.get(query)
+        if cached is not None:
+            return cached
+
         result = genai.embed_content(
             model=self.embedding_model,
             content=query,
             task_type="retrieval_query",
         )
-        return np.array(result["embedding"], dtype=np.float32)
+        return self._embedding_cache.set(query, result["embedding"])
+
+    def embed_queries(self, queries: List[str]) -> np.ndarray:
+        """Embed several queries with a single Gemini request (cache-aware)"""
+        found = {}
+        for q in queries:
+            cached = self._embedding_cache.get(q)
+            if cached is not None:
+                found[q] = cached
+
+        missing = [q for q in dict.fromkeys(queries) if q not in found]
+        if missing:
+            result = genai.embed_content(
+                model=self.embedding_model,
+                content=missing,
+                task_type="retrieval_query",
+            )
+            for q, emb in zip(missing, result["embedding"]):
+                found[q] = self._embedding_cache.set(q, emb)
 
-    # -------------------- Keyword Utilities --------------------
+        return np.stack([found[q] for q in queries])
 
-    def _extract_key_terms(self, query: str):
-        """Extract searchable terms from query"""
-        common_ingredients = {
-            "chicken", "beef", "pork", "lamb", "fish", "salmon", "tuna",
-            "shrimp", "prawn", "paneer", "tofu", "cheese", "mushroom", 
-            "tomato", "potato", "onion", "garlic", "ginger", "rice", 
-            "pasta", "noodle", "bread", "egg", "spinach", "beans",
-            "lentil", "dal", "curry", "tikka", "masala", "biryani",
-        }
+    async def aembed_query(self, query: str) -> np.ndarray:
+        """Async variant of embed_query (falls back to a worker thread)"""
+        cached = self._embedding_cache.get(query)
+        if cached is not None:
+            return cached
 
-        cooking_methods = {
-            "grilled", "fried", "baked", "roasted", "steamed", "boiled",
-            "sauteed", "stir-fry", "slow-cook", "instant", "quick",
-        }
+        embed_async = getattr(genai, "embed_content_async", None)
+        if embed_async is None:
+            return await asyncio.to_thread(self.embed_query, query)
 
-        meal_types = {
-            "breakfast", "lunch", "dinner", "snack", "appetizer", 
-            "dessert", "soup", "salad", "main", "side",
-        }
+        result = await embed_async(
+            model=self.embedding_model,
+            content=query,
+            task_type="retrieval_query",
+        )
+        return self._embedding_cache.set(query, result["embedding"])
 
-        stop_words = {
-            "how", "to", "make", "recipe", "for", "a", "an",
-            "the", "with", "and", "or", "of", "in", "some", "get", "me",
-        }
+    # -------------------- Keyword Utilities --------------------
 
-        # Extract words
-        words = [
-            w.strip("?,.!").lower()
-            for w in query.split()
-            if w.lower() not in stop_words and len(w) > 2
-        ]
+    def _extract_key_terms(self, query: str):
+        """Extract searchable terms from query"""
+        return _extract_key_terms(query)
 
-        # Categorize terms
-        ingredients = [w for w in words if w in common_ingredients]
-        methods = [w for w in words if w in cooking_methods]
-        meal_type = [w for w in words if w in meal_types]
-        
-        # All searchable terms
-        all_terms = list(set(ingredients + methods + meal_type + words))
-        
-        return all_terms, ingredients, methods, meal_type
-    
     def search_recipes(self, query: str, top_k: int = 5, min_score: float = 0.35):
         """
         MCP compatibility wrapper.
@@ -110,87 +249,92 @@ class RecipeRAGEngine:
             min_score=min_score  # Pass through threshold parameter
         )
 
-    def _check_keyword_match(self, all_terms, ingredient_terms, methods, text):
+    @staticmethod
+    def _split_terms(terms):
+        """
+        Split terms into a set of single-word terms and a tuple of compound
+        terms (e.g. "stir-fry" -> ("stir", "fry")) for token-set matching
+        """
+        simple, compound = set(), []
+        for term in terms:
+            parts = tuple(_TOKEN_RE.findall(term.lower()))
+            if len(parts) == 1:
+                simple.add(parts[0])
+            elif parts:
+                compound.append(parts)
+        return frozenset(simple), tuple(compound)
+
+    @staticmethod
+    def _count_matches(term_set, tokens) -> int:
+        """Count how many terms of a split term set are present in tokens"""
+        simple, compound = term_set
+        return len(simple & tokens) + sum(1 for parts in compound if tokens.issuperset(parts))
+
+    def _check_keyword_match(self, term_sets, ingredient_terms, tokens):
         """
         Improved keyword matching - more lenient
-        Returns: (boost_score, has_keyword_match, match_details)
+        term_sets: (all_terms, ingredient_terms, methods) as returned by _split_terms
+        tokens: set of lowercase tokens from the candidate text
+        Returns: (ingredient_matches, method_matches, overall_matches, conflicts)
         """
-        text = text.lower()
-
-        # Check for conflicting ingredients (optional filtering)
-        ingredient_conflicts = {
-            "chicken": ["tofu", "vegan", "vegetarian"],
-            "tofu": ["chicken", "beef", "pork", "meat"],
-            "paneer": [],  # Paneer rarely conflicts
-            "beef": ["vegan", "vegetarian"],
-            "pork": ["halal", "kosher"],
-        }
+        all_set, ingredient_set, method_set = term_sets
 
         # Soft conflict check - don't reject, just reduce score slightly
-        conflict_penalty = 0.0
-        for ing in ingredient_terms:
-            for conflict in ingredient_conflicts.get(ing, []):
-                if conflict in text:
-                    conflict_penalty -= 0.1  # Small penalty, not rejection
+        conflicts = sum(
+            1
+            for ing in ingredient_terms
+            for conflict in _INGREDIENT_CONFLICTS.get(ing, ())
+            if conflict in tokens
+        )
 
-        # Check if ANY ingredient term matches (not all required)
-        ingredient_matches = sum(1 for ing in ingredient_terms if ing in text)
-        has_ingredient_match = ingredient_matches > 0
-        
-        # Check if ANY cooking method matches
-        method_matches = sum(1 for method in methods if method in text)
-        
-        # Check overall term matches
-        overall_matches = sum(1 for t in all_terms if t in text)
-        
-        # Calculate boost based on matches
-        boost = 0.0
-        
-        # Boost for ingredient matches (most important)
-        if ingredient_matches > 0:
-            boost += min(0.20, ingredient_matches * 0.08)
-        
-        # Boost for method matches
-        if method_matches > 0:
-            boost += min(0.10, method_matches * 0.05)
-        
-        # Boost for overall term matches
-        if overall_matches > 0:
-            boost += min(0.15, overall_matches * 0.03)
-        
-        # Apply conflict penalty
-        boost += conflict_penalty
-        
-        # Has keyword match if we found ingredients OR methods OR multiple terms
-        has_keyword_match = (
-            ingredient_matches > 0 or 
-            method_matches > 0 or 
-            overall_matches >= 2
+        return (
+            self._count_matches(ingredient_set, tokens),  # ANY ingredient term (not all required)
+            self._count_matches(method_set, tokens),  # ANY cooking method
+            self._count_matches(all_set, tokens),  # Overall term matches
+            conflicts,
         )
-        
-        match_details = {
-            "ingredient_matches": ingredient_matches,
-            "method_matches": method_matches,
-            "overall_matches": overall_matches,
-        }
 
-        return boost, has_keyword_match, match_details
+    @staticmethod
+    def _keyword_boosts(counts: np.ndarray):
+        """
+        Compute keyword boosts for all candidates at once
+        counts: int array of shape (n, 4) as returned row-wise by _check_keyword_match
+        Returns: (boosts, has_keyword_match) arrays
+        """
+        ingredient, method, overall, conflicts = counts.T
+
+        boosts = (
+            np.minimum(0.20, ingredient * 0.08)  # Ingredient matches (most important)
+            + np.minimum(0.10, method * 0.05)  # Method matches
+            + np.minimum(0.15, overall * 0.03)  # Overall term matches
+            - conflicts * 0.1  # Small penalty per conflict, not rejection
+        )
+
+        # Has keyword match if we found ingredients OR methods OR multiple terms
+        has_keyword_match = (ingredient > 0) | (method > 0) | (overall >= 2)
+
+        return boosts, has_keyword_match
 
     # -------------------- Search --------------------
 
     def _parse_metadata(self, meta: dict) -> dict:
         """
         Parse JSON strings back to Python objects for ingredients/instructions
+        Parsed results are cached by recipe id (see clear_metadata_cache)
         """
-        import json
-        
+        rid = meta.get("id")
+        if rid is not None:
+            cached = self._meta_cache.get(rid)
+            if cached is not None:
+                return cached
+
         parsed = meta.copy()
         
         # Parse JSON string fields back to lists/dicts
         for key in ['ingredients', 'instructions']:
             if key in parsed and isinstance(parsed[key], str):
                 try:
-                    parsed[key] = json.loads(parsed[key])
+                    parsed[key] = json_loads(parsed[key])
                 except:
                     # If parsing fails, treat as single-item list
                     parsed[key] = [parsed[key]]
@@ -198,7 +342,7 @@ class RecipeRAGEngine:
         # Parse facts if stored as JSON string
         if 'facts' in parsed and isinstance(parsed['facts'], str):
             try:
-                parsed['facts'] = json.loads(parsed['facts'])
+                parsed['facts'] = json_loads(parsed['facts'])
             except:
                 parsed['facts'] = {}
         
@@ -208,9 +352,18 @@ class RecipeRAGEngine:
             for key in ['prep_time', 'cook_time', 'total_time', 'servings', 'calories']:
                 if key in parsed and parsed[key]:
                     parsed['facts'][key] = parsed[key]
-        
+
+        if rid is not None:
+            self._meta_cache[rid] = parsed
+
         return parsed
 
+    def clear_metadata_cache(self):
+        """Drop cached parsed metadata (call after re-ingesting / rebuilding the index)"""
+        self._meta_cache.clear()
+        self._search_cache.clear()
+        self._context_cache.clear()
+
     def search_chroma(
         self,
         query: str,
@@ -221,18 +374,130 @@ class RecipeRAGEngine:
         """
         Search ChromaDB with semantic similarity + keyword matching
         """
-        print(f"    🔍 Searching ChromaDB for: '{query}'")
-        print(f"    📊 Parameters: top_k={top_k}, min_score={min_score}")
+        logger.debug("    🔍 Searching ChromaDB for: '%s'", query)
+        logger.debug("    📊 Parameters: top_k=%s, min_score=%s", top_k, min_score)
 
         # Extract search terms
         all_terms, ingredient_terms, methods, meal_types = self._extract_key_terms(query)
-        print(f"    🔑 Key terms: {all_terms[:5]}")
-        print(f"    🥘 Ingredients: {ingredient_terms}")
-        print(f"    👨‍🍳 Methods: {methods}")
+        logger.debug("    🔑 Key terms: %s", all_terms[:5])
+        logger.debug("    🥘 Ingredients: %s", ingredient_terms)
+        logger.debug("    👨‍🍳 Methods: %s", methods)
         
         # Get embedding
         embedding = self.embed_query(query)
 
+        # Results are keyword-boosted by the query's terms, so a near hit may only reuse
+        # results ranked for the same ingredients / methods (and the same fast path)
+        cache_scope = (
+            f"{top_k}|{min_score}|{json.dumps(filters, sort_keys=True)}"
+            f"|{','.join(sorted(set(ingredient_terms)))}|{','.join(sorted(set(methods)))}|{bool(all_terms)}"
+        )
+        cached = self._search_cache.get(cache_scope, query, embedding)
+        if cached is not None:
+            logger.debug("    ⚡ Returning %s cached results", len(cached))
+            return cached
+
+        results = self._rank_candidates(
+            embedding, all_terms, ingredient_terms, methods, top_k, filters, min_score
+        )
+        self._search_cache.set(cache_scope, query, embedding, results)
+        return results
+
+    async def asearch_chroma(
+        self,
+        query: str,
+        top_k: int = 5,
+        filters: Optional[Dict] = None,
+        min_score: float = 0.35,
+    ) -> List[Dict]:
+        """
+        Async variant of search_chroma - awaits the embedding, then runs the cached
+        search in a worker thread (its embed_query is a memo hit) so searches can overlap
+        """
+        await self.aembed_query(query)
+        return await asyncio.to_thread(self.search_chroma, query, top_k, filters, min_score)
+
+    def search_many(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        min_score: float = 0.35,
+    ) -> List[List[Dict]]:
+        """
+        Run several searches on a bounded thread pool (EMBED_CONCURRENCY workers).
+        The Gemini and Chroma calls are I/O bound, so their latency overlaps.
+        """
+        if len(queries) <= 1:
+            return [self.search_chroma(q, top_k=top_k, min_score=min_score) for q in queries]
+
+        with ThreadPoolExecutor(max_workers=min(EMBED_CONCURRENCY, len(queries))) as pool:
+            return list(pool.map(
+                lambda q: self.search_chroma(q, top_k=top_k, min_score=min_score),
+                queries,
+            ))
+
+    def search_chroma_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        min_score: float = 0.35,
+    ) -> List[List[Dict]]:
+        """
+        Search many queries (e.g. an evaluation set) with one batched Gemini
+        embedding call and one multi-embedding Chroma query
+        """
+        if not queries:
+            return []
+
+        embeddings = self.embed_queries(queries)
+        results = self.collection.query(
+            query_embeddings=embeddings.tolist(),
+            n_results=min(top_k * 5, 50),
+            include=["metadatas", "distances"],
+        )
+
+        batch = []
+        for i, query in enumerate(queries):
+            all_terms, ingredient_terms, methods, _ = self._extract_key_terms(query)
+            batch.append(self._score_candidates(
+                results["metadatas"][i], results["distances"][i],
+                all_terms, ingredient_terms, methods, top_k, None, min_score,
+            ))
+        return batch
+
+    def _rank_candidates(
+        self,
+        embedding: np.ndarray,
+        all_terms: List[str],
+        ingredient_terms: List[str],
+        methods: List[str],
+        top_k: int,
+        filters: Optional[Dict],
+        min_score: float,
+    ) -> List[Dict]:
+        """Query ChromaDB with a precomputed embedding and rank the candidates"""
+        # Fast path: no keywords to boost and no filters -> Chroma's own top_k order is final
+        if not all_terms and not filters:
+            results = self.collection.query(
+                query_embeddings=[embedding.tolist()],
+                n_results=top_k,
+                include=["metadatas", "distances"],
+            )
+            top_results = []
+            for meta, dist in zip(results["metadatas"][0], results["distances"][0]):
+                score = max(0.0, min(1.0, 1.0 - dist))
+                if score < min_score:
+                    continue
+                top_results.append({
+                    "id": meta.get("id", "unknown"),
+                    "score": score,
+                    "metadata": self._parse_metadata(meta),
+                    "keyword_match": False,
+                    "match_details": {},
+                })
+            logger.debug("    ✅ Returning %s results (no keywords, fast path)", len(top_results))
+            return top_results
+
         # Query ChromaDB - get more results for filtering
         results = self.collection.query(
             query_embeddings=[embedding.tolist()],
@@ -240,71 +505,112 @@ class RecipeRAGEngine:
             include=["metadatas", "distances"],
         )
 
-        metadatas = results["metadatas"][0]
-        distances = results["distances"][0]
+        return self._score_candidates(
+            results["metadatas"][0], results["distances"][0],
+            all_terms, ingredient_terms, methods, top_k, filters, min_score,
+        )
 
+    def _score_candidates(
+        self,
+        metadatas: List[Dict],
+        distances: List[float],
+        all_terms: List[str],
+        ingredient_terms: List[str],
+        methods: List[str],
+        top_k: int,
+        filters: Optional[Dict],
+        min_score: float,
+    ) -> List[Dict]:
+        """Apply keyword boosts, threshold and filters to Chroma candidates"""
         if not metadatas:
-            print(f"    ⚠️ No results from ChromaDB")
+            logger.debug("    ⚠️ No results from ChromaDB")
             return []
 
-        print(f"    📋 ChromaDB returned {len(metadatas)} candidates")
+        logger.debug("    📋 ChromaDB returned %s candidates", len(metadatas))
 
-        final = []
+        # Build the term sets once per query; each candidate is then a set intersection
+        term_sets = (
+            self._split_terms(all_terms),
+            self._split_terms(ingredient_terms),
+            self._split_terms(methods),
+        )
+
+        # One compiled alternation over every word the counts look at (terms + conflicts)
+        words = set()
+        for simple, compound in term_sets:
+            words.update(simple)
+            for parts in compound:
+                words.update(parts)
+        for ing in ingredient_terms:
+            words.update(_INGREDIENT_CONFLICTS.get(ing, ()))
+        matcher = _term_matcher(tuple(sorted(words)))
 
-        for meta, dist in zip(metadatas, distances):
-            # Create searchable text blob from metadata
-            text_blob = " ".join([
+        counts = np.zeros((len(metadatas), 4), dtype=np.int32)
+
+        for i, meta in enumerate(metadatas):
+            # Collect the query words present in the metadata in a single regex pass
+            ingredients = meta.get("ingredients", "")
+            text_blob = " ".join((
                 str(meta.get("title", "")),
                 str(meta.get("category", "")),
                 str(meta.get("cuisine", "")),
-                " ".join(meta.get("ingredients", [])) if isinstance(meta.get("ingredients"), list) else str(meta.get("ingredients", "")),
-            ])
+                " ".join(ingredients) if isinstance(ingredients, list) else str(ingredients),
+            ))
+            tokens = set(matcher.findall(text_blob.lower())) if matcher else set()
 
             # Check keyword matching
-            boost, has_keyword_match, match_details = self._check_keyword_match(
-                all_terms, ingredient_terms, methods, text_blob
-            )
+            counts[i] = self._check_keyword_match(term_sets, ingredient_terms, tokens)
 
-            # Calculate final score (distance is 0-2, similarity is 1-distance)
-            # Keep score in 0-1 range, don't multiply by 100 here
-            base_score = max(0.0, 1.0 - dist)  # Convert distance to similarity (0-1)
-            final_score = max(0.0, min(1.0, base_score + boost))  # Add boost, clamp to 0-1
+        boosts, keyword_mask = self._keyword_boosts(counts)
 
-            # Log matching details for debugging
-            title = meta.get("title", "Unknown")[:40]
-            print(f"      • {title}: base={base_score:.3f}, boost={boost:.3f}, final={final_score:.3f}, keyword={has_keyword_match}")
+        # Calculate scores for all candidates at once (distance is 0-2, similarity is 1-distance)
+        # Keep score in 0-1 range, don't multiply by 100 here
+        base_scores = np.clip(1.0 - np.asarray(distances, dtype=np.float64), 0.0, None)
+        scores = np.clip(base_scores + boosts, 0.0, 1.0)
 
-            # Skip if below threshold (but keep if strong keyword match)
-            if final_score < min_score and not (has_keyword_match and base_score > 0.30):
-                continue
+        # Log matching details for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            for meta, base, boost, final_score, kw in zip(metadatas, base_scores, boosts, scores, keyword_mask):
+                logger.debug("      • %.40s: base=%.3f, boost=%.3f, final=%.3f, keyword=%s",
+                             meta.get("title", "Unknown"), base, boost, final_score, kw)
+
+        # Keep if above threshold (or a strong keyword match)
+        keep = (scores >= min_score) | (keyword_mask & (base_scores > 0.30))
 
-            # Apply additional filters if provided
-            if filters:
-                passed = True
+        # Apply additional filters if provided
+        if filters:
+            for i in np.flatnonzero(keep):
+                meta = metadatas[i]
                 for k, v in filters.items():
                     val = str(meta.get(k, "")).lower()
                     if isinstance(v, str) and val != v.lower():
-                        passed = False
+                        keep[i] = False
                     if isinstance(v, list) and val not in [x.lower() for x in v]:
-                        passed = False
-                if not passed:
-                    continue
-
-            # Add to results
-            final.append({
-                "id": meta.get("id", "unknown"),
-                "score": final_score,
-                "metadata": self._parse_metadata(meta),  # Parse JSON strings back to lists
-                "keyword_match": has_keyword_match,
-                "match_details": match_details,
-            })
+                        keep[i] = False
+
+        # Partial sort: select the top_k survivors, then order only those
+        candidates = np.flatnonzero(keep)
+        if len(candidates) > top_k:
+            part = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+            candidates = candidates[part]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        top_results = [
+            {
+                "id": metadatas[i].get("id", "unknown"),
+                "score": float(scores[i]),
+                "metadata": self._parse_metadata(metadatas[i]),  # Parse JSON strings back to lists
+                "keyword_match": bool(keyword_mask[i]),
+                "match_details": {
+                    "ingredient_matches": int(counts[i, 0]),
+                    "method_matches": int(counts[i, 1]),
+                    "overall_matches": int(counts[i, 2]),
+                },
+            }
+            for i in candidates
+        ]
+        logger.debug("    ✅ Returning %s results (after filtering)", len(top_results))
 
-        # Sort by score
-        final.sort(key=lambda x: x["score"], reverse=True)
-        
-        top_results = final[:top_k]
-        print(f"    ✅ Returning {len(top_results)} results (after filtering)")
-        
         return top_results
 
     # -------------------- Recipe Context --------------------
@@ -312,52 +618,64 @@ class RecipeRAGEngine:
     def get_recipe_context(self, recipe_ids: List[str], detailed: bool = True) -> str:
         """
         Get formatted recipe context for LLM summarization
+        (cached per ordered id list - repeat queries tend to land on the same top recipes)
         """
-        context = ""
-        
+        cache_key = f"{int(detailed)}|{'|'.join(recipe_ids)}"
+        cached = self._context_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        parts: List[str] = []
+
+        # Single round trip for every recipe not already parsed by a previous search
+        metas_by_id = {rid: self._meta_cache[rid] for rid in recipe_ids if rid in self._meta_cache}
+        missing = [rid for rid in dict.fromkeys(recipe_ids) if rid not in metas_by_id]
+        if missing:
+            batch = self.collection.get(ids=missing, include=["metadatas"])
+            for rid, meta in zip(batch["ids"], batch["metadatas"]):
+                if meta:
+                    metas_by_id[rid] = self._parse_metadata(meta)  # Parse JSON strings
+
         for recipe_id in recipe_ids:
-            result = self.collection.get(ids=[recipe_id], include=["metadatas"])
-            
-            if not result["metadatas"] or not result["metadatas"][0]:
+            meta = metas_by_id.get(recipe_id)
+            if not meta:
                 continue
-            
-            meta = self._parse_metadata(result["metadatas"][0])  # Parse JSON strings
-            
-            context += f"\n{'='*50}\n"
-            context += f"Recipe: {meta.get('title', 'Unknown')}\n"
-            
+
+            parts.append(f"\n{'='*50}\n")
+            parts.append(f"Recipe: {meta.get('title', 'Unknown')}\n")
+
             if detailed:
                 # Ingredients
                 ingredients = meta.get('ingredients', [])
                 if ingredients:
-                    context += "\nIngredients:\n"
-                    for ing in ingredients[:15]:
-                        context += f"- {ing}\n"
-                
+                    parts.append("\nIngredients:\n")
+                    parts.append("".join(f"- {ing}\n" for ing in ingredients[:15]))
+
                 # Instructions
                 instructions = meta.get('instructions', [])
                 if instructions:
-                    context += "\nInstructions:\n"
-                    for i, step in enumerate(instructions[:10], 1):
-                        context += f"{i}. {step}\n"
-                
+                    parts.append("\nInstructions:\n")
+                    parts.append("".join(f"{i}. {step}\n" for i, step in enumerate(instructions[:10], 1)))
+
                 # Facts
                 if meta.get('prep_time') or meta.get('cook_time'):
-                    context += "\nDetails:\n"
+                    parts.append("\nDetails:\n")
                     if meta.get('prep_time'):
-                        context += f"- Prep Time: {meta['prep_time']}\n"
+                        parts.append(f"- Prep Time: {meta['prep_time']}\n")
                     if meta.get('cook_time'):
-                        context += f"- Cook Time: {meta['cook_time']}\n"
+                        parts.append(f"- Cook Time: {meta['cook_time']}\n")
                     if meta.get('total_time'):
-                        context += f"- Total Time: {meta['total_time']}\n"
+                        parts.append(f"- Total Time: {meta['total_time']}\n")
                     if meta.get('servings'):
-                        context += f"- Servings: {meta['servings']}\n"
+                        parts.append(f"- Servings: {meta['servings']}\n")
                     if meta.get('calories'):
-                        context += f"- Calories: {meta['calories']}\n"
-            
+                        parts.append(f"- Calories: {meta['calories']}\n")
+
             if meta.get('url'):
-                context += f"\nSource: {meta['url']}\n"
-        
+                parts.append(f"\nSource: {meta['url']}\n")
+
+        context = "".join(parts)
+        self._context_cache.set(cache_key, context)
         return context
 
     # -------------------- Recipe Details --------------------
@@ -371,34 +689,47 @@ class RecipeRAGEngine:
     # -------------------- Similar Recipes --------------------
 
     def get_similar_recipes(self, recipe_id: str, top_k: int = 5) -> List[Dict]:
-        recipe = self.get_recipe_details(recipe_id)
-        if not recipe:
+        # Use the embedding Chroma already stores for this recipe
+        result = self.collection.get(ids=[recipe_id], include=["metadatas", "embeddings"])
+        if not result["metadatas"] or not result["metadatas"][0]:
             return []
 
-        # Get recipe embedding from metadata or re-embed title
-        if "embedding" in recipe:
-            query_embedding = recipe["embedding"]
+        embeddings = result.get("embeddings")
+        if embeddings is not None and len(embeddings) and embeddings[0] is not None:
+            query_embedding = [float(x) for x in embeddings[0]]
         else:
-            # Re-embed using title
+            # Re-embed using title (collections created without stored embeddings)
+            recipe = self._parse_metadata(result["metadatas"][0])
             query_embedding = self.embed_query(recipe.get("title", "")).tolist()
 
+        # Over-fetch candidates and re-rank them locally by exact cosine similarity
         results = self.collection.query(
             query_embeddings=[query_embedding],
-            n_results=top_k + 1,
-            include=["metadatas", "distances"],
+            n_results=min((top_k + 1) * 5, 50),
+            include=["metadatas", "distances", "embeddings"],
         )
 
+        metadatas = results["metadatas"][0]
+        embeddings = results.get("embeddings")
+        if embeddings is not None and len(embeddings[0]) == len(metadatas):
+            scores = _batch_cosine(query_embedding, embeddings[0])
+        else:
+            scores = 1.0 - np.asarray(results["distances"][0], dtype=np.float32)
+
         similar = []
-        for meta, dist in zip(results["metadatas"][0], results["distances"][0]):
+        for i in np.argsort(-scores, kind="stable"):
+            meta = metadatas[i]
             if meta.get("id") == recipe_id:
                 continue
             similar.append({
                 "id": meta.get("id"),
-                "score": 1 - dist,
+                "score": float(scores[i]),
                 "metadata": meta,
             })
+            if len(similar) >= top_k:
+                break
 
-        return similar[:top_k]
+        return similar
 
     # -------------------- LLM Generation --------------------
 
@@ -414,8 +745,8 @@ class RecipeRAGEngine:
         if not recipe.get("success"):
             return f"I found a recipe but couldn't fetch details."
 
-        model = genai.GenerativeModel(
-            model_name=self.generation_model,
+        model = get_generative_model(
+            self.generation_model,
             system_instruction=(
                 "Only summarize the given recipe. "
                 "Do not invent ingredients or steps."
@@ -486,12 +817,25 @@ class RecipeRAGEngine:
 
     # -------------------- Stats --------------------
 
+    def refresh_stats(self):
+        """Invalidate cached statistics (call when ingestion runs)"""
+        self._stats_cache = None
+
     def get_statistics(self) -> Dict:
+        """Collection statistics, memoized until the collection count changes"""
         try:
+            count = self.collection.count()
+            if self._stats_cache and self._stats_cache[0] == count:
+                return self._stats_cache[1]
+
             metadatas = self.collection.get(include=["metadatas"])["metadatas"]
-            
+
+            # Chroma returns a flat list from get(); tolerate the nested query() shape too
+            if metadatas and isinstance(metadatas[0], list):
+                metadatas = metadatas[0]
+
             # Handle empty collection
-            if not metadatas or not metadatas[0]:
+            if not metadatas:
                 return {
                     "total_recipes": 0,
                     "categories": {},
@@ -499,30 +843,25 @@ class RecipeRAGEngine:
                     "average_rating": 0.0,
                 }
 
-            categories, cuisines, ratings = {}, {}, []
+            categories = Counter(meta.get("category", "Unknown") for meta in metadatas)
+            cuisines = Counter(meta["cuisine"] for meta in metadatas if meta.get("cuisine"))
 
-            for meta in metadatas[0]:
-                categories[meta.get("category", "Unknown")] = (
-                    categories.get(meta.get("category", "Unknown"), 0) + 1
-                )
-
-                if meta.get("cuisine"):
-                    cuisines[meta["cuisine"]] = cuisines.get(meta["cuisine"], 0) + 1
-
-                if meta.get("rating"):
-                    try:
-                        ratings.append(float(meta["rating"]))
-                    except:
-                        pass
+            ratings = np.fromiter(
+                (_safe_float(meta["rating"]) for meta in metadatas if meta.get("rating")),
+                dtype=np.float64,
+            )
+            ratings = ratings[~np.isnan(ratings)]
 
-            return {
-                "total_recipes": len(metadatas[0]),
-                "categories": categories,
-                "cuisines": cuisines,
-                "average_rating": float(np.mean(ratings)) if ratings else 0.0,
+            stats = {
+                "total_recipes": len(metadatas),
+                "categories": dict(categories),
+                "cuisines": dict(cuisines),
+                "average_rating": float(ratings.mean()) if ratings.size else 0.0,
             }
+            self._stats_cache = (count, stats)
+            return stats
         except Exception as e:
-            print(f"Error getting statistics: {e}")
+            logger.warning("Error getting statistics: %s", e)
             return {
                 "total_recipes": 0,
                 "categories": {},
@@ -8,14 +8,81 @@ This replaces ChromaDB with Supabase for:
 - Better scalability
 """
 import os
-import json
-from typing import List, Dict, Optional
+import logging
+import math
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, List, Dict, Optional, Sequence, Tuple
+import numpy as np
 import google.generativeai as genai
-from supabase import create_client, Client
 from dotenv import load_dotenv
+from utils.cache import SimpleCache, SemanticResultCache
+from utils.fast_json import json_loads
+from utils.gemini import configure_gemini
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 load_dotenv()
 
+# Per-search chatter goes to DEBUG so it costs nothing when disabled
+logger = logging.getLogger("CulinaraAI.rag")
+
+# Cached search results are reused for this long, and for paraphrases whose
+# query embedding is at least this similar to a cached one
+QUERY_CACHE_TTL = int(os.getenv("QUERY_CACHE_TTL", "600"))
+QUERY_CACHE_SIMILARITY = float(os.getenv("QUERY_CACHE_SIMILARITY", "0.97"))
+
+# Concurrent per-id fetches when a bulk recipe query is rejected
+RECIPE_FETCH_WORKERS = int(os.getenv("RECIPE_FETCH_WORKERS", "8"))
+
+try:
+    import diskcache  # Optional on-disk embedding cache (survives restarts)
+except ImportError:
+    diskcache = None
+
+# Set EMBEDDING_CACHE_DIR to persist query embeddings across restarts
+_disk_cache = (
+    diskcache.Cache(os.getenv("EMBEDDING_CACHE_DIR"))
+    if diskcache is not None and os.getenv("EMBEDDING_CACHE_DIR")
+    else None
+)
+
+
+def _unit_vector(vec) -> Tuple[float, ...]:
+    """Scale to unit length so the inner-product search RPC equals cosine similarity"""
+    norm = math.sqrt(math.fsum(x * x for x in vec))
+    return tuple(x / norm for x in vec) if norm else tuple(vec)
+
+
+@lru_cache(maxsize=4096)
+def _embed_query_cached(model: str, query_norm: str) -> Tuple[float, ...]:
+    """Embed a normalized query as a unit vector; memoized in-process and optionally on disk"""
+    disk_key = None
+    if _disk_cache is not None:
+        disk_key = hashlib.sha256(f"{model}\0unit\0{query_norm}".encode("utf-8")).hexdigest()
+        cached = _disk_cache.get(disk_key)
+        if cached is not None:
+            return cached
+
+    result = genai.embed_content(
+        model=model,
+        content=query_norm,
+        task_type="retrieval_query",
+    )
+    embedding = _unit_vector(result["embedding"])
+
+    if _disk_cache is not None:
+        _disk_cache.set(disk_key, embedding)
+
+    return embedding
+
+
+def _as_json(value):
+    """jsonb columns arrive already decoded; only legacy text values need parsing"""
+    return json_loads(value) if isinstance(value, (str, bytes)) else value
+
 
 class SupabaseRAGEngine:
     """
@@ -24,7 +91,7 @@ class SupabaseRAGEngine:
 
     def __init__(self):
         # Configure Gemini
-        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+        configure_gemini()
         self.embedding_model = "models/text-embedding-004"
         self.generation_model = "gemini-2.0-flash-exp"
 
@@ -35,19 +102,51 @@ class SupabaseRAGEngine:
         if not supabase_url or not supabase_key:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment")
 
-        self.supabase: Client = create_client(supabase_url, supabase_key)
-        print("✅ Supabase RAG Engine initialized")
+        # Imported here so the ChromaDB fallback never pays for the supabase client stack
+        from supabase import create_client
+
+        self.supabase: "Client" = create_client(supabase_url, supabase_key)
+
+        # Popular recipes are fetched over and over; keep them briefly in memory
+        self._recipe_cache = SimpleCache(ttl_seconds=300, max_entries=2048)
+        self._context_cache = SimpleCache(ttl_seconds=300, max_entries=256)  # recipe ids -> LLM context
+
+        # Semantic search-result cache: exact hits by key, near hits by embedding
+        self._search_cache = SemanticResultCache(
+            ttl_seconds=QUERY_CACHE_TTL, max_entries=512, threshold=QUERY_CACHE_SIMILARITY,
+            namespace="rag:supabase",  # Shared across workers when REDIS_URL is set
+        )
+
+        # HNSW candidate list size per search (None = database default); see set_search_quality
+        self.ef_search: Optional[int] = int(os.environ["SEARCH_EF"]) if os.getenv("SEARCH_EF") else None
+
+        # Stored recipe embeddings (float32, unit length) for client-side reranking
+        self._recipe_embeddings = SimpleCache(ttl_seconds=3600, max_entries=4096)
+        logger.info("✅ Supabase RAG Engine initialized")
 
     # -------------------- Embeddings --------------------
 
     def embed_query(self, query: str) -> List[float]:
-        """Generate embedding for search query"""
+        """Generate embedding for search query (cached by normalized query)"""
+        return list(_embed_query_cached(self.embedding_model, query.strip().lower()))
+
+    def embed_queries(self, queries: List[str]) -> np.ndarray:
+        """
+        Embed several queries with one Gemini call.
+        Returns an (N, D) float32 matrix of unit-length rows, in input order.
+        """
+        if not queries:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        normalized = [q.strip().lower() for q in queries]
+        unique = list(dict.fromkeys(normalized))
         result = genai.embed_content(
             model=self.embedding_model,
-            content=query,
+            content=unique,
             task_type="retrieval_query",
         )
-        return result["embedding"]
+        vectors = {q: _unit_vector(emb) for q, emb in zip(unique, result["embedding"])}
+        return np.asarray([vectors[q] for q in normalized], dtype=np.float32)
 
     # -------------------- Search --------------------
 
@@ -70,58 +169,61 @@ class SupabaseRAGEngine:
         Returns:
             List of recipe results with metadata and similarity scores
         """
-        print(f"🔍 Searching Supabase for: '{query}'")
+        logger.debug("🔍 Searching Supabase for: '%s'", query)
 
         # Generate query embedding
         query_embedding = self.embed_query(query)
 
-        # Convert to pgvector format
-        embedding_str = '[' + ','.join(str(x) for x in query_embedding) + ']'
+        cache_scope = f"{top_k}|{min_score}|{self.ef_search}"
+        cached = self._search_cache.get(cache_scope, query, query_embedding)
+        if cached is not None:
+            logger.debug("⚡ Returning %d cached results", len(cached))
+            return cached
 
         # Call Supabase RPC function for vector search
         try:
-            result = self.supabase.rpc(
-                'search_recipes',
-                {
-                    'query_embedding': embedding_str,
-                    'match_threshold': min_score,
-                    'match_count': top_k
-                }
-            ).execute()
+            params = {
+                # Sent as a JSON array; PostgREST hands it to pgvector's
+                # vector input directly, no Python-side string building
+                'query_embedding': query_embedding,
+                'match_threshold': min_score,
+                'match_count': top_k
+            }
+            if self.ef_search is not None:
+                params['ef_search'] = self.ef_search
+
+            result = self.supabase.rpc('search_recipes', params).execute()
 
             if not result.data:
-                print("⚠️ No results from Supabase")
+                logger.debug("⚠️ No results from Supabase")
                 return []
 
             # Format results
-            formatted_results = []
-            for row in result.data:
-                formatted_results.append({
+            formatted_results = [
+                {
                     "id": row['id'],
                     "score": row['similarity'],  # Already 0-1 from Supabase
-                    "metadata": {
-                        "title": row['title'],
-                        "ingredients": row['ingredients'] if isinstance(row['ingredients'], list) else json.loads(row['ingredients']),
-                        "instructions": row['instructions'] if isinstance(row['instructions'], list) else json.loads(row['instructions']),
-                        "url": row.get('source_url'),
-                        "source": row.get('source_name'),
-                        "image_url": row.get('image_url'),
-                        "cuisine": row.get('cuisine'),
-                        "diet_tags": row.get('diet_tags', []),
-                        "facts": row.get('facts', {}),
-                        "prep_time": row.get('prep_time'),
-                        "cook_time": row.get('cook_time'),
-                        "servings": row.get('servings')
-                    }
-                })
-
-            print(f"✅ Found {len(formatted_results)} results from Supabase")
+                    "metadata": self._format_recipe_row(row),
+                }
+                for row in result.data
+            ]
+
+            logger.debug("✅ Found %d results from Supabase", len(formatted_results))
+            self._search_cache.set(cache_scope, query, query_embedding, formatted_results)
             return formatted_results
 
         except Exception as e:
-            print(f"❌ Supabase search error: {e}")
+            logger.error("❌ Supabase search error: %s", e)
             return []
 
+    def set_search_quality(self, ef_search: Optional[int] = None) -> None:
+        """
+        Trade recall for latency on the HNSW index: higher ef_search explores more
+        candidates (better recall, slower). None uses the database default (40).
+        """
+        self.ef_search = ef_search
+        self._search_cache.clear()  # Cached results were ranked with the old setting
+
     def search_chroma(self, query: str, top_k: int = 5, filters: Optional[Dict] = None, min_score: float = 0.35):
         """
         Compatibility wrapper for existing code that calls search_chroma.
@@ -129,37 +231,181 @@ class SupabaseRAGEngine:
         """
         return self.search_recipes(query, top_k, filters, min_score)
 
+    def search_recipes_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        min_score: float = 0.35
+    ) -> List[List[Dict]]:
+        """
+        Search several queries at once: one batched embedding call and one
+        search_recipes_batch RPC. Returns one result list per query, in order.
+        """
+        if not queries:
+            return []
+
+        embeddings = self.embed_queries(queries)
+        params = {
+            'query_embeddings': embeddings.tolist(),
+            'match_threshold': min_score,
+            'match_count': top_k
+        }
+        if self.ef_search is not None:
+            params['ef_search'] = self.ef_search
+
+        batched: List[List[Dict]] = [[] for _ in queries]
+        try:
+            result = self.supabase.rpc('search_recipes_batch', params).execute()
+        except Exception as e:
+            logger.error("❌ Supabase batch search error: %s", e)
+            return batched
+
+        for row in result.data or []:
+            batched[row['query_index'] - 1].append({
+                "id": row['id'],
+                "score": row['similarity'],
+                "metadata": self._format_recipe_row(row),
+            })
+
+        logger.debug("✅ Batch search: %d queries, %d results", len(queries), sum(map(len, batched)))
+        return batched
+
     # -------------------- Recipe Details --------------------
 
+    @staticmethod
+    def _format_recipe_row(row: Dict) -> Dict:
+        """Convert a `recipes` table row into the recipe dict used by the app"""
+        return {
+            "id": row['id'],
+            "title": row['title'],
+            "ingredients": _as_json(row['ingredients']),
+            "instructions": _as_json(row['instructions']),
+            "url": row.get('source_url'),
+            "source": row.get('source_name'),
+            "image_url": row.get('image_url'),
+            "cuisine": row.get('cuisine'),
+            "diet_tags": row.get('diet_tags', []),
+            "facts": row.get('facts', {}),
+            "prep_time": row.get('prep_time'),
+            "cook_time": row.get('cook_time'),
+            "servings": row.get('servings')
+        }
+
     def get_recipe_details(self, recipe_id: str) -> Optional[Dict]:
         """Get full details for a specific recipe"""
+        cached = self._recipe_cache.get(recipe_id)
+        if cached is not None:
+            return cached
+
         try:
             result = self.supabase.table('recipes').select('*').eq('id', recipe_id).execute()
 
             if not result.data:
                 return None
 
-            row = result.data[0]
-            return {
-                "id": row['id'],
-                "title": row['title'],
-                "ingredients": row['ingredients'] if isinstance(row['ingredients'], list) else json.loads(row['ingredients']),
-                "instructions": row['instructions'] if isinstance(row['instructions'], list) else json.loads(row['instructions']),
-                "url": row.get('source_url'),
-                "source": row.get('source_name'),
-                "image_url": row.get('image_url'),
-                "cuisine": row.get('cuisine'),
-                "diet_tags": row.get('diet_tags', []),
-                "facts": row.get('facts', {}),
-                "prep_time": row.get('prep_time'),
-                "cook_time": row.get('cook_time'),
-                "servings": row.get('servings')
-            }
+            recipe = self._format_recipe_row(result.data[0])
+            self._recipe_cache.set(recipe_id, recipe)
+            return recipe
 
         except Exception as e:
-            print(f"❌ Error fetching recipe {recipe_id}: {e}")
+            logger.error("❌ Error fetching recipe %s: %s", recipe_id, e)
             return None
 
+    def get_recipes_bulk(self, recipe_ids: List[str]) -> Dict[str, Dict]:
+        """Fetch several recipes in one round trip; returns {id: recipe}"""
+        if not recipe_ids:
+            return {}
+
+        recipes = {}
+        missing = []
+        for rid in recipe_ids:
+            cached = self._recipe_cache.get(rid)
+            if cached is not None:
+                recipes[rid] = cached
+            else:
+                missing.append(rid)
+
+        if not missing:
+            return recipes
+
+        try:
+            result = self.supabase.table('recipes').select('*').in_('id', missing).execute()
+            for row in result.data or []:
+                recipe = self._format_recipe_row(row)
+                self._recipe_cache.set(row['id'], recipe)
+                recipes[row['id']] = recipe
+            return recipes
+
+        except Exception as e:
+            logger.warning("⚠️ Bulk recipe fetch failed (%s), fetching %d recipes individually", e, len(missing))
+
+        # Fallback: per-id lookups, issued concurrently so N round trips overlap
+        with ThreadPoolExecutor(max_workers=min(RECIPE_FETCH_WORKERS, len(missing))) as pool:
+            for rid, recipe in zip(missing, pool.map(self.get_recipe_details, missing)):
+                if recipe:
+                    recipes[rid] = recipe
+        return recipes
+
+    # -------------------- Rerank --------------------
+
+    def get_recipe_embeddings(self, recipe_ids: List[str]) -> Dict[str, np.ndarray]:
+        """Stored embeddings for several recipes in one round trip; returns {id: float32 vector}"""
+        embeddings = {}
+        missing = []
+        for rid in recipe_ids:
+            cached = self._recipe_embeddings.get(rid)
+            if cached is not None:
+                embeddings[rid] = cached
+            else:
+                missing.append(rid)
+
+        if not missing:
+            return embeddings
+
+        try:
+            result = self.supabase.table('recipe_embeddings').select('recipe_id, embedding').in_('recipe_id', missing).execute()
+            for row in result.data or []:
+                # pgvector comes back over PostgREST as its '[...]' text form
+                vec = np.asarray(_as_json(row['embedding']), dtype=np.float32)
+                self._recipe_embeddings.set(row['recipe_id'], vec)
+                embeddings[row['recipe_id']] = vec
+        except Exception as e:
+            logger.error("❌ Error fetching embeddings %s: %s", missing, e)
+
+        return embeddings
+
+    def rerank(
+        self,
+        query_embedding: Sequence[float],
+        results: List[Dict],
+        weights: Optional[Sequence[float]] = None,
+    ) -> List[Dict]:
+        """
+        Re-score results by exact similarity to the query plus optional per-result
+        weights (e.g. keyword or preference boosts), highest first.
+        Scores every candidate with one matrix-vector product.
+        """
+        if not results:
+            return []
+
+        embeddings = self.get_recipe_embeddings([r['id'] for r in results])
+        ranked = [r for r in results if r['id'] in embeddings]
+        if not ranked:
+            return list(results)
+
+        q = np.asarray(query_embedding, dtype=np.float32)
+        matrix = np.stack([embeddings[r['id']] for r in ranked])
+        scores = (matrix @ q).astype(np.float64)  # Unit vectors: dot product == cosine
+
+        if weights is not None:
+            weight_by_id = {r['id']: w for r, w in zip(results, weights)}
+            scores += np.fromiter((weight_by_id[r['id']] for r in ranked), dtype=np.float64, count=len(ranked))
+
+        order = np.argsort(-scores, kind="stable")
+        reranked = [{**ranked[i], "score": float(scores[i])} for i in order]
+        # Results without a stored embedding keep their order, after the reranked ones
+        return reranked + [r for r in results if r['id'] not in embeddings]
+
     # -------------------- Statistics --------------------
 
     def get_statistics(self) -> Dict:
@@ -186,7 +432,7 @@ class SupabaseRAGEngine:
                 }
 
         except Exception as e:
-            print(f"❌ Error getting statistics: {e}")
+            logger.error("❌ Error getting statistics: %s", e)
             return {
                 "total_recipes": 0,
                 "total_embeddings": 0,
@@ -200,47 +446,64 @@ class SupabaseRAGEngine:
     def get_recipe_context(self, recipe_ids: List[str], detailed: bool = True) -> str:
         """
         Get formatted recipe context for LLM summarization
+        (cached per ordered id list, same lifetime as the recipe cache)
         """
-        context = ""
+        cache_key = f"{int(detailed)}|{'|'.join(recipe_ids)}"
+        cached = self._context_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # One round trip for all recipes, then format in the requested order
+        recipes = self.get_recipes_bulk(recipe_ids)
+        context = self._format_recipes((recipes.get(rid) for rid in recipe_ids), detailed)
+        self._context_cache.set(cache_key, context)
+        return context
 
-        for recipe_id in recipe_ids:
-            recipe = self.get_recipe_details(recipe_id)
+    def build_context_from_results(self, results: List[Dict], detailed: bool = True) -> str:
+        """
+        Format LLM context straight from search_recipes results - the RPC already
+        returns the recipe fields, so no second fetch is needed
+        """
+        return self._format_recipes((r.get("metadata") for r in results), detailed)
 
+    def _format_recipes(self, recipes: Iterable[Optional[Dict]], detailed: bool = True) -> str:
+        """Render recipe dicts into the LLM context template"""
+        parts: List[str] = []
+
+        for recipe in recipes:
             if not recipe:
                 continue
 
-            context += f"\n{'='*50}\n"
-            context += f"Recipe: {recipe.get('title', 'Unknown')}\n"
+            parts.append(f"\n{'='*50}\n")
+            parts.append(f"Recipe: {recipe.get('title', 'Unknown')}\n")
 
             if detailed:
                 # Ingredients
                 ingredients = recipe.get('ingredients', [])
                 if ingredients:
-                    context += "\nIngredients:\n"
-                    for ing in ingredients[:15]:
-                        context += f"- {ing}\n"
+                    parts.append("\nIngredients:\n")
+                    parts.append("".join(f"- {ing}\n" for ing in ingredients[:15]))
 
                 # Instructions
                 instructions = recipe.get('instructions', [])
                 if instructions:
-                    context += "\nInstructions:\n"
-                    for i, step in enumerate(instructions[:10], 1):
-                        context += f"{i}. {step}\n"
+                    parts.append("\nInstructions:\n")
+                    parts.append("".join(f"{i}. {step}\n" for i, step in enumerate(instructions[:10], 1)))
 
                 # Facts
                 if recipe.get('prep_time') or recipe.get('cook_time'):
-                    context += "\nDetails:\n"
+                    parts.append("\nDetails:\n")
                     if recipe.get('prep_time'):
-                        context += f"- Prep Time: {recipe['prep_time']} min\n"
+                        parts.append(f"- Prep Time: {recipe['prep_time']} min\n")
                     if recipe.get('cook_time'):
-                        context += f"- Cook Time: {recipe['cook_time']} min\n"
+                        parts.append(f"- Cook Time: {recipe['cook_time']} min\n")
                     if recipe.get('servings'):
-                        context += f"- Servings: {recipe['servings']}\n"
+                        parts.append(f"- Servings: {recipe['servings']}\n")
 
             if recipe.get('url'):
-                context += f"\nSource: {recipe['url']}\n"
+                parts.append(f"\nSource: {recipe['url']}\n")
 
-        return context
+        return "".join(parts)
 
     # -------------------- Compatibility Methods --------------------
 
@@ -279,10 +542,10 @@ def create_rag_engine():
     Otherwise, fall back to ChromaDB.
     """
     if os.getenv("SUPABASE_URL") and os.getenv("SUPABASE_KEY"):
-        print("🔄 Using Supabase RAG Engine")
+        logger.info("Using Supabase RAG engine")
         return SupabaseRAGEngine()
     else:
-        print("⚠️ SUPABASE_URL not set, falling back to ChromaDB")
+        logger.warning("SUPABASE_URL not set, falling back to ChromaDB")
         # Import and return original ChromaDB engine
         from rag_engine import RecipeRAGEngine
         from chromadb import PersistentClient
@@ -3,12 +3,394 @@ MCP Orchestrator - Coordinates RAG DB and Web Search pipelines
 User Query → MCP Orchestrator → [RAG DB → Gemini LLM] + [Web Search → Gemini LLM] → Combined Output
 """
 
-from typing import Dict, List, Optional
-import asyncio
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+import re
+import string
+import threading
 import time
-import google.generativeai as genai
-from groq import Groq
-from services.recipe_scraper_pipeline import scrape_recipe_via_mcp, scrape_recipes_parallel
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+import numpy as np
+from dotenv import load_dotenv
+import httpx
+from groq import DefaultHttpxClient, Groq
+from services.recipe_scraper_pipeline import (
+    run_scrape,
+    scrape_collections_parallel,
+    scrape_recipe_via_mcp,
+    scrape_recipes_parallel,
+)
+from utils.cache import SimpleCache
+from utils.gemini import configure_gemini, get_generative_model
+
+# Per-query pipeline chatter goes to DEBUG so it costs nothing when disabled
+logger = logging.getLogger("CulinaraAI.orchestrator")
+
+# Once per process, and before the env knobs below are read
+load_dotenv()
+
+# Rough size cap for recipe context sent to the LLM (~4 characters per token);
+# input tokens dominate LLM latency
+LLM_CONTEXT_TOKEN_BUDGET = int(os.getenv("LLM_CONTEXT_TOKEN_BUDGET", "2048"))
+_CHARS_PER_TOKEN = 4
+
+# Speculative web work waits this long for the RAG pipeline first, so fast
+# (cache-warm) database hits never open a web connection
+SPECULATIVE_WEB_DELAY = float(os.getenv("SPECULATIVE_WEB_DELAY", "0.3"))
+
+# LLM provider racing: the primary gets LLM_PRIMARY_TIMEOUT seconds before the
+# next provider is started alongside it; nothing waits past LLM_TOTAL_TIMEOUT
+LLM_PRIMARY_TIMEOUT = float(os.getenv("LLM_PRIMARY_TIMEOUT", "5"))
+LLM_TOTAL_TIMEOUT = float(os.getenv("LLM_TOTAL_TIMEOUT", "20"))
+# Both clocks start once a worker actually runs the call; until then the race
+# re-checks every _LLM_START_POLL seconds
+_LLM_START_POLL = 0.05
+# Workers for provider calls, shared by every request in the process
+LLM_WORKERS = int(os.getenv("LLM_WORKERS", "16"))
+# Workers for speculative web searches / pipelines (one per in-flight query;
+# each may sit out SPECULATIVE_WEB_DELAY first). Page fetches themselves run on
+# the scraper's event loop, bounded by SCRAPE_CONCURRENCY.
+WEB_WORKERS = int(os.getenv("WEB_WORKERS", "8"))
+# Idle Groq connections stay open this long (the SDK default of 5s means most
+# queries pay a fresh TLS handshake)
+LLM_KEEPALIVE_SECONDS = float(os.getenv("LLM_KEEPALIVE_SECONDS", "60"))
+
+# LLM answers are reused for the same prompt and sampling settings (0 disables)
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "3600"))
+
+_GROQ_MODEL = "llama-3.3-70b-versatile"
+
+# Facts request settings, shared by live calls and batch pre-computation
+_FACTS_TEMPERATURE = 0.7
+_FACTS_MAX_TOKENS = 400
+
+# Recipe blocks in formatted context start with a line of '=' characters
+_RECIPE_BLOCK_RE = re.compile(r"(?=\n={40,}\n)")
+
+def _keyword_re(keywords) -> re.Pattern:
+    """
+    One compiled alternation for a keyword list: a single scan of the text
+    instead of one substring scan per keyword. Matches substrings, like the
+    `kw in text` checks it replaces (so "egg" still matches "eggs").
+    """
+    return re.compile("|".join(map(re.escape, keywords)))
+
+# -------------------- Keyword Detectors --------------------
+
+# Main proteins users might specifically request, in priority order
+_SPECIFIC_PROTEINS = ('lamb', 'beef', 'chicken', 'pork', 'fish', 'salmon', 'tuna',
+                      'shrimp', 'prawn', 'lobster', 'crab', 'turkey', 'duck',
+                      'tofu', 'paneer', 'tempeh', 'seitan')
+
+# Other food words that mark a query as a specific dish request
+_SPECIFIC_DISHES = (
+    'paneer', 'chicken', 'tofu', 'salmon', 'lentil', 'pasta',
+    'beef', 'pork', 'shrimp', 'tikka', 'curry', 'biryani',
+    'stir fry', 'salad', 'soup', 'rice', 'noodles',
+    'lobster', 'crab', 'fish', 'tuna', 'cod', 'tilapia',
+    'broccoli', 'spinach', 'kale', 'mushroom', 'potato',
+    'lamb', 'duck', 'turkey', 'egg', 'prawn', 'scallop',
+    'steak', 'burger', 'sandwich', 'wrap', 'bowl',
+    'cake', 'cookie', 'pie', 'bread', 'muffin',
+)
+# One alternation over both lists, longest first, so a query is scanned once
+_FOOD_RE = _keyword_re(sorted(set(_SPECIFIC_PROTEINS) | set(_SPECIFIC_DISHES), key=len, reverse=True))
+
+def _match_foods(query_lower: str) -> Tuple[bool, Optional[str]]:
+    """(mentions a specific dish/food, requested protein by priority) in one scan"""
+    found = set(_FOOD_RE.findall(query_lower))
+    return bool(found), next((p for p in _SPECIFIC_PROTEINS if p in found), None)
+
+_GENERIC_QUERY_RE = _keyword_re([
+    'what should i', 'recommend', 'suggest', 'what can i',
+    'give me', 'show me', 'find me', 'what dishes',
+    'what do you recommend', 'any ideas', 'something',
+])
+
+# Same idea for the web search query builder
+_SPECIFIC_FOOD_RE = _keyword_re([
+    'lobster', 'chicken', 'salmon', 'beef', 'pork', 'lamb', 'fish',
+    'shrimp', 'crab', 'tofu', 'paneer', 'broccoli', 'pasta', 'rice',
+    'curry', 'soup', 'salad', 'steak', 'burger', 'cake', 'bread',
+])
+_GENERIC_INDICATOR_RE = _keyword_re(['what should', 'recommend', 'suggest', 'what can', 'any ideas', 'what dishes'])
+
+# Collection pages among database results
+_RAG_COLLECTION_RE = _keyword_re([
+    'best', 'top', 'ideas', 'collection',
+    'easy recipes', 'batch cooking recipes', 'dinner recipes',
+    'lunch recipes', 'breakfast recipes', 'snack recipes',
+])
+
+# Dietary compatibility
+_NON_VEGAN_RE = _keyword_re([
+    'chicken', 'beef', 'pork', 'fish', 'lamb', 'turkey', 'bacon', 'sausage',
+    'meat', 'egg', 'milk', 'cheese', 'butter', 'cream', 'yogurt', 'honey',
+    'whey', 'gelatin', 'lard',
+])
+_NON_VEGETARIAN_RE = _keyword_re([
+    'chicken', 'beef', 'pork', 'fish', 'lamb', 'turkey', 'bacon',
+    'sausage', 'meat', 'seafood', 'prawn', 'shrimp', 'salmon', 'tuna',
+    'duck', 'venison', 'steak', 'meatball', 'ham',
+])
+_HIGH_CARB_RE = _keyword_re(['rice', 'pasta', 'bread', 'potato', 'noodle', 'flour', 'sugar'])
+_VERY_HIGH_CARB_RE = _keyword_re(['pasta', 'bread', 'noodle', 'flour'])
+_LOW_CARB_TITLE_RE = _keyword_re(['keto', 'low carb', 'cauliflower'])
+_GLUTEN_RE = _keyword_re(['wheat', 'flour', 'pasta', 'bread', 'barley', 'rye', 'noodle'])
+_DAIRY_RE = _keyword_re(['milk', 'cheese', 'butter', 'cream', 'yogurt', 'whey'])
+_NON_PALEO_RE = _keyword_re([
+    'grain', 'rice', 'wheat', 'pasta', 'bread', 'oat', 'bean', 'lentil',
+    'peanut', 'soy', 'tofu', 'dairy', 'milk', 'cheese', 'sugar', 'corn',
+])
+
+# Collection/listicle pages among scraped web results (checked against LOWERCASE titles)
+_WEB_COLLECTION_RE = _keyword_re([
+    'best', 'top', 'ideas', 'collection', 'recipes |',
+    'non-vegetarian recipes', 'vegetarian recipes', 'vegan recipes',
+    'non veg recipes', 'veg recipes', 'easy recipes',
+    '10 best', '14 best', '9 best', '20 best', '40+', '672',  # Number patterns
+    'dinner recipes', 'lunch recipes', 'breakfast recipes',
+    'keto recipes', 'paleo recipes', 'low carb recipes', 'low-carb recipes',
+    'gluten free recipes', 'gluten-free recipes', 'dairy free recipes', 'dairy-free recipes',
+    'free paleo', 'favorite paleo', 'healthy vegan',
+    'mouthwatering', 'crave-worthy', 'add to your', 'weekly menu',
+    # Generic collection endings
+    'recipes for', 'recipe ideas', 'meal ideas', 'dinner ideas',
+    # Catch standalone "X Recipes" patterns
+    'healthy recipes', 'quick recipes', 'simple recipes',
+    # Very short generic titles that are likely categories, not dishes
+    'paneer recipes', 'chicken recipes', 'beef recipes', 'fish recipes',
+    'pasta recipes', 'salad recipes', 'soup recipes', 'curry recipes',
+])
+
+# Listicle title patterns ("56 vegan snacks", "Low-Carb Recipes", "40+ of Our ...")
+_NUMBER_LIST_RE = re.compile(r'\d+\s+(?:vegan|vegetarian|paleo|keto)?\s*(?:snacks|recipes|dishes)')
+_PLURAL_RECIPES_END_RE = re.compile(r'\brecipes\s*$')
+_HYPHENATED_RECIPES_RE = re.compile(r'\w+-\w+\s+recipes\b')
+_NUMBERED_LISTICLE_RE = re.compile(
+    r'\d+[\+]?\s+(?:low carb|keto|paleo|vegan|recipes?|of our|favorite|healthy|easy|best|paneer|chicken)'
+)
+_LEADING_NUMBER_RE = re.compile(r'^\d+[\+]?\s+')
+# After a colon: "Gluten-Free Recipes: Cakes, Cookies, Bread & More" ('and more' contains 'more')
+_LIST_INDICATOR_RE = _keyword_re(['&', 'more'])
+
+def _fuse(*patterns: re.Pattern) -> re.Pattern:
+    """One alternation over several patterns, so a title is scanned once"""
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns))
+
+# Collection titles seen while extracting from a collection page
+_COLLECTION_TITLE_RE = _fuse(_WEB_COLLECTION_RE, _PLURAL_RECIPES_END_RE,
+                             _HYPHENATED_RECIPES_RE, _LEADING_NUMBER_RE)
+# Scraped search results additionally count "40+ of Our ..." style listicles
+_SCRAPED_COLLECTION_RE = _fuse(_COLLECTION_TITLE_RE, _NUMBERED_LISTICLE_RE)
+
+@lru_cache(maxsize=4096)
+def _is_collection_title(title_lower: str) -> bool:
+    """Check if a (lowercased, stripped) title indicates a collection/listicle rather than a single dish"""
+    # Very short titles are likely categories, not dishes
+    if len(title_lower) < 10:
+        return True
+
+    # Keywords, plural "recipes" endings (NOT singular "Recipe" - that's a real dish!),
+    # "X-Y Recipes" and a leading number ("21 Easy Paneer Recipes")
+    if _COLLECTION_TITLE_RE.search(title_lower):
+        return True
+
+    # Contains colon followed by list indicators
+    return ':' in title_lower and bool(_LIST_INDICATOR_RE.search(title_lower))
+
+@lru_cache(maxsize=4096)
+def _is_scraped_collection(title_lower: str) -> bool:
+    """Same idea for scraped search results, which also count "40+ of Our ..." listicles"""
+    if _SCRAPED_COLLECTION_RE.search(title_lower):
+        return True
+    # e.g., "Gluten-Free Recipes: Cakes, Cookies, Bread & More"
+    return ':' in title_lower and bool(_LIST_INDICATOR_RE.search(title_lower))
+
+# Non-recipe pages among scraped results
+_INVALID_TITLE_RE = _keyword_re(['news', 'trends', 'subscribe', 'newsletter', 'sign up',
+                                 'download', 'app', 'contact', 'about', 'privacy'])
+# Counted one by one (how many distinct terms show up), so a tuple, not a regex
+_NON_FOOD_TERMS = ('subscribe', 'newsletter', 'sign up', 'download', 'app',
+                   'social', 'follow', 'facebook', 'instagram', 'twitter',
+                   'email', 'contact', 'privacy', 'terms', 'policy',
+                   'advertisement', 'sponsored', 'affiliate')
+_REAL_FOOD_RE = _keyword_re([
+    'chicken', 'beef', 'pork', 'fish', 'rice', 'pasta',
+    'tomato', 'onion', 'garlic', 'salt', 'pepper', 'oil',
+    'flour', 'sugar', 'butter', 'milk', 'egg', 'cheese',
+    'vegetable', 'fruit', 'herb', 'spice', 'water',
+    'paneer', 'tofu', 'lentil', 'bean', 'chickpea',
+    'potato', 'carrot', 'broccoli', 'spinach', 'kale',
+    'quinoa', 'oat', 'almond', 'cashew', 'coconut',
+])
+
+# -------------------- Preference Search Terms --------------------
+
+def _primary_diet(preferences) -> Optional[str]:
+    """First selected diet, lowercased; None when there isn't one or it's 'No Preference'"""
+    diets = preferences.diets if preferences else None
+    if not diets:
+        return None
+    diet = diets[0].strip().lower()
+    return diet if diet and diet != 'no preference' else None
+
+# Search-friendly wording for generic "what should I cook?" queries
+_SKILL_MODIFIERS = {
+    'Beginner': 'easy quick',
+    'Intermediate': 'homemade',
+    'Advanced': 'gourmet restaurant-style',
+}
+# Instead of hardcoding "chicken", use the dietary term itself for searching
+_DIETARY_SEARCH_TERMS = {
+    'Vegetarian': 'vegetarian dinner',
+    'Vegan': 'vegan meal',
+    'Non-Vegetarian': 'meat dinner',  # More generic than "chicken"
+    'Gluten Free': 'gluten free meal',
+    'Dairy Free': 'dairy free dinner',
+    'Low Carb': 'low carb keto meal',
+    'Paleo': 'paleo whole30',
+    'No Preference': 'dinner',
+}
+_GOAL_MODIFIERS = {
+    'Energy': 'high protein',
+    'Weight Loss': 'healthy low calorie',
+    'Muscle Gain': 'high protein',
+    'General Health': 'nutritious balanced',
+}
+
+_SUMMARY_PROMPT = string.Template("""A user asked: "$query"
+
+        I found recipe information in my $source. Please provide a personalized recommendation for EXACTLY 3 DISHES:
+
+        $context
+
+        CRITICAL INSTRUCTIONS:
+        - Act as a friendly AI chef giving personalized recommendations
+        - Recommend EXACTLY 3 SPECIFIC DISH NAMES from the recipes found
+        - ONLY mention actual dish names (e.g., "Grilled Chicken Tikka", "Palak Paneer", "Chickpea Curry")
+        - DO NOT mention collection pages or listicle titles (DON'T say "9 best recipes")
+        - Briefly explain WHY these 3 dishes match their preferences (diet, skill level, goal)
+        - Format: "Based on your preferences, I recommend: [Dish 1], [Dish 2], and [Dish 3]. [Brief reason]."
+        - Maximum 3 sentences total
+
+        BAD examples (DON'T DO THIS):
+        ❌ "I found 3 delicious paneer recipes for you!"
+        ❌ "Check out these 9 best non vegetarian recipes"
+        ❌ "Here are some vegan options"
+
+        GOOD examples (DO THIS):
+        ✅ "Based on your preferences, I recommend: Palak Paneer, Paneer Butter Masala, and Garlic Paneer. All three are vegetarian, beginner-friendly, and packed with protein!"
+        ✅ "I suggest: Chickpea Buddha Bowl, Mediterranean Quinoa Salad, and Lentil Curry. These vegan dishes are quick to make and perfect for weight loss!"
+        ✅ "Try: Grilled Chicken Tikka, Butter Chicken, and Tandoori Chicken. All are easy to prepare and high in protein for muscle gain!"
+        """)
+
+# Static instructions first, query and context last: the shared prefix is
+# identical across requests, so provider-side prompt caching can reuse it
+_FACTS_PROMPT = string.Template("""Generate exactly ONE fun and surprising "Did you know?" fact about one of the ingredients or dishes in the recipes below. Focus on:
+- Surprising historical facts (e.g., "Did you know that pasta was brought to Italy from China by Marco Polo?")
+- Unusual botanical or biological facts (e.g., "Did you know that broccoli is actually a flower?")
+- Interesting cultural origins (e.g., "Did you know that tofu originated in China over 2,000 years ago?")
+- Mind-blowing food science (e.g., "Did you know that honey is the only food that never expires?")
+- Fun trivia about the ingredients used in these recipes
+
+The fact MUST start with "Did you know that" or "Did you know". Make it fascinating, unexpected, and educational!
+
+Examples:
+- "Did you know that broccoli, cauliflower, cabbage, and Brussels sprouts all come from the same plant species?"
+- "Did you know that cashews grow on the outside of a fruit called a cashew apple?"
+- "Did you know that white chocolate isn't technically chocolate because it contains no cocoa solids?"
+
+Return ONLY the single fact, nothing else. No numbering, no introduction, no conclusion.
+
+The user's query: "$query"
+
+Recipe information:
+
+$context
+""")
+
+# Scraped recipe facts shown under "Quick Facts" in the web context, in order
+_QUICK_FACT_LABELS = (
+    ('prep_time', 'Prep Time'),
+    ('cook_time', 'Cook Time'),
+    ('total_time', 'Total Time'),
+    ('servings', 'Servings'),
+    ('calories', 'Calories'),
+)
+
+# Web context caps: the facts prompt only needs a few ingredients and steps
+# per recipe to pick one to talk about, and every extra line is prefill
+_WEB_SNIPPET_CHARS = 200
+_WEB_MAX_INGREDIENTS = 10
+_WEB_MAX_STEPS = 6
+
+
+# -------------------- RAG Score Boosts --------------------
+
+# Additive score boosts for database candidates (capped at 1.0). Each rule is a
+# per-candidate mask, so scoring is a single masks @ weights product.
+_BOOST_RULES = (
+    ("protein_in_title", 0.30),        # Requested protein named in the title
+    ("protein_in_ingredients", 0.15),  # ...or only in the ingredients
+    ("servings_match", 0.05),          # Matches the requested servings
+    ("skill_keyword", 0.03),           # easy/quick (Beginner) or gourmet/classic (Advanced) title
+    ("skill_steps", 0.02),             # <= 5 steps (Beginner) or > 8 steps (Advanced)
+)
+_BOOST_WEIGHTS = np.array([weight for _, weight in _BOOST_RULES])
+(_PROTEIN_IN_TITLE, _PROTEIN_IN_INGREDIENTS, _SERVINGS_MATCH,
+ _SKILL_KEYWORD, _SKILL_STEPS) = range(len(_BOOST_RULES))
+
+def _contains_any(texts: np.ndarray, words) -> np.ndarray:
+    """Boolean mask of texts containing any of the given substrings"""
+    mask = np.zeros(texts.shape, dtype=bool)
+    for word in words:
+        mask |= np.char.find(texts, word) >= 0
+    return mask
+
+def _trim_context(context: str, max_tokens: int = LLM_CONTEXT_TOKEN_BUDGET) -> str:
+    """
+    Keep context within the token budget by dropping trailing recipes
+    (results are ordered best-first, so the first recipe is always kept whole)
+    """
+    max_chars = max_tokens * _CHARS_PER_TOKEN
+    if len(context) <= max_chars:
+        return context
+
+    blocks = _RECIPE_BLOCK_RE.split(context)
+    kept = [blocks[0]]
+    used = len(blocks[0])
+    for block in blocks[1:]:
+        # Always keep the first recipe block, even if the header used up the budget
+        if used + len(block) > max_chars and len(kept) > 1:
+            break
+        kept.append(block)
+        used += len(block)
+    return "".join(kept)
+
+
+def _facts_prompt(context: str, query: str) -> str:
+    return _FACTS_PROMPT.substitute(query=query, context=_trim_context(context))
+
+def _clean_fact(text: str) -> str:
+    """Strip any numbering or bullet the model put in front of the fact"""
+    return text.lstrip('0123456789.-•) ').strip()
+
+def _llm_cache_key(prompt: str, temperature: float, max_tokens: int) -> str:
+    return f"{hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()}:{temperature}:{max_tokens}"
+
+
+def _preferences_key(preferences) -> Optional[tuple]:
+    """Hashable form of the preferences that shape a query's results"""
+    if not preferences:
+        return None
+    return (tuple(preferences.diets or ()), preferences.skill, preferences.servings,
+            getattr(preferences, 'goal', None))
+
 
 class MCPOrchestrator:
     """Orchestrates RAG DB and Web Search pipelines with Groq/Gemini LLM"""
@@ -26,43 +408,59 @@ class MCPOrchestrator:
         self.groq_client = None
         self.gemini_model = None
 
-        import os
-        from dotenv import load_dotenv
-        load_dotenv()
+        # Runs the web search (or, opt-in, the whole web pipeline) speculatively
+        # while the RAG pipeline is in flight
+        self.speculative_web_search = os.getenv("SPECULATIVE_WEB_SEARCH", "true").lower() == "true"
+        self.speculative_web_pipeline = os.getenv("SPECULATIVE_WEB_PIPELINE", "false").lower() == "true"
+        self._executor = ThreadPoolExecutor(max_workers=WEB_WORKERS, thread_name_prefix="web")
+        # Separate pool so LLM calls made from inside web/RAG tasks can't starve on it
+        self._llm_executor = ThreadPoolExecutor(max_workers=LLM_WORKERS, thread_name_prefix="llm")
+        self._llm_cache = SimpleCache(ttl_seconds=LLM_CACHE_TTL, max_entries=1024)
+        # Identical queries already in flight -> Future of the running pipeline,
+        # so a burst of the same request runs RAG/web/LLM work only once
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
 
         # Initialize Groq (primary LLM - fast and generous free tier)
         groq_api_key = os.getenv("GROQ_API_KEY")
-        print(f"🔑 Groq API Key present: {bool(groq_api_key)}")
+        logger.info("Groq API key present: %s", bool(groq_api_key))
 
         if groq_api_key:
             try:
-                self.groq_client = Groq(api_key=groq_api_key)
-                print(f"✅ Groq client initialized successfully (primary LLM)")
+                self.groq_client = Groq(
+                    api_key=groq_api_key,
+                    timeout=LLM_TOTAL_TIMEOUT,
+                    max_retries=0,  # _llm_call falls back to Gemini instead of retrying
+                    http_client=DefaultHttpxClient(limits=httpx.Limits(
+                        max_connections=100, max_keepalive_connections=20, keepalive_expiry=LLM_KEEPALIVE_SECONDS,
+                    )),
+                )
+                logger.info("Groq client initialized (primary LLM)")
             except Exception as e:
-                print(f"⚠️ Failed to initialize Groq: {e}")
+                logger.warning("Failed to initialize Groq: %s", e)
                 self.groq_client = None
 
         # Initialize Gemini (fallback LLM)
         gemini_api_key = os.getenv("GEMINI_API_KEY")
-        print(f"🔑 Gemini API Key present: {bool(gemini_api_key)}")
+        logger.info("Gemini API key present: %s", bool(gemini_api_key))
 
         if gemini_api_key:
             try:
-                genai.configure(api_key=gemini_api_key)
+                configure_gemini(gemini_api_key)
                 model_name = getattr(self.rag_engine, "generation_model", "gemini-1.5-flash")
-                print(f"🤖 Initializing Gemini model: {model_name} (fallback LLM)")
-                self.gemini_model = genai.GenerativeModel(model_name=model_name)
-                print(f"✅ Gemini model initialized successfully")
+                logger.info("Initializing Gemini model: %s (fallback LLM)", model_name)
+                self.gemini_model = get_generative_model(model_name)
+                logger.info("Gemini model initialized")
             except Exception as e:
-                print(f"⚠️ Failed to initialize Gemini model: {e}")
+                logger.warning("Failed to initialize Gemini model: %s", e)
                 self.gemini_model = None
 
         if not self.groq_client and not self.gemini_model:
-            print("❌ No LLM available - facts generation will fail!")
+            logger.warning("No LLM available - facts generation will fail")
         elif self.groq_client:
-            print("🎯 Using Groq as primary LLM for facts generation")
+            logger.info("Using Groq as primary LLM for facts generation")
         else:
-            print("🎯 Using Gemini as primary LLM for facts generation")
+            logger.info("Using Gemini as primary LLM for facts generation")
 
     def process_query(self, query: str, top_k: int = 10, similarity_threshold: float = 0.35, preferences=None) -> Dict:
         """
@@ -74,40 +472,47 @@ class MCPOrchestrator:
             similarity_threshold: Minimum similarity score (lowered to 0.50 for better recall)
             preferences: Optional user preferences (diets, skill, servings, goal)
         """
-        print(f"\n{'='*60}")
-        print(f"🎯 MCP Orchestrator Processing: '{query}'")
-        if preferences:
-            print(f"👤 User Preferences Applied:")
-            print(f"   • Diets: {preferences.diets}")
-            print(f"   • Skill: {preferences.skill}")
-            print(f"   • Servings: {preferences.servings}")
-            print(f"   • Goal: {preferences.goal}")
-        print(f"{'='*60}\n")
+        key = (query.strip().lower(), top_k, similarity_threshold, _preferences_key(preferences))
+        with self._inflight_lock:
+            running = self._inflight.get(key)
+            if running is None:
+                future = self._inflight[key] = Future()
+        if running is not None:
+            logger.debug("⏳ Joining in-flight query: '%s'", query)
+            return running.result()
+
+        try:
+            result = self._process_query(query, top_k, similarity_threshold, preferences)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _process_query(self, query: str, top_k: int, similarity_threshold: float, preferences) -> Dict:
+        """process_query body, run once per distinct in-flight request"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🎯 MCP Orchestrator Processing: '%s'", query)
+            if preferences:
+                logger.debug(
+                    "👤 User Preferences Applied: diets=%s skill=%s servings=%s goal=%s",
+                    preferences.diets, preferences.skill, preferences.servings, preferences.goal,
+                )
 
         # Step 1: Build search query incorporating ALL 4 preferences
         # Strategy: Always use the user's query as the BASE, enhance with preferences
         
-        # Expanded list of food-related terms to detect specific queries
-        specific_dishes = ['paneer', 'chicken', 'tofu', 'salmon', 'lentil', 'pasta',
-                          'beef', 'pork', 'shrimp', 'tikka', 'curry', 'biryani',
-                          'stir fry', 'salad', 'soup', 'rice', 'noodles',
-                          'lobster', 'crab', 'fish', 'tuna', 'cod', 'tilapia',
-                          'broccoli', 'spinach', 'kale', 'mushroom', 'potato',
-                          'lamb', 'duck', 'turkey', 'egg', 'prawn', 'scallop',
-                          'steak', 'burger', 'sandwich', 'wrap', 'bowl',
-                          'cake', 'cookie', 'pie', 'bread', 'muffin']
-
+        # Detect specific queries (and the requested protein, reused by RAG) in one scan
         query_lower = query.lower()
-        has_specific_dish = any(dish in query_lower for dish in specific_dishes)
+        has_specific_dish, requested_protein = _match_foods(query_lower)
         
         # Check if query seems like a specific recipe request (has food-related words)
         # or a generic preference-based request (like "what should I cook?")
-        generic_query_indicators = [
-            'what should i', 'recommend', 'suggest', 'what can i', 
-            'give me', 'show me', 'find me', 'what dishes',
-            'what do you recommend', 'any ideas', 'something'
-        ]
-        is_generic_query = any(indicator in query_lower for indicator in generic_query_indicators)
+        is_generic_query = bool(_GENERIC_QUERY_RE.search(query_lower))
         
         # If user has a specific query (mentions food items), USE IT as the base
         if has_specific_dish or not is_generic_query:
@@ -120,18 +525,15 @@ class MCPOrchestrator:
             elif preferences and preferences.skill == 'Advanced':
                 search_parts.append('gourmet')
 
-            # Add dietary preference if it adds value
-            if preferences and preferences.diets:
-                dietary = preferences.diets[0]
-                # Only add dietary if it's specific (not generic)
-                if dietary not in ['No Preference']:
-                    # Don't add "non-vegetarian" to a query like "lobster" - it's redundant
-                    if dietary != 'Non-Vegetarian' or not has_specific_dish:
-                        search_parts.append(dietary.lower())
+            # Add dietary preference if it adds value (only if it's specific, not generic)
+            dietary = _primary_diet(preferences)
+            # Don't add "non-vegetarian" to a query like "lobster" - it's redundant
+            if dietary and (dietary != 'non-vegetarian' or not has_specific_dish):
+                search_parts.append(dietary)
 
             # Combine with original query - USER'S QUERY IS PRIMARY
             search_query = f"{' '.join(search_parts)} {query}" if search_parts else query
-            print(f"🔍 Enhanced search query: '{search_query}'")
+            logger.debug("🔍 Enhanced search query: '%s'", search_query)
 
         elif preferences and preferences.diets:
             # Generic query like "what should I cook?" - generate based on preferences
@@ -143,92 +545,103 @@ class MCPOrchestrator:
             search_parts = []
 
             # Add skill level modifier - use more search-friendly terms
-            skill_modifiers = {
-                'Beginner': 'easy quick',
-                'Intermediate': 'homemade',
-                'Advanced': 'gourmet restaurant-style'
-            }
-            search_parts.append(skill_modifiers.get(skill, 'easy'))
+            search_parts.append(_SKILL_MODIFIERS.get(skill, 'easy'))
 
             # Add dietary-appropriate search terms
             # Instead of hardcoding "chicken", use the dietary term itself for searching
-            dietary_search_terms = {
-                'Vegetarian': 'vegetarian dinner',
-                'Vegan': 'vegan meal',
-                'Non-Vegetarian': 'meat dinner',  # More generic than "chicken"
-                'Gluten Free': 'gluten free meal',
-                'Dairy Free': 'dairy free dinner',
-                'Low Carb': 'low carb keto meal',
-                'Paleo': 'paleo whole30',
-                'No Preference': 'dinner'
-            }
-            search_parts.append(dietary_search_terms.get(dietary, 'dinner recipe'))
+            search_parts.append(_DIETARY_SEARCH_TERMS.get(dietary, 'dinner recipe'))
 
             # Add goal modifier if present
-            if goal:
-                goal_modifiers = {
-                    'Energy': 'high protein',
-                    'Weight Loss': 'healthy low calorie',
-                    'Muscle Gain': 'high protein',
-                    'General Health': 'nutritious balanced'
-                }
-                if goal in goal_modifiers:
-                    search_parts.insert(0, goal_modifiers[goal])
+            if goal and goal in _GOAL_MODIFIERS:
+                search_parts.insert(0, _GOAL_MODIFIERS[goal])
 
             search_query = ' '.join(search_parts)
-            print(f"🔍 Generated preference-based query: '{search_query}'")
+            logger.debug("🔍 Generated preference-based query: '%s'", search_query)
 
         else:
             # No preferences - use original query
             search_query = query
-            print(f"🔍 Database search query: '{search_query}'")
+            logger.debug("🔍 Database search query: '%s'", search_query)
+
+        # Speculatively start web work so its latency hides behind the RAG pipeline:
+        # the full web pipeline when opted in, otherwise just its search step.
+        # It only starts if RAG hasn't found recipes within SPECULATIVE_WEB_DELAY;
+        # the RAG pipeline signals that before its (slow) facts LLM call.
+        rag_hit = threading.Event()
+
+        def speculate(fn, *args):
+            if rag_hit.wait(SPECULATIVE_WEB_DELAY):
+                return None  # RAG already answered - don't touch the network
+            return fn(*args)
+
+        web_pipeline_future = None
+        web_search_future = None
+        if self.speculative_web_pipeline:
+            web_pipeline_future = self._executor.submit(speculate, self._process_web_pipeline, query, preferences)
+        elif self.speculative_web_search:
+            web_search_future = self._executor.submit(speculate, self._search_web, query, preferences)
 
         # Step 1: RAG DB - try to find in database first
-        rag_result = self._process_rag_pipeline(search_query, top_k, similarity_threshold, preferences)
+        try:
+            rag_result = self._process_rag_pipeline(search_query, top_k, similarity_threshold, preferences,
+                                                    requested_protein=requested_protein, rag_hit=rag_hit)
+        except BaseException:
+            rag_hit.set()  # Nobody will consume speculative results
+            raise
 
         # Step 2: Web fallback if no DB results
         web_result = None
         if not rag_result["has_results"]:
-            print("\n⚠️ No results in database, falling back to web search...\n")
-            web_result = self._process_web_pipeline(query, preferences)
+            logger.debug("⚠️ No results in database, falling back to web search")
+            if web_pipeline_future is not None:
+                web_result = web_pipeline_future.result()
+            if web_result is None:
+                prefetched_search = None
+                if web_search_future is not None:
+                    try:
+                        prefetched_search = web_search_future.result()
+                    except Exception as e:
+                        logger.warning("Prefetched web search failed: %s", e)
+                web_result = self._process_web_pipeline(query, preferences, prefetched_search=prefetched_search)
         else:
-            print("\n✓ Found results in database, skipping web search")
-            web_result = {"has_results": False, "search_result": None, "summary": None, "source": "Internet"}
+            # Drop speculative work: queued jobs are cancelled, waiting ones return
+            # without a request, one already past the delay finishes in the background
+            for future in (web_pipeline_future, web_search_future):
+                if future is not None:
+                    future.cancel()
+            logger.debug("✓ Found results in database, skipping web search")
 
         # Step 3: Combine
         combined_response = self._combine_results(query, rag_result, web_result)
         return combined_response
 
-    def _process_rag_pipeline(self, query: str, top_k: int, similarity_threshold: float, preferences=None) -> Dict:
-        """Query RAG DB → summarize with LLM"""
-        pipeline_start = time.time()
-        print("📚 RAG DB Pipeline:")
-        print("  → Searching local database...")
+    def _process_rag_pipeline(self, query: str, top_k: int, similarity_threshold: float, preferences=None,
+                              requested_protein: Optional[str] = None,
+                              rag_hit: Optional[threading.Event] = None) -> Dict:
+        """
+        Query RAG DB → summarize with LLM
+        rag_hit, if given, is set as soon as recipes are found (before facts generation)
+        """
+        pipeline_start = time.perf_counter()
+        logger.debug("📚 RAG DB Pipeline: searching local database...")
 
         # Detect if user asked for a SPECIFIC protein/main ingredient FIRST
         # This is critical - if user says "lamb curry", they want LAMB, not prawn!
-        import re
         query_lower = query.lower()
         
-        # List of main proteins/ingredients that users might specifically request
-        specific_proteins = ['lamb', 'beef', 'chicken', 'pork', 'fish', 'salmon', 'tuna', 
-                            'shrimp', 'prawn', 'lobster', 'crab', 'turkey', 'duck',
-                            'tofu', 'paneer', 'tempeh', 'seitan']
-        
-        # Find which specific protein the user asked for
-        requested_protein = None
-        for protein in specific_proteins:
-            if protein in query_lower:
-                requested_protein = protein
-                print(f"  🎯 User specifically requested: {protein.upper()}")
-                break
+        # Find which specific protein the user asked for (list order wins if several),
+        # unless process_query already did while scanning the query
+        if requested_protein is None:
+            requested_protein = _match_foods(query_lower)[1]
+        if requested_protein:
+            logger.debug("  🎯 User specifically requested: %s", requested_protein.upper())
         
         # If user requested a specific protein, get MORE candidates with LOWER threshold
         # This allows us to find recipes that match the protein even if semantic similarity is lower
         if requested_protein:
             # Get more candidates with much lower threshold - we'll filter after boosting
             rag_results = self.rag_engine.search_recipes(query, top_k=top_k * 5, min_score=0.10)
-            print(f"  📊 Expanded search for '{requested_protein}': got {len(rag_results)} candidates")
+            logger.debug("  📊 Expanded search for '%s': got %d candidates", requested_protein, len(rag_results))
         else:
             rag_results = self.rag_engine.search_recipes(query, top_k=top_k)
 
@@ -236,39 +649,38 @@ class MCPOrchestrator:
         rag_facts = []
         rag_has_results = False
         filtered_results = []
+        valid_results = []
         collection_pages = []  # Track collection pages to extract from
 
         if rag_results and len(rag_results) > 0:
-            # Check if we have any results above threshold OR with keyword matches
-            valid_results = []
+            # Drop collection pages and diet mismatches first; scoring is vectorized below
+            candidates = []
+            # Lowercased title / ingredient text per candidate, built once and reused by
+            # the diet filter and the boosts (kept off the result dicts, which go to the API)
+            candidate_titles: List[str] = []
+            candidate_ingredients: List[str] = []
             for result in rag_results:
-                score = result.get('score', 0.0)
-                has_keyword = result.get('keyword_match', False)
-                title = result.get('metadata', {}).get('title', '')
+                metadata = result.get('metadata') or {}
+                title = metadata.get('title') or ''
+                title_lower = title.lower()
 
                 # Detect collection pages - DON'T filter them out, scrape them for individual recipes!
-                import re
 
                 # Check if title has number + recipes/snacks/dishes (e.g., "56 vegan snacks")
-                has_number_list = bool(re.search(r'\d+\s+(vegan|vegetarian|paleo|keto)?\s*(snacks|recipes|dishes)', title.lower()))
+                has_number_list = bool(_NUMBER_LIST_RE.search(title_lower))
 
                 # Check if title ends with " recipes" (e.g., "Easy vegetarian recipes", "Dinner recipes")
                 # But NOT single-dish recipes like "Chicken curry recipe"
-                title_lower = title.lower()
                 ends_with_recipes = title_lower.endswith(' recipes') or title_lower.endswith('recipes |')
 
-                collection_keywords = ['best', 'top', 'ideas', 'collection',
-                                      'easy recipes', 'batch cooking recipes', 'dinner recipes',
-                                      'lunch recipes', 'breakfast recipes', 'snack recipes']
-
-                is_collection = any(keyword in title_lower for keyword in collection_keywords) or has_number_list or ends_with_recipes
+                is_collection = bool(_RAG_COLLECTION_RE.search(title_lower)) or has_number_list or ends_with_recipes
 
                 if is_collection:
                     # Collection page found - we'll scrape it for individual recipes
-                    print(f"  📚 Collection page found: {title[:60]}")
-                    collection_url = result.get('metadata', {}).get('url', '')
+                    logger.debug("  📚 Collection page found: %s", title[:60])
+                    collection_url = metadata.get('url', '')
                     if collection_url:
-                        print(f"     URL: {collection_url[:70]}")
+                        logger.debug("     URL: %s", collection_url[:70])
                         collection_pages.append({
                             'title': title,
                             'url': collection_url,
@@ -276,159 +688,122 @@ class MCPOrchestrator:
                         })
                     continue
 
+                ingredients_lower = ' '.join(metadata.get('ingredients') or ()).lower()
+
                 # Apply dietary preference filtering
                 if preferences and preferences.diets:
-                    recipe_title = title.lower()
-                    recipe_ingredients = ' '.join(result.get('metadata', {}).get('ingredients', [])).lower()
-
                     # Check if recipe matches dietary preferences
-                    dietary_match = self._check_dietary_compatibility(
-                        recipe_title,
-                        recipe_ingredients,
+                    dietary_match = self._diet_allows(
+                        title_lower,
+                        f"{title_lower}\n{ingredients_lower}",
                         preferences.diets
                     )
 
                     if not dietary_match:
-                        print(f"  ⚬ Filtered (diet): {title[:50]} (not {', '.join(preferences.diets).lower()})")
+                        logger.debug("  ⚬ Filtered (diet): %s (not %s)", title[:50], ', '.join(preferences.diets).lower())
                         continue
 
-                # Apply servings filtering (if specified)
-                if preferences and preferences.servings:
-                    recipe_metadata = result.get('metadata', {})
-                    recipe_servings_text = str(recipe_metadata.get('facts', {}).get('servings', ''))
-                    recipe_title_lower = title.lower()
-
-                    # Check if recipe is for the requested servings
-                    # Look for servings in metadata or title (e.g., "for two", "serves 2")
-                    if preferences.servings == 2:
-                        # Looking for 2 servings
-                        matches_servings = (
-                            'for two' in recipe_title_lower or
-                            'for 2' in recipe_title_lower or
-                            '2' in recipe_servings_text or
-                            'two' in recipe_servings_text
-                        )
-                        # Boost score if it matches servings perfectly
-                        if matches_servings:
-                            score = min(1.0, score + 0.05)  # 5% boost for matching servings
-                    elif preferences.servings == 4:
-                        matches_servings = (
-                            '4' in recipe_servings_text or
-                            'four' in recipe_servings_text or
-                            '3-4' in recipe_servings_text or
-                            '4-6' in recipe_servings_text
-                        )
-                        if matches_servings:
-                            score = min(1.0, score + 0.05)
-
-                # Apply skill level boost (don't filter, just boost scores)
-                if preferences and preferences.skill:
-                    recipe_title_lower = title.lower()
-                    recipe_instructions = result.get('metadata', {}).get('instructions', [])
-                    num_steps = len(recipe_instructions) if isinstance(recipe_instructions, list) else 0
-
-                    if preferences.skill == 'Beginner':
-                        # Boost easy/quick/simple recipes
-                        if any(word in recipe_title_lower for word in ['easy', 'simple', 'quick', 'minute']):
-                            score = min(1.0, score + 0.03)
-                        # Boost recipes with fewer steps
-                        if num_steps > 0 and num_steps <= 5:
-                            score = min(1.0, score + 0.02)
-                    elif preferences.skill == 'Advanced':
-                        # Boost complex recipes
-                        if any(word in recipe_title_lower for word in ['gourmet', 'classic', 'traditional']):
-                            score = min(1.0, score + 0.03)
-                        # Boost recipes with more steps
-                        if num_steps > 8:
-                            score = min(1.0, score + 0.02)
-
-                # CRITICAL: Apply MAJOR boost for recipes matching user's specific protein request
-                # If user asked for "lamb curry", a lamb recipe should rank much higher than prawn!
-                if requested_protein:
-                    recipe_title_lower = title.lower()
-                    recipe_ingredients = ' '.join(result.get('metadata', {}).get('ingredients', [])).lower()
-                    
-                    # Check if recipe contains the requested protein
-                    protein_in_title = requested_protein in recipe_title_lower
-                    protein_in_ingredients = requested_protein in recipe_ingredients
-                    
-                    if protein_in_title:
-                        # Major boost if protein is in title (most relevant)
-                        score = min(1.0, score + 0.30)
-                        print(f"    🎯 +30% boost: '{title[:40]}' has {requested_protein} in title")
-                    elif protein_in_ingredients:
-                        # Moderate boost if protein is in ingredients
-                        score = min(1.0, score + 0.15)
-                        print(f"    🎯 +15% boost: '{title[:40]}' has {requested_protein} in ingredients")
-
-                # Update the score in the result after all boosts
+                candidates.append(result)
+                candidate_titles.append(title_lower)
+                candidate_ingredients.append(ingredients_lower)
+
+            # Score boosts run over all surviving candidates at once
+            titles = np.array(candidate_titles, dtype=str)
+            ingredients = np.array(candidate_ingredients, dtype=str)
+            scores = np.array([r.get('score', 0.0) for r in candidates], dtype=np.float64)
+
+            # All boosts as one (candidates x rules) mask matrix times the rule weights
+            boost_masks = self._boost_masks(candidates, titles, ingredients, preferences, requested_protein)
+            scores += boost_masks @ _BOOST_WEIGHTS
+
+            if requested_protein:
+                has_protein = boost_masks[:, _PROTEIN_IN_TITLE] | boost_masks[:, _PROTEIN_IN_INGREDIENTS]
+            else:
+                has_protein = np.ones(len(candidates), dtype=bool)
+
+            # Boosts only add, so capping once equals capping after every boost
+            scores = np.minimum(scores, 1.0)
+            for result, score in zip(candidates, scores.tolist()):
                 result['score'] = score
 
-                # Accept only if score meets high threshold for reliable results
-                if score >= similarity_threshold:
-                    valid_results.append(result)
-                    print(f"  ✓ Accepted: {result.get('metadata', {}).get('title', 'Recipe')[:50]} (score: {score:.3f}, keyword: {has_keyword})")
-                else:
-                    print(f"  ✗ Rejected: {result.get('metadata', {}).get('title', 'Recipe')[:50]} (score: {score:.3f}, keyword: {has_keyword})")
+            # Accept only if score meets high threshold for reliable results
+            accepted = np.flatnonzero(scores >= similarity_threshold)
+            if logger.isEnabledFor(logging.DEBUG):
+                for result, score in zip(candidates, scores):
+                    # Only the Chroma engine computes keyword matches; it's informational, never a gate
+                    logger.debug(
+                        "  %s %s (score: %.3f, keyword: %s)",
+                        "✓ Accepted:" if score >= similarity_threshold else "✗ Rejected:",
+                        result.get('metadata', {}).get('title', '')[:50] or "Recipe", score,
+                        result.get('keyword_match', 'n/a'),
+                    )
+
+            # Sort accepted results by boosted score (stable, so ties keep search order)
+            order = accepted[np.argsort(-scores[accepted], kind="stable")]
+            valid_results = [candidates[i] for i in order]
 
-            # Re-sort valid_results by score after all boosts have been applied
-            if valid_results:
-                valid_results.sort(key=lambda x: x.get('score', 0), reverse=True)
-                
             if valid_results:
                 # If user requested a specific protein, check if ANY result contains it
                 # If not, we should fall back to web search
-                found_requested_protein = False
                 if requested_protein:
-                    for result in valid_results:
-                        result_title = result.get('metadata', {}).get('title', '').lower()
-                        result_ingredients = ' '.join(result.get('metadata', {}).get('ingredients', [])).lower()
-                        if requested_protein in result_title or requested_protein in result_ingredients:
-                            found_requested_protein = True
-                            break
-                    
+                    found_requested_protein = bool(has_protein[order].any())
+
                     if not found_requested_protein:
-                        print(f"\n  ⚠️ No recipes found with {requested_protein.upper()} - will try web search")
+                        logger.debug("  ⚠️ No recipes found with %s - will try web search", requested_protein.upper())
                         rag_has_results = False
                         filtered_results = []
                     else:
                         rag_has_results = True
                         # Limit to exactly 3 recipes
                         filtered_results = valid_results[:3]
-                        print(f"\n  ✓ Found {len(valid_results)} relevant recipes (including {requested_protein}), limited to {len(filtered_results)}")
+                        logger.debug("  ✓ Found %d relevant recipes (including %s), limited to %d", len(valid_results), requested_protein, len(filtered_results))
                 else:
                     rag_has_results = True
                     # Limit to exactly 3 recipes
                     filtered_results = valid_results[:3]
-                    print(f"\n  ✓ Found {len(valid_results)} relevant recipes, limited to {len(filtered_results)}")
+                    logger.debug("  ✓ Found %d relevant recipes, limited to %d", len(valid_results), len(filtered_results))
 
                 # Skip AI summary - just return recipes directly
                 rag_summary = ""  # No AI text, just show recipe cards
 
-                recipe_ids = [r['id'] for r in filtered_results]
-                recipe_context = self.rag_engine.get_recipe_context(recipe_ids, detailed=True)
-
-                print("  → Generating culinary facts...")
-                try:
-                    rag_facts = self._generate_facts(recipe_context, query)
-                    print(f"  ✓ Generated {len(rag_facts)} facts")
-                except Exception as e:
-                    print(f"  ⚠️ Failed to generate facts: {e}")
-                    rag_facts = []
-                print("  ✓ RAG DB processing complete")
+                # Nothing to describe when the requested protein is missing - the web
+                # fallback generates its own facts, so don't queue an LLM call ahead of it
+                if filtered_results:
+                    if rag_hit is not None:
+                        rag_hit.set()  # Speculative web work is no longer needed
+
+                    # Search results already carry the recipe fields - format them directly
+                    # instead of fetching every recipe again by id
+                    build_context = getattr(self.rag_engine, "build_context_from_results", None)
+                    if build_context is not None:
+                        recipe_context = build_context(filtered_results, detailed=True)
+                    else:
+                        recipe_ids = [r['id'] for r in filtered_results]
+                        recipe_context = self.rag_engine.get_recipe_context(recipe_ids, detailed=True)
+
+                    logger.debug("  → Generating culinary facts...")
+                    try:
+                        rag_facts = self._generate_facts(recipe_context, query)
+                        logger.debug("  ✓ Generated %d facts", len(rag_facts))
+                    except Exception as e:
+                        logger.warning("Failed to generate facts: %s", e)
+                        rag_facts = []
             else:
-                print(f"  ⚠️ No results met criteria (threshold: {similarity_threshold})")
+                logger.debug("  ⚠️ No results met criteria (threshold: %s)", similarity_threshold)
         else:
-            print("  ⚠️ No results found in local database")
+            logger.debug("  ⚠️ No results found in local database")
 
         # If we only found collection pages in database, mark as no results to trigger web search
         if collection_pages and not filtered_results:
-            print(f"\n  → Found {len(collection_pages)} collection pages in database (not individual recipes)")
-            print(f"  → Database has no individual recipes - will fall back to web search")
+            logger.debug("  → Found %d collection pages in database (no individual recipes)", len(collection_pages))
             rag_has_results = False
 
-        pipeline_time = time.time() - pipeline_start
-        print(f"  ⏱️  RAG pipeline took {pipeline_time:.2f}s")
+        # One line per query instead of a line per step
+        logger.info(
+            "RAG: %d/%d accepted, %d kept, protein=%s, collections=%d, time=%.2fs",
+            len(valid_results), len(rag_results or []), len(filtered_results),
+            requested_protein, len(collection_pages), time.perf_counter() - pipeline_start,
+        )
 
         return {
             "has_results": rag_has_results,
@@ -438,104 +813,136 @@ class MCPOrchestrator:
             "source": "RAG Database"
         }
 
+    def _boost_masks(self, candidates: List[Dict], titles: np.ndarray, ingredients: np.ndarray,
+                     preferences=None, requested_protein: Optional[str] = None) -> np.ndarray:
+        """Boolean (candidates x _BOOST_RULES) matrix: which boost rules each candidate earns"""
+        masks = np.zeros((len(candidates), len(_BOOST_RULES)), dtype=bool)
+
+        # CRITICAL: MAJOR boost for recipes matching user's specific protein request
+        # If user asked for "lamb curry", a lamb recipe should rank much higher than prawn!
+        if requested_protein:
+            in_title = np.char.find(titles, requested_protein) >= 0
+            masks[:, _PROTEIN_IN_TITLE] = in_title
+            masks[:, _PROTEIN_IN_INGREDIENTS] = (np.char.find(ingredients, requested_protein) >= 0) & ~in_title
+
+        # Servings (if specified)
+        if preferences and preferences.servings in (2, 4):
+            servings_text = np.array(
+                [str(r.get('metadata', {}).get('facts', {}).get('servings', '')) for r in candidates], dtype=str
+            )
+            if preferences.servings == 2:
+                # Look for servings in metadata or title (e.g., "for two", "serves 2")
+                masks[:, _SERVINGS_MATCH] = (
+                    _contains_any(titles, ('for two', 'for 2')) | _contains_any(servings_text, ('2', 'two'))
+                )
+            else:
+                masks[:, _SERVINGS_MATCH] = _contains_any(servings_text, ('4', 'four', '3-4', '4-6'))
+
+        # Skill level (don't filter, just boost scores)
+        if preferences and preferences.skill in ('Beginner', 'Advanced'):
+            num_steps = np.array([
+                len(steps) if isinstance(steps, list) else 0
+                for steps in (r.get('metadata', {}).get('instructions', []) for r in candidates)
+            ], dtype=np.int64)
+
+            if preferences.skill == 'Beginner':
+                # Easy/quick/simple recipes and recipes with fewer steps
+                masks[:, _SKILL_KEYWORD] = _contains_any(titles, ('easy', 'simple', 'quick', 'minute'))
+                masks[:, _SKILL_STEPS] = (num_steps > 0) & (num_steps <= 5)
+            else:
+                # Complex recipes and recipes with more steps
+                masks[:, _SKILL_KEYWORD] = _contains_any(titles, ('gourmet', 'classic', 'traditional'))
+                masks[:, _SKILL_STEPS] = num_steps > 8
+
+        return masks
+
     def _check_dietary_compatibility(self, title: str, ingredients: str, diet_preferences: List[str]) -> bool:
         """Check if a recipe matches dietary preferences"""
-        # Common non-vegan/non-vegetarian ingredients
-        non_vegan_ingredients = ['chicken', 'beef', 'pork', 'fish', 'lamb', 'turkey', 'bacon', 'sausage',
-                                 'meat', 'egg', 'milk', 'cheese', 'butter', 'cream', 'yogurt', 'honey',
-                                 'whey', 'gelatin', 'lard']
-        non_vegetarian_ingredients = ['chicken', 'beef', 'pork', 'fish', 'lamb', 'turkey', 'bacon',
-                                      'sausage', 'meat', 'seafood', 'prawn', 'shrimp', 'salmon', 'tuna',
-                                      'duck', 'venison', 'steak', 'meatball', 'ham']
+        title = title.lower()
+        return self._diet_allows(title, f"{title}\n{ingredients.lower()}", diet_preferences)
 
-        # Check if user has both non-vegetarian and low-carb preferences
-        has_non_veg = any(d.lower() in ['non-vegetarian', 'non vegetarian'] for d in diet_preferences)
-        has_low_carb = any(d.lower() in ['keto', 'low carb'] for d in diet_preferences)
+    def _diet_allows(self, title: str, text: str, diet_preferences: List[str]) -> bool:
+        """
+        _check_dietary_compatibility over precomputed lowercase strings:
+        text is title + ingredients, scanned as one string, and each ingredient
+        detector (module-level _*_RE) runs at most once per recipe
+        """
+        found: Dict[re.Pattern, bool] = {}
 
-        # Check if recipe has meat (for combined preference handling)
-        has_meat = any(ingredient in ingredients.lower() or ingredient in title.lower()
-                      for ingredient in non_vegetarian_ingredients)
+        def contains(pattern: re.Pattern) -> bool:
+            if pattern not in found:
+                found[pattern] = pattern.search(text) is not None
+            return found[pattern]
 
-        # Check each dietary preference
-        for diet in diet_preferences:
-            diet_lower = diet.lower()
+        # Check if user has both non-vegetarian and low-carb preferences
+        diets = [d.lower() for d in diet_preferences]
+        has_non_veg = any(d in ('non-vegetarian', 'non vegetarian') for d in diets)
+        has_low_carb = any(d in ('keto', 'low carb') for d in diets)
 
+        # Check each dietary preference
+        for diet_lower in diets:
             if diet_lower == 'vegan':
                 # For vegan, check if recipe contains any non-vegan ingredients
-                for ingredient in non_vegan_ingredients:
-                    if ingredient in ingredients or ingredient in title:
-                        return False
+                if contains(_NON_VEGAN_RE):
+                    return False
 
             elif diet_lower == 'vegetarian':
                 # For vegetarian, check if recipe contains meat/fish
-                for ingredient in non_vegetarian_ingredients:
-                    if ingredient in ingredients or ingredient in title:
-                        return False
+                if contains(_NON_VEGETARIAN_RE):
+                    return False
 
             elif diet_lower == 'non-vegetarian' or diet_lower == 'non vegetarian':
                 # For non-vegetarian, recipe MUST contain meat/fish
-                if not has_meat:
+                if not contains(_NON_VEGETARIAN_RE):
                     return False  # Reject if no meat found
 
-            elif diet_lower in ['keto', 'low carb']:
+            elif diet_lower in ('keto', 'low carb'):
                 # Keto/low carb - avoid high-carb ingredients
                 # IMPORTANT: If user also selected Non-Vegetarian, be lenient on carbs
                 # Many meat dishes come with rice/pasta, and user wants meat primarily
-                high_carb = ['rice', 'pasta', 'bread', 'potato', 'noodle', 'flour', 'sugar']
-                has_high_carb = any(carb in ingredients or carb in title for carb in high_carb)
-
-                # If user wants both non-veg AND low-carb, only reject very high-carb dishes without meat
                 if has_non_veg and has_low_carb:
                     # For combined preference: allow meat dishes even with some carbs
-                    # Only reject if it's very high-carb (pasta/bread/noodles) AND explicitly vegetarian/vegan
-                    very_high_carb = ['pasta', 'bread', 'noodle', 'flour']
-                    is_very_high_carb = any(carb in ingredients.lower() or carb in title.lower() for carb in very_high_carb)
-                    if is_very_high_carb and not has_meat:
-                        if not any(kw in title.lower() for kw in ['keto', 'low carb', 'cauliflower']):
+                    # Only reject if it's very high-carb (pasta/bread/noodles) AND has no meat
+                    if contains(_VERY_HIGH_CARB_RE) and not contains(_NON_VEGETARIAN_RE):
+                        if not _LOW_CARB_TITLE_RE.search(title):
                             return False
                 else:
                     # Standard low-carb check (when NOT combined with non-veg)
-                    if has_high_carb and not any(kw in title for kw in ['keto', 'low carb', 'cauliflower']):
+                    if contains(_HIGH_CARB_RE) and not _LOW_CARB_TITLE_RE.search(title):
                         return False
 
             elif diet_lower == 'gluten free':
                 # Gluten free - avoid wheat, barley, rye
-                gluten_ingredients = ['wheat', 'flour', 'pasta', 'bread', 'barley', 'rye', 'noodle']
                 # Allow if explicitly says gluten-free
-                if any(g in ingredients for g in gluten_ingredients):
-                    if 'gluten free' not in title and 'gluten-free' not in ingredients:
+                if contains(_GLUTEN_RE):
+                    if 'gluten free' not in text and 'gluten-free' not in text:
                         return False
 
             elif diet_lower == 'dairy free':
                 # Dairy free
-                dairy = ['milk', 'cheese', 'butter', 'cream', 'yogurt', 'whey']
-                if any(d in ingredients for d in dairy):
-                    if 'dairy free' not in title and 'dairy-free' not in ingredients:
+                if contains(_DAIRY_RE):
+                    if 'dairy free' not in text and 'dairy-free' not in text:
                         return False
 
             elif diet_lower == 'paleo':
                 # Paleo - avoid grains, legumes, dairy, refined sugar
-                non_paleo = ['grain', 'rice', 'wheat', 'pasta', 'bread', 'oat', 'bean', 'lentil',
-                            'peanut', 'soy', 'tofu', 'dairy', 'milk', 'cheese', 'sugar', 'corn']
                 # Allow if explicitly says paleo
-                has_non_paleo = any(item in ingredients.lower() or item in title.lower() for item in non_paleo)
-                if has_non_paleo and 'paleo' not in title.lower():
+                if contains(_NON_PALEO_RE) and 'paleo' not in title:
                     return False
 
         return True
 
-    def _is_valid_recipe(self, recipe: Dict) -> bool:
+    def _is_valid_recipe(self, recipe: Dict, title_lower: Optional[str] = None) -> bool:
         """
         Validate that a scraped result is actually a recipe with real food content.
         Filters out navigation pages, news articles, and other non-recipe content.
+        Pass title_lower when the caller has already lowercased the title.
         """
-        title = recipe.get('title', '').lower()
+        title = title_lower if title_lower is not None else recipe.get('title', '').lower()
         ingredients = recipe.get('ingredients', [])
 
         # Check for non-recipe indicators in title
-        invalid_titles = ['news', 'trends', 'subscribe', 'newsletter', 'sign up',
-                         'download', 'app', 'contact', 'about', 'privacy']
-        if any(invalid in title for invalid in invalid_titles):
+        if _INVALID_TITLE_RE.search(title):
             return False
 
         # Must have ingredients
@@ -543,38 +950,30 @@ class MCPOrchestrator:
             return False
 
         # Check if ingredients look like real food
-        # Non-food "ingredients" that indicate this isn't a recipe
-        non_food_terms = ['subscribe', 'newsletter', 'sign up', 'download', 'app',
-                         'social', 'follow', 'facebook', 'instagram', 'twitter',
-                         'email', 'contact', 'privacy', 'terms', 'policy',
-                         'advertisement', 'sponsored', 'affiliate']
-
         ingredients_text = ' '.join(ingredients).lower()
 
         # If more than 30% of ingredients contain non-food terms, reject
-        non_food_count = sum(1 for term in non_food_terms if term in ingredients_text)
+        non_food_count = sum(1 for term in _NON_FOOD_TERMS if term in ingredients_text)
         if non_food_count > len(ingredients) * 0.3:
             return False
 
         # Check for at least some real food ingredients
-        real_food_indicators = ['chicken', 'beef', 'pork', 'fish', 'rice', 'pasta',
-                               'tomato', 'onion', 'garlic', 'salt', 'pepper', 'oil',
-                               'flour', 'sugar', 'butter', 'milk', 'egg', 'cheese',
-                               'vegetable', 'fruit', 'herb', 'spice', 'water',
-                               'paneer', 'tofu', 'lentil', 'bean', 'chickpea',
-                               'potato', 'carrot', 'broccoli', 'spinach', 'kale',
-                               'quinoa', 'oat', 'almond', 'cashew', 'coconut']
-
-        has_real_food = any(food in ingredients_text for food in real_food_indicators)
+        has_real_food = bool(_REAL_FOOD_RE.search(ingredients_text))
 
         return has_real_food
 
-    def _process_web_pipeline(self, query: str, preferences=None) -> Dict:
-        """Query web → scrape URLs via MCP → summarize with LLM"""
-        pipeline_start = time.time()
-        print("\n🌐 Web Search Pipeline:")
-        print("  → Searching internet...")
+    def _search_web(self, query: str, preferences=None) -> Dict:
+        """Run the DuckDuckGo search step of the web pipeline"""
+        search_query = self._build_web_search_query(query, preferences)
 
+        search_start = time.perf_counter()
+        web_search_result = self.mcp_tools.search_recipe_web(query=search_query, max_results=5)
+        search_time = time.perf_counter() - search_start
+        logger.debug("  ⏱️  DuckDuckGo search took %.2fs", search_time)
+        return web_search_result
+
+    def _build_web_search_query(self, query: str, preferences=None) -> str:
+        """Build the web search query from the user's query and preferences"""
         # Build search query: ALWAYS include user's query, enhance with preferences
         query_lower = query.lower()
         
@@ -582,14 +981,10 @@ class MCPOrchestrator:
         has_recipe_word = 'recipe' in query_lower
         
         # Check if user's query mentions specific foods (not just generic preference requests)
-        specific_food_terms = ['lobster', 'chicken', 'salmon', 'beef', 'pork', 'lamb', 'fish',
-                               'shrimp', 'crab', 'tofu', 'paneer', 'broccoli', 'pasta', 'rice',
-                               'curry', 'soup', 'salad', 'steak', 'burger', 'cake', 'bread']
-        has_specific_food = any(term in query_lower for term in specific_food_terms)
+        has_specific_food = bool(_SPECIFIC_FOOD_RE.search(query_lower))
         
         # Generic queries that indicate user wants preferences-based suggestions
-        generic_indicators = ['what should', 'recommend', 'suggest', 'what can', 'any ideas', 'what dishes']
-        is_generic_query = any(indicator in query_lower for indicator in generic_indicators)
+        is_generic_query = bool(_GENERIC_INDICATOR_RE.search(query_lower))
         
         if has_specific_food or not is_generic_query:
             # User has a specific query - USE IT, optionally enhance with preferences
@@ -599,28 +994,38 @@ class MCPOrchestrator:
                 search_query = f"{query} recipe"
             
             # Add dietary modifier only if it adds value and isn't redundant
-            if preferences and preferences.diets and preferences.diets[0] not in ['No Preference']:
-                dietary = preferences.diets[0].lower()
+            dietary = _primary_diet(preferences)
+            if dietary:
                 # Don't add "non-vegetarian" to queries with specific meats - redundant
                 if dietary == 'non-vegetarian' and has_specific_food:
                     pass  # Skip, it's redundant
                 elif dietary not in search_query.lower():
                     search_query = f"{dietary} {search_query}"
             
-            print(f"  → Searching for: '{search_query}'")
+            logger.debug("  → Searching for: '%s'", search_query)
         else:
             # Generic query - generate based on preferences
-            if preferences and preferences.diets and preferences.diets[0] not in ['No Preference']:
-                primary_diet = preferences.diets[0].lower()
+            primary_diet = _primary_diet(preferences)
+            if primary_diet:
                 search_query = f'{primary_diet} recipe'
             else:
                 search_query = f"{query} recipe"
-            print(f"  → Searching for: '{search_query}'")
+            logger.debug("  → Searching for: '%s'", search_query)
 
-        search_start = time.time()
-        web_search_result = self.mcp_tools.search_recipe_web(query=search_query, max_results=5)
-        search_time = time.time() - search_start
-        print(f"  ⏱️  DuckDuckGo search took {search_time:.2f}s")
+        return search_query
+
+    def _process_web_pipeline(self, query: str, preferences=None, prefetched_search: Optional[Dict] = None) -> Dict:
+        """Query web → scrape URLs via MCP → summarize with LLM"""
+        pipeline_start = time.perf_counter()
+        logger.debug("🌐 Web Search Pipeline:")
+
+        if prefetched_search is not None:
+            # Search already ran speculatively alongside the RAG pipeline
+            logger.debug("  → Using prefetched web search results")
+            web_search_result = prefetched_search
+        else:
+            logger.debug("  → Searching internet...")
+            web_search_result = self._search_web(query, preferences)
 
         web_summary = None
         web_facts = []
@@ -631,254 +1036,186 @@ class MCPOrchestrator:
         if web_search_result.get("success") and web_search_result.get("results"):
             web_has_results = True
             results = web_search_result["results"]
-            print(f"  ✓ Found {len(results)} recipe sources online")
+            logger.debug("  ✓ Found %d recipe sources online", len(results))
 
             # Scrape recipe details for each URL IN PARALLEL for faster performance
-            urls_to_scrape = [r.get("url") for r in results[:5] if r.get("url")]
+            # (search mirrors can return the same page twice)
+            urls_to_scrape = list(dict.fromkeys(r.get("url") for r in results[:5] if r.get("url")))
 
-            print(f"  → Scraping {len(urls_to_scrape)} recipes in parallel...")
-            scrape_start = time.time()
+            logger.debug("  → Scraping %d recipes in parallel...", len(urls_to_scrape))
+            scrape_start = time.perf_counter()
             try:
-                # Use asyncio.run to execute parallel scraping
-                scraped_recipes = asyncio.run(scrape_recipes_parallel(urls_to_scrape))
-                scrape_time = time.time() - scrape_start
-                print(f"  ⏱️  Parallel scraping took {scrape_time:.2f}s")
+                # Runs on the scraper's long-lived loop, reusing its warm browser
+                scraped_recipes = run_scrape(scrape_recipes_parallel(urls_to_scrape))
+                scrape_time = time.perf_counter() - scrape_start
+                logger.debug("  ⏱️  Parallel scraping took %.2fs", scrape_time)
 
                 # Filter out failed recipes
                 valid_recipes = []
                 for idx, recipe_data in enumerate(scraped_recipes, 1):
                     if recipe_data and recipe_data.get("title") != "Could not fetch recipe":
                         valid_recipes.append(recipe_data)
-                        print(f"  [{idx}] ✓ Success: {recipe_data.get('title', 'Unknown')[:50]}")
+                        logger.debug("  [%d] ✓ Success: %s", idx, recipe_data.get('title', 'Unknown')[:50])
                     else:
-                        print(f"  [{idx}] ✗ Failed to extract recipe data")
+                        logger.debug("  [%d] ✗ Failed to extract recipe data", idx)
 
                 scraped_recipes = valid_recipes
-                print(f"  ✓ Successfully scraped {len(scraped_recipes)} recipes")
+                logger.debug("  ✓ Successfully scraped %d recipes", len(scraped_recipes))
             except Exception as e:
-                print(f"  ✗ Parallel scraping failed: {str(e)[:80]}")
+                logger.warning("Parallel scraping failed: %s", str(e)[:80])
                 scraped_recipes = []
 
             if scraped_recipes:
-                # Check for obvious collection indicators (MORE COMPREHENSIVE)
-                # Note: These are checked against LOWERCASE title
-                collection_keywords = [
-                    'best', 'top', 'ideas', 'collection', 'recipes |',
-                    'non-vegetarian recipes', 'vegetarian recipes', 'vegan recipes',
-                    'non veg recipes', 'veg recipes', 'easy recipes',
-                    '10 best', '14 best', '9 best', '20 best', '40+', '672',  # Number patterns
-                    'dinner recipes', 'lunch recipes', 'breakfast recipes',
-                    'keto recipes', 'paleo recipes', 'low carb recipes', 'low-carb recipes',
-                    'gluten free recipes', 'gluten-free recipes', 'dairy free recipes', 'dairy-free recipes',
-                    'free paleo', 'favorite paleo', 'healthy vegan',
-                    'mouthwatering', 'crave-worthy', 'add to your', 'weekly menu',
-                    # Generic collection endings
-                    'recipes for', 'recipe ideas', 'meal ideas', 'dinner ideas',
-                    # Catch standalone "X Recipes" patterns
-                    'healthy recipes', 'quick recipes', 'simple recipes',
-                    # Very short generic titles that are likely categories, not dishes
-                    'paneer recipes', 'chicken recipes', 'beef recipes', 'fish recipes',
-                    'pasta recipes', 'salad recipes', 'soup recipes', 'curry recipes',
-                ]
+                # Collection indicators live in _WEB_COLLECTION_RE (checked against LOWERCASE title)
                 collection_page_urls = []
 
+                debug = logger.isEnabledFor(logging.DEBUG)  # Skip building log-only strings otherwise
+
                 for recipe in scraped_recipes:
-                    title = recipe.get('title', '').lower().strip()
-                    
-                    # Skip very short titles - likely category names, not dish names
-                    # e.g., "Non-Veg", "Paneer", "Recipes"
-                    if len(title) < 10:
-                        collection_url = recipe.get('source', '')
-                        collection_page_urls.append(collection_url)
-                        collection_pages.append({
-                            'title': recipe.get('title', 'Recipe Collection'),
-                            'url': collection_url
-                        })
-                        print(f"    📚 Too short, likely category: {recipe.get('title', 'Recipe')[:60]}")
+                    title_raw = recipe.get('title', '')
+                    title = title_raw.lower().strip()
+
+                    # Very short titles are likely category names, not dish names
+                    # (e.g., "Non-Veg", "Paneer", "Recipes"). Otherwise: collection keywords,
+                    # plural "recipes" endings, "X-Y Recipes", number patterns
+                    # (e.g., "14 Best...", "672 Low Carb") and "Title: A, B & More"
+                    too_short = len(title) < 10
+                    if not too_short and not _is_scraped_collection(title):
+                        actual_recipes.append(recipe)
+                        if debug:
+                            logger.debug("    ✅ %s", (title_raw or 'Recipe')[:60])
                         continue
 
-                    # Check for collection keywords OR number patterns (e.g., "14 Best...")
-                    is_collection = any(keyword in title for keyword in collection_keywords)
-                    
-                    # Check if title ends with "Recipes" (plural) - strong collection indicator
-                    # e.g., "Low-Carb Recipes", "Gluten-Free Recipes", "Vegan Recipes"
-                    # BUT NOT "Paneer Curry Recipe" (singular) - that's a real dish!
-                    import re
-                    if re.search(r'\brecipes\s*$', title):  # Ends with "recipes" (PLURAL)
-                        is_collection = True
-                    
-                    # Check for "X-Y Recipes" pattern like "Low-Carb Recipes", "Gluten-Free Recipes"
-                    # BUT NOT "X-Y Recipe" (singular)
-                    if re.search(r'\w+-\w+\s+recipes\b', title):  # Must be plural "recipes"
-                        is_collection = True
-
-                    # Also check if title has number patterns (strong indicator of listicle)
-                    # Patterns: "672 Low Carb", "41 Keto", "40+ of Our", "100 Mouthwatering"
-                    if re.search(r'\d+[\+]?\s+(low carb|keto|paleo|vegan|recipes?|of our|favorite|healthy|easy|best|paneer|chicken)', title):
-                        is_collection = True
-                    # Pattern: Starts with number (like "21 Easy Paneer Recipes", "35+ Indian Recipes")
-                    if re.match(r'^\d+[\+]?\s+', title):
-                        is_collection = True
+                    # This is a collection page - save URL to extract recipes from it
+                    collection_url = recipe.get('source', '')
+                    collection_page_urls.append(collection_url)
+                    collection_pages.append({
+                        'title': recipe.get('title', 'Recipe Collection'),
+                        'url': collection_url
+                    })
+                    if debug:
+                        logger.debug("    📚 %s: %s", "Too short, likely category" if too_short else "Collection page found",
+                                     (title_raw or 'Recipe')[:60])
+
+                # Extract from collection pages only while we're short of 3 recipes - with 3
+                # direct recipes anything pulled from collections would be trimmed off below
+                # (collection_pages is still returned so the frontend can link them)
+                if collection_page_urls and len(actual_recipes) < 3:
+                    logger.debug("  → Found %d collection pages", len(collection_page_urls))
+                    logger.debug("  → Current actual_recipes: %d", len(actual_recipes))
+                    logger.debug("  → Extracting individual recipes from collection pages...")
+
+                    collection_start = time.perf_counter()
                     
-                    # Pattern: Title contains colon followed by list indicators
-                    # e.g., "Gluten-Free Recipes: Cakes, Cookies, Bread & More"
-                    if ':' in title and any(word in title for word in ['&', 'and more', 'more']):
-                        is_collection = True
+                    col_urls = list(dict.fromkeys(collection_page_urls))[:2]  # Check first 2 distinct collection pages
 
-                    if not is_collection:
-                        actual_recipes.append(recipe)
-                        print(f"    ✅ {recipe.get('title', 'Recipe')[:60]}")
-                    else:
-                        # This is a collection page - save URL to extract recipes from it
-                        collection_url = recipe.get('source', '')
-                        collection_page_urls.append(collection_url)
-                        collection_pages.append({
-                            'title': recipe.get('title', 'Recipe Collection'),
-                            'url': collection_url
-                        })
-                        print(f"    📚 Collection page found: {recipe.get('title', 'Recipe')[:60]}")
-
-                # ALWAYS extract from collection pages if we found them, even if we have some recipes
-                # This ensures we get actual dish recipes instead of collection page titles
-                if collection_page_urls:
-                    print(f"\n  → Found {len(collection_page_urls)} collection pages")
-                    print(f"  → Current actual_recipes: {len(actual_recipes)}")
-                    print(f"  → Extracting individual recipes from collection pages...")
-
-                    collection_start = time.time()
-                    from services.recipe_scraper_pipeline import scrape_recipes_from_collection
-                    
-                    def is_collection_title(title: str) -> bool:
-                        """Check if a title indicates a collection/listicle rather than a single dish"""
-                        import re
-                        title_lower = title.lower().strip()
-                        
-                        # Very short titles are likely categories, not dishes
-                        if len(title_lower) < 10:
-                            return True
-                        
-                        # Direct keyword match
-                        if any(kw in title_lower for kw in collection_keywords):
-                            return True
-                        
-                        # Ends with "Recipes" (PLURAL) - collection indicator
-                        # BUT NOT "Recipe" (singular) - that's a real dish!
-                        if re.search(r'\brecipes\s*$', title_lower):
-                            return True
-                        
-                        # "X-Y Recipes" pattern like "Low-Carb Recipes", "Gluten-Free Recipes"
-                        # BUT NOT "X-Y Recipe" (singular)
-                        if re.search(r'\w+-\w+\s+recipes\b', title_lower):
-                            return True
-                        
-                        # Starts with a number (like "21 Easy Paneer Recipes")
-                        if re.match(r'^\d+[\+]?\s+', title_lower):
-                            return True
-                        
-                        # Contains colon followed by list indicators
-                        if ':' in title_lower and any(word in title_lower for word in ['&', 'and more', 'more']):
-                            return True
-                        
-                        return False
+                    # Expand the pages concurrently; each handles both:
+                    # 1. Rich ItemList (recipes embedded in JSON-LD)
+                    # 2. Multi-page collections (separate URLs to scrape)
+                    # Recipes are still accepted in page order below
+                    try:
+                        collection_results = run_scrape(scrape_collections_parallel(col_urls, max_recipes=5))
+                    except Exception as e:
+                        logger.warning("Error extracting from collections: %s", str(e)[:60])
+                        collection_results = []
 
-                    for col_url in collection_page_urls[:2]:  # Check first 2 collection pages
-                        print(f"\n  📚 Extracting from collection: {col_url[:70]}...")
+                    for col_url, collection_result in zip(col_urls, collection_results):
+                        logger.debug("  📚 Extracting from collection: %s...", col_url[:70])
 
                         try:
-                            # Use scrape_recipes_from_collection which handles both:
-                            # 1. Rich ItemList (recipes embedded in JSON-LD) 
-                            # 2. Multi-page collections (separate URLs to scrape)
-                            collection_result = scrape_recipes_from_collection(col_url, max_recipes=5)
-                            
+                            if isinstance(collection_result, Exception):
+                                raise collection_result
+
                             extracted_recipes = collection_result.get('recipes', [])
                             collection_type = collection_result.get('type', 'unknown')
                             
                             if extracted_recipes:
-                                print(f"    ✓ Got {len(extracted_recipes)} recipes from collection (type: {collection_type})")
+                                logger.debug("    ✓ Got %d recipes from collection (type: %s)", len(extracted_recipes), collection_type)
 
                                 # Process each extracted recipe
                                 for individual_recipe in extracted_recipes[:3]:  # Get top 3 recipes
                                     try:
                                         recipe_title = individual_recipe.get('title', 'Recipe')
+                                        title_lower = recipe_title.lower().strip()  # Shared by both checks below
                                         
                                         if individual_recipe and recipe_title != "Could not fetch recipe":
                                             # Verify it's not another collection page using comprehensive check
-                                            if not is_collection_title(recipe_title):
+                                            if not _is_collection_title(title_lower):
                                                 # For rich-itemlist type, recipes may not have ingredients
                                                 # Still add them if they have title and description
                                                 if collection_type == 'rich-itemlist':
                                                     # Rich ItemList recipes have title, description, image but no ingredients
                                                     if individual_recipe.get('title') and individual_recipe.get('description'):
                                                         actual_recipes.append(individual_recipe)
-                                                        print(f"      ✅ {recipe_title[:50]}")
+                                                        logger.debug("      ✅ %s", recipe_title[:50])
                                                         
                                                         if len(actual_recipes) >= 3:
                                                             break
                                                     else:
-                                                        print(f"      ⚬ Skipped (no description): {recipe_title[:40]}")
+                                                        logger.debug("      ⚬ Skipped (no description): %s", recipe_title[:40])
                                                 else:
                                                     # Multi-page recipes should have ingredients
-                                                    if self._is_valid_recipe(individual_recipe):
+                                                    if self._is_valid_recipe(individual_recipe, title_lower):
                                                         actual_recipes.append(individual_recipe)
-                                                        print(f"      ✅ {recipe_title[:50]}")
+                                                        logger.debug("      ✅ %s", recipe_title[:50])
 
                                                         if len(actual_recipes) >= 3:
                                                             break
                                                     else:
-                                                        print(f"      ⚬ Skipped (invalid/non-recipe content): {recipe_title[:40]}")
+                                                        logger.debug("      ⚬ Skipped (invalid/non-recipe content): %s", recipe_title[:40])
                                             else:
-                                                print(f"      ⚬ Skipped (another collection): {recipe_title[:40]}")
+                                                logger.debug("      ⚬ Skipped (another collection): %s", recipe_title[:40])
                                     except Exception as e:
-                                        print(f"      ✗ Failed processing recipe: {str(e)[:60]}")
+                                        logger.warning("Failed processing collection recipe: %s", str(e)[:60])
 
                                 if len(actual_recipes) >= 3:
-                                    print(f"    ✓ Successfully extracted {len(actual_recipes)} recipes from collection page")
+                                    logger.debug("    ✓ Successfully extracted %d recipes from collection page", len(actual_recipes))
                                     break
                             else:
-                                print(f"    ⚠️ No recipes found in collection page")
+                                logger.debug("    ⚠️ No recipes found in collection page")
 
                         except Exception as e:
-                            print(f"    ✗ Error extracting from collection: {str(e)[:60]}")
+                            logger.warning("Error extracting from collection: %s", str(e)[:60])
 
-                    collection_time = time.time() - collection_start
-                    print(f"  ⏱️  Collection extraction took {collection_time:.2f}s")
+                    collection_time = time.perf_counter() - collection_start
+                    logger.debug("  ⏱️  Collection extraction took %.2fs", collection_time)
 
                 if not actual_recipes:
-                    print(f"  ⚠️ All scraped pages were collections/listicles, no individual recipes found")
+                    logger.debug("  ⚠️ All scraped pages were collections/listicles, no individual recipes found")
                     web_has_results = False
                     web_summary = "I found some recipe collections online, but couldn't extract specific dish recipes. Try being more specific (e.g., 'chicken tikka recipe' instead of 'non-vegetarian recipes')."
                     collection_pages = []  # Clear collection pages so frontend doesn't show them
                 else:
                     # Limit to exactly 3 recipes for the recommendation
                     actual_recipes = actual_recipes[:3]
-                    print(f"  → Limited to {len(actual_recipes)} recipes for recommendation")
+                    logger.debug("  → Limited to %d recipes for recommendation", len(actual_recipes))
 
                     # Skip AI summary - just return empty string so recipes are shown directly
                     web_summary = ""  # No AI text, recipes will be displayed as cards
 
-                    # Prepare context for facts generation
-                    web_context = self._format_web_context(results, actual_recipes)
-
-                    print("  → Generating culinary facts...")
-                    facts_start = time.time()
+                    logger.debug("  → Generating culinary facts...")
+                    facts_start = time.perf_counter()
                     try:
-                        web_facts = self._generate_facts(web_context, query)
-                        facts_time = time.time() - facts_start
-                        print(f"  ⏱️  Facts generation took {facts_time:.2f}s")
-                        print(f"  ✓ Generated {len(web_facts)} facts")
+                        web_facts = self._generate_facts(self._format_web_context(results, actual_recipes), query)
+                        facts_time = time.perf_counter() - facts_start
+                        logger.debug("  ⏱️  Facts generation took %.2fs", facts_time)
+                        logger.debug("  ✓ Generated %d facts", len(web_facts))
                     except Exception as e:
-                        print(f"  ⚠️ Failed to generate facts: {e}")
+                        logger.warning("Failed to generate facts: %s", e)
                         web_facts = []
-
-                    pipeline_time = time.time() - pipeline_start
-                    print(f"  ⏱️  Total web pipeline took {pipeline_time:.2f}s")
-                    print("  ✓ Web search complete")
             else:
                 web_has_results = False
-                print("  ⚠️ No recipes could be scraped successfully")
+                logger.debug("  ⚠️ No recipes could be scraped successfully")
                 web_summary = "I found some recipe links online, but couldn't extract the detailed information. Please try a different search."
         else:
-            print("  ⚠️ No results found on internet")
+            logger.debug("  ⚠️ No results found on internet")
+
+        # One line per web fallback, like the RAG pipeline's
+        logger.info(
+            "Web: %d sources, %d recipes kept, collections=%d, time=%.2fs",
+            len(web_search_result.get("results") or []), len(actual_recipes),
+            len(collection_pages), time.perf_counter() - pipeline_start,
+        )
 
         return {
             "has_results": web_has_results,
@@ -892,82 +1229,49 @@ class MCPOrchestrator:
 
     def _format_web_context(self, search_results: List[Dict], scraped_recipes: List[Dict]) -> str:
         """Format web search results + scraped recipes for LLM"""
-        context = "Recipe Sources Found Online:\n\n"
+        parts: List[str] = ["Recipe Sources Found Online:\n\n"]
         for i, r in enumerate(search_results[:5], 1):
-            context += f"{i}. {r.get('title', 'Recipe')}\n"
-            context += f"   URL: {r.get('url')}\n"
+            parts.append(f"{i}. {r.get('title', 'Recipe')}\n   URL: {r.get('url')}\n")
             if r.get("snippet"):
-                context += f"   Description: {r['snippet']}\n"
-            context += "\n"
+                parts.append(f"   Description: {r['snippet'][:_WEB_SNIPPET_CHARS]}\n")
+            parts.append("\n")
 
         if scraped_recipes:
-            context += "\nDetailed Recipes:\n"
+            parts.append("\nDetailed Recipes:\n")
             for recipe in scraped_recipes:
-                context += f"\n{'='*40}\n"
-                context += f"Title: {recipe.get('title')}\n"
-                context += "\nIngredients:\n"
-                for ing in recipe.get("ingredients", [])[:15]:
-                    context += f"- {ing}\n"
-                context += "\nInstructions:\n"
-                for idx, step in enumerate(recipe.get("instructions", [])[:8], 1):
-                    context += f"{idx}. {step}\n"
-                if recipe.get("facts"):
-                    facts = recipe["facts"]
-                    context += f"\nQuick Facts:\n"
-                    if facts.get('prep_time'):
-                        context += f"- Prep Time: {facts.get('prep_time')}\n"
-                    if facts.get('cook_time'):
-                        context += f"- Cook Time: {facts.get('cook_time')}\n"
-                    if facts.get('total_time'):
-                        context += f"- Total Time: {facts.get('total_time')}\n"
-                    if facts.get('servings'):
-                        context += f"- Servings: {facts.get('servings')}\n"
-                    if facts.get('calories'):
-                        context += f"- Calories: {facts.get('calories')}\n"
-                context += f"\nSource: {recipe.get('source')}\n"
-
-        return context
+                parts.append(f"\n{'='*40}\nTitle: {recipe.get('title')}\n")
+                parts.append("\nIngredients:\n")
+                parts.append("".join(f"- {ing}\n" for ing in recipe.get("ingredients", [])[:_WEB_MAX_INGREDIENTS]))
+                parts.append("\nInstructions:\n")
+                parts.append("".join(f"{idx}. {step}\n" for idx, step in enumerate(recipe.get("instructions", [])[:_WEB_MAX_STEPS], 1)))
+                facts = recipe.get("facts")
+                if facts:
+                    parts.append("\nQuick Facts:\n")
+                    for key, label in _QUICK_FACT_LABELS:
+                        value = facts.get(key)
+                        if value:
+                            parts.append(f"- {label}: {value}\n")
+                parts.append(f"\nSource: {recipe.get('source')}\n")
+
+        return "".join(parts)
 
     def _summarize_with_llm(self, context: str, query: str, source: str) -> str:
         """Summarize recipe context using Groq or Gemini LLM"""
-        prompt = f"""A user asked: "{query}"
-
-        I found recipe information in my {source}. Please provide a personalized recommendation for EXACTLY 3 DISHES:
-
-        {context}
-
-        CRITICAL INSTRUCTIONS:
-        - Act as a friendly AI chef giving personalized recommendations
-        - Recommend EXACTLY 3 SPECIFIC DISH NAMES from the recipes found
-        - ONLY mention actual dish names (e.g., "Grilled Chicken Tikka", "Palak Paneer", "Chickpea Curry")
-        - DO NOT mention collection pages or listicle titles (DON'T say "9 best recipes")
-        - Briefly explain WHY these 3 dishes match their preferences (diet, skill level, goal)
-        - Format: "Based on your preferences, I recommend: [Dish 1], [Dish 2], and [Dish 3]. [Brief reason]."
-        - Maximum 3 sentences total
-
-        BAD examples (DON'T DO THIS):
-        ❌ "I found 3 delicious paneer recipes for you!"
-        ❌ "Check out these 9 best non vegetarian recipes"
-        ❌ "Here are some vegan options"
-
-        GOOD examples (DO THIS):
-        ✅ "Based on your preferences, I recommend: Palak Paneer, Paneer Butter Masala, and Garlic Paneer. All three are vegetarian, beginner-friendly, and packed with protein!"
-        ✅ "I suggest: Chickpea Buddha Bowl, Mediterranean Quinoa Salad, and Lentil Curry. These vegan dishes are quick to make and perfect for weight loss!"
-        ✅ "Try: Grilled Chicken Tikka, Butter Chicken, and Tandoori Chicken. All are easy to prepare and high in protein for muscle gain!"
-        """
+        context = _trim_context(context)
+        prompt = _SUMMARY_PROMPT.substitute(query=query, source=source, context=context)
 
         # Try Groq first (fast and reliable)
         if self.groq_client:
             try:
                 response = self.groq_client.chat.completions.create(
-                    model="llama-3.3-70b-versatile",
+                    model=_GROQ_MODEL,
                     messages=[{"role": "user", "content": prompt}],
                     temperature=0.3,
                     max_tokens=200,
                 )
                 return response.choices[0].message.content.strip()
             except Exception as e:
-                print(f"    ⚠️ Groq summarization error: {e}")
+                logger.warning("Groq summarization error: %s", e)
 
         # Fallback to Gemini
         if self.gemini_model:
@@ -975,98 +1279,233 @@ class MCPOrchestrator:
                 response = self.gemini_model.generate_content(prompt)
                 return response.text.strip()
             except Exception as e:
-                print(f"    ⚠️ Gemini summarization error: {e}")
+                logger.warning("Gemini summarization error: %s", e)
 
         # Final fallback
         return f"I found relevant recipes in the {source}. Check the detailed recipe information below for ingredients and cooking instructions."
 
+    def _groq_complete(self, prompt: str, temperature: float, max_tokens: int,
+                       timeout: float = LLM_TOTAL_TIMEOUT) -> str:
+        response = self.groq_client.chat.completions.create(
+            model=_GROQ_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=timeout,
+        )
+        return response.choices[0].message.content.strip()
+
+    def _gemini_complete(self, prompt: str, temperature: float, max_tokens: int,
+                         timeout: float = LLM_TOTAL_TIMEOUT) -> str:
+        response = self.gemini_model.generate_content(
+            prompt,
+            generation_config={"temperature": temperature, "max_output_tokens": max_tokens},
+            request_options={"timeout": timeout},
+        )
+        # Check if response was blocked
+        if hasattr(response, 'prompt_feedback'):
+            logger.debug("    📊 Prompt feedback: %s", response.prompt_feedback)
+        return response.text.strip()
+
+    def _llm_call(self, prompt: str, temperature: float = 0.7, max_tokens: int = 400) -> Optional[str]:
+        """
+        Complete a prompt with the first provider to answer.
+        Providers start in priority order (Groq, then Gemini): the next one is
+        launched when the current one fails or has been running for
+        LLM_PRIMARY_TIMEOUT, and then both race. Nothing runs past LLM_TOTAL_TIMEOUT
+        from the first call's start: each call's SDK timeout is the time left, so a
+        losing call frees its worker by then. Losers are cancelled if not started.
+        Answers are cached by (prompt hash, temperature, max_tokens) for LLM_CACHE_TTL.
+        """
+        # Same prompt -> reuse the answer instead of another round trip, whichever provider gave it
+        cache_key = _llm_cache_key(prompt, temperature, max_tokens)
+        if LLM_CACHE_TTL > 0:
+            cached = self._llm_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("    ⚡ LLM cache hit")
+                return cached
+
+        queue = []
+        if self.groq_client:
+            queue.append(("Groq", self._groq_complete))
+        if self.gemini_model:
+            queue.append(("Gemini", self._gemini_complete))
+
+        # provider -> when a worker began its call (time spent queued doesn't count)
+        started: Dict[str, float] = {}
+        started_lock = threading.Lock()
+
+        def run(name, call):
+            now = time.monotonic()
+            with started_lock:
+                started[name] = now
+                deadline = min(started.values()) + LLM_TOTAL_TIMEOUT
+            if deadline <= now:
+                raise TimeoutError("no time left after waiting for a worker")
+            return call(prompt, temperature, max_tokens, deadline - now)
+
+        def elapsed_since(name) -> Optional[float]:
+            with started_lock:
+                began = started.get(name)
+            return None if began is None else time.monotonic() - began
+
+        submitted_at = time.monotonic()
+        current = None  # Newest provider; LLM_PRIMARY_TIMEOUT on it gates the next one
+        pending = {}
+        try:
+            while queue or pending:
+                if queue and current is None:
+                    current, call = queue.pop(0)
+                    logger.debug("    🔄 Calling %s API...", current)
+                    pending[self._llm_executor.submit(run, current, call)] = current
+
+                with started_lock:
+                    first_start = min(started.values()) if started else None
+                # Until some call starts, cap the time spent queued for a worker instead
+                remaining = (first_start if first_start is not None else submitted_at) + LLM_TOTAL_TIMEOUT - time.monotonic()
+                if remaining <= 0:
+                    break
+                timeout = remaining
+                if queue:
+                    running_for = elapsed_since(current)
+                    timeout = min(timeout, _LLM_START_POLL if running_for is None else LLM_PRIMARY_TIMEOUT - running_for)
+
+                done, _ = wait(pending, timeout=max(timeout, 0.0), return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = pending.pop(future)
+                    if name == current:
+                        current = None  # Failed or empty - start the next provider right away
+                    try:
+                        text = future.result()
+                    except Exception as e:
+                        logger.warning("%s error: %s", name, e)
+                        continue
+                    if text:
+                        if LLM_CACHE_TTL > 0:
+                            self._llm_cache.set(cache_key, text)
+                        return text
+                    logger.warning("%s returned an empty response", name)
+
+                if queue and current is not None:
+                    running_for = elapsed_since(current)
+                    if running_for is not None and running_for >= LLM_PRIMARY_TIMEOUT:
+                        logger.debug("    ⏱️  %s slower than %gs, starting next provider", current, LLM_PRIMARY_TIMEOUT)
+                        current = None
+        finally:
+            for future in pending:
+                future.cancel()
+
+        logger.warning("No LLM answered (failed or over %gs)", LLM_TOTAL_TIMEOUT)
+        return None
+
     def _generate_facts(self, context: str, query: str) -> List[str]:
         """Generate interesting culinary facts using Groq or Gemini LLM"""
 
         if not self.groq_client and not self.gemini_model:
-            print("    ❌ No LLM available for facts generation")
+            logger.warning("No LLM available for facts generation")
             return []
 
-        print(f"    📋 Context length: {len(context)} characters")
-        print(f"    🔍 Context preview: {context[:200]}...")
-
-        prompt = f"""Based on the user's query: "{query}" and the following recipe information:
-
-{context}
-
-Generate exactly ONE fun and surprising "Did you know?" fact about one of the ingredients or dishes in these recipes. Focus on:
-- Surprising historical facts (e.g., "Did you know that pasta was brought to Italy from China by Marco Polo?")
-- Unusual botanical or biological facts (e.g., "Did you know that broccoli is actually a flower?")
-- Interesting cultural origins (e.g., "Did you know that tofu originated in China over 2,000 years ago?")
-- Mind-blowing food science (e.g., "Did you know that honey is the only food that never expires?")
-- Fun trivia about the ingredients used in these recipes
-
-The fact MUST start with "Did you know that" or "Did you know". Make it fascinating, unexpected, and educational!
-
-Examples:
-- "Did you know that broccoli, cauliflower, cabbage, and Brussels sprouts all come from the same plant species?"
-- "Did you know that cashews grow on the outside of a fruit called a cashew apple?"
-- "Did you know that white chocolate isn't technically chocolate because it contains no cocoa solids?"
-
-Return ONLY the single fact, nothing else. No numbering, no introduction, no conclusion.
-"""
-
-        # Try Groq first (fast and reliable)
-        if self.groq_client:
-            try:
-                print("    🔄 Calling Groq API for facts generation...")
-                response = self.groq_client.chat.completions.create(
-                    model="llama-3.3-70b-versatile",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.7,
-                    max_tokens=400,
-                )
-                fact_text = response.choices[0].message.content.strip()
-                print(f"    📝 Raw fact response: {fact_text}\n")
+        logger.debug("    📋 Context length: %d characters", len(context))
+        logger.debug("    🔍 Context preview: %s...", context[:200])
 
-                # Clean up any numbering or prefixes
-                fact = fact_text.lstrip('0123456789.-•) ').strip()
+        prompt = _facts_prompt(context, query)
 
-                print(f"    ✅ Generated fact successfully")
-                print(f"       {fact[:100]}...")
-
-                return [fact]  # Return single fact in array
-            except Exception as e:
-                print(f"    ⚠️ Groq facts generation error: {e}")
-
-        # Fallback to Gemini
-        if self.gemini_model:
-            try:
-                print("    🔄 Calling Gemini API for facts generation...")
-                response = self.gemini_model.generate_content(
-                    prompt,
-                    generation_config={"temperature": 0.7, "max_output_tokens": 400}
-                )
+        fact_text = self._llm_call(prompt, temperature=_FACTS_TEMPERATURE, max_tokens=_FACTS_MAX_TOKENS)
+        if not fact_text:
+            # Final fallback if all LLMs fail
+            logger.debug("    ⚠️ All LLM attempts failed, no facts available")
+            return []
 
-                # Check if response was blocked
-                if hasattr(response, 'prompt_feedback'):
-                    print(f"    📊 Prompt feedback: {response.prompt_feedback}")
+        logger.debug("    📝 Raw fact response: %s", fact_text)
 
-                fact_text = response.text.strip()
-                print(f"    📝 Raw fact response: {fact_text}\n")
+        fact = _clean_fact(fact_text)
 
-                # Clean up any numbering or prefixes
-                fact = fact_text.lstrip('0123456789.-•) ').strip()
+        logger.debug("    ✅ Generated fact: %s...", fact[:100])
 
-                print(f"    ✅ Generated fact successfully")
-                print(f"       {fact[:100]}...")
+        return [fact]  # Return single fact in array
 
-                return [fact]  # Return single fact in array
-            except Exception as e:
-                print(f"    ⚠️ Gemini facts generation error: {e}")
+    def batch_generate_facts(
+        self,
+        contexts_queries: List[Tuple[str, str]],
+        poll_interval: float = 5.0,
+        max_wait: float = 24 * 3600,
+    ) -> List[Optional[str]]:
+        """
+        Pre-compute facts for many (context, query) pairs through the Groq batch API
+        (half the price of live calls, results within the 24h completion window).
+        Prompts match _generate_facts, so each answer also warms the LLM cache for
+        the live request with the same context and query.
 
-        # Final fallback if all LLMs fail
-        print("    ⚠️ All LLM attempts failed, no facts available")
-        return []
+        Returns one fact per pair, in input order (None where the batch had no answer).
+        Meant for offline/pre-warm jobs: it blocks until the batch finishes.
+        """
+        if not contexts_queries:
+            return []
+        if not self.groq_client:
+            raise RuntimeError("Groq client not initialized - batch facts need GROQ_API_KEY")
+
+        prompts = [_facts_prompt(context, query) for context, query in contexts_queries]
+        payload = "\n".join(
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": _GROQ_MODEL,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": _FACTS_TEMPERATURE,
+                    "max_tokens": _FACTS_MAX_TOKENS,
+                },
+            })
+            for i, prompt in enumerate(prompts)
+        ).encode("utf-8")
+
+        # Offline job: retry transient errors (the live client races instead)
+        client = self.groq_client.with_options(max_retries=2)
+        input_file = client.files.create(file=("facts_batch.jsonl", payload), purpose="batch")
+        batch = client.batches.create(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=input_file.id,
+        )
+        logger.info("Submitted facts batch %s (%d prompts)", batch.id, len(prompts))
+
+        # Poll with exponential backoff (capped at 5 minutes between checks)
+        deadline = time.monotonic() + max_wait
+        delay = poll_interval
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"Facts batch {batch.id} still {batch.status} after {max_wait:g}s")
+            time.sleep(delay)
+            delay = min(delay * 2, 300.0)
+            batch = client.batches.retrieve(batch.id)
+
+        facts: List[Optional[str]] = [None] * len(prompts)
+        if not batch.output_file_id:
+            logger.warning("Facts batch %s ended %s with no output", batch.id, batch.status)
+            return facts
+
+        for line in client.files.content(batch.output_file_id).text().splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            text = response["body"]["choices"][0]["message"]["content"].strip()
+            if not text:
+                continue
+            i = int(item["custom_id"])
+            if LLM_CACHE_TTL > 0:
+                self._llm_cache.set(_llm_cache_key(prompts[i], _FACTS_TEMPERATURE, _FACTS_MAX_TOKENS), text)
+            facts[i] = _clean_fact(text)
+
+        logger.info("Facts batch %s: %d/%d answered", batch.id, sum(f is not None for f in facts), len(prompts))
+        return facts
 
     def _combine_results(self, query: str, rag_result: Dict, web_result: Dict) -> Dict:
         """Combine RAG and web results into final response"""
-        print("\n🔀 Combining Results...")
 
         primary_facts = []
 
@@ -1075,19 +1514,19 @@ Return ONLY the single fact, nothing else. No numbering, no introduction, no con
             primary_message = rag_result["summary"]
             primary_recipes = rag_result["results"]
             primary_facts = rag_result.get("facts", [])
-            print(f"  ✓ Using results from: {primary_source} ({len(primary_recipes)} recipes)")
+            logger.debug("  ✓ Using results from: %s (%d recipes)", primary_source, len(primary_recipes))
         elif web_result and web_result["has_results"]:
             primary_source = "internet"
             primary_message = web_result["summary"] or "I found some recipes online. Check the details below."
             primary_recipes = []
             primary_facts = web_result.get("facts", [])
-            print(f"  ✓ Using results from: {primary_source} (web search fallback)")
+            logger.debug("  ✓ Using results from: %s (web search fallback)", primary_source)
         else:
             primary_source = "none"
             primary_message = "I couldn't find any recipes matching your request. Try:\n- Using different keywords (e.g., 'pasta' instead of 'noodles')\n- Being more specific (e.g., 'vegetarian pasta recipes')\n- Checking your spelling"
             primary_recipes = []
             primary_facts = []
-            print(f"  ⚠️ No results found from any source")
+            logger.debug("  ⚠️ No results found from any source")
 
         return {
             "question": query,
@@ -3,14 +3,18 @@ MCP (Model Context Protocol) Tools for Internet Recipe Search
 Provides tools that LLM can call to fetch recipes from the internet
 """
 
+import logging
 import os
 import requests
 from typing import Dict, List, Optional, Any
 from bs4 import BeautifulSoup
-import json
 from urllib.parse import quote_plus
 import time
 
+from utils.fast_json import json_loads
+
+logger = logging.getLogger("CulinaraAI.mcp_tools")
+
 
 class MCPRecipeTools:
     """Tools for searching and fetching recipes from the internet"""
@@ -83,7 +87,7 @@ class MCPRecipeTools:
             }
             
         except Exception as e:
-            print(f"Error searching web for recipes: {e}")
+            logger.warning("Error searching web for recipes: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -145,7 +149,7 @@ class MCPRecipeTools:
             json_scripts = soup.find_all('script', type='application/ld+json')
             for script in json_scripts:
                 try:
-                    data = json.loads(script.string)
+                    data = json_loads(script.string)
                     if isinstance(data, dict) and data.get('@type') == 'Recipe':
                         recipe_data.update(self._parse_structured_recipe(data))
                     elif isinstance(data, list):
@@ -166,7 +170,7 @@ class MCPRecipeTools:
             return recipe_data
             
         except Exception as e:
-            print(f"Error fetching recipe from URL {url}: {e}")
+            logger.warning("Error fetching recipe from URL %s: %s", url, e)
             return {
                 "success": False,
                 "error": str(e),
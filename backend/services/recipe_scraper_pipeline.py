@@ -1,13 +1,143 @@
 # services/recipe_scraper_pipeline.py
 import asyncio
+import atexit
+import logging
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
 from urllib.parse import urlparse, urljoin, unquote
 from crawl4ai import AsyncWebCrawler
 from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
 from bs4 import BeautifulSoup
+from utils.cache import SimpleCache
+from utils.fast_json import json_loads
 import json
 import re
 import html
 
+# Per-page scraping chatter goes to DEBUG; failures worth noticing to WARNING
+logger = logging.getLogger("CulinaraAI.scraper")
+
+# Max pages loading at once in the shared headless browser
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "5"))
+# Max collection pages expanded at once (each then scrapes its own recipe links)
+COLLECTION_CONCURRENCY = int(os.getenv("COLLECTION_CONCURRENCY", "2"))
+# Keep one headless browser running between requests (0 = start one per batch)
+SCRAPE_KEEP_BROWSER = os.getenv("SCRAPE_KEEP_BROWSER", "1") == "1"
+# Successfully scraped pages are reused for this long (0 disables)
+SCRAPE_CACHE_TTL = int(os.getenv("SCRAPE_CACHE_TTL", "1800"))
+
+# url -> recipe dict, and "max_recipes|url" -> collection result
+_scrape_cache = SimpleCache(ttl_seconds=SCRAPE_CACHE_TTL, max_entries=2048)
+_collection_cache = SimpleCache(ttl_seconds=SCRAPE_CACHE_TTL, max_entries=512)
+
+# ----------------------------
+# Long-lived scrape event loop
+# ----------------------------
+# Sync callers (request threads) hand coroutines to one background loop instead of
+# asyncio.run(), so the browser - and its connections, DNS and TLS state - outlives a request
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+_browser: Optional[AsyncWebCrawler] = None
+_browser_lock = asyncio.Lock()
+# id(browser) -> open sessions using it; a retired browser is closed when its last session exits
+_browser_users: Dict[int, int] = {}
+
+# Playwright errors meaning the browser (not just the page) is gone. Timeouts,
+# 404s and bot blocks are one site's problem and never retire the browser.
+_BROWSER_DEAD_MARKERS = ("target closed", "has been closed", "browser closed")
+
+def _scrape_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, name="scrape-loop", daemon=True)
+            _loop_thread.start()
+    return _loop
+
+def run_scrape(coro):
+    """Run a scraper coroutine on the shared loop and wait for its result (sync code only)"""
+    loop = _scrape_loop()
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("run_scrape() called from the scrape loop - await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+async def _close_crawler(crawler: AsyncWebCrawler) -> None:
+    try:
+        await crawler.close()
+    except Exception as e:
+        logger.warning("    ⚠️ Could not close browser: %.80s", e)
+
+async def _close_browser() -> None:
+    """Close the shared browser now (shutdown only - batches may still be using it)"""
+    global _browser
+    browser, _browser = _browser, None
+    if browser is not None:
+        _browser_users.pop(id(browser), None)
+        await _close_crawler(browser)
+
+async def _retire_browser(crawler: AsyncWebCrawler, reason: str) -> None:
+    """Stop handing out crawler; it closes once the batches still using it finish"""
+    global _browser
+    async with _browser_lock:
+        if _browser is crawler:
+            logger.warning("    ⚠️ Restarting shared browser: %.80s", reason)
+            _browser = None
+
+@asynccontextmanager
+async def _crawler_session(browser_config: BrowserConfig):
+    """
+    Crawler for one batch: the warm shared browser when running on the scrape loop,
+    otherwise (or with SCRAPE_KEEP_BROWSER=0) a browser started for this batch.
+    """
+    global _browser
+    if not SCRAPE_KEEP_BROWSER or asyncio.get_running_loop() is not _loop:
+        async with AsyncWebCrawler(config=browser_config) as crawler:
+            yield crawler
+        return
+
+    async with _browser_lock:
+        if _browser is None:
+            browser = AsyncWebCrawler(config=browser_config)
+            await browser.start()
+            _browser = browser
+        crawler = _browser
+        _browser_users[id(crawler)] = _browser_users.get(id(crawler), 0) + 1
+    try:
+        yield crawler
+    except Exception as e:
+        await _check_fetch_error(crawler, str(e))
+        raise
+    finally:
+        async with _browser_lock:
+            users = _browser_users.pop(id(crawler), 1) - 1
+            if users:
+                _browser_users[id(crawler)] = users
+            last_user_of_retired = not users and crawler is not _browser
+        if last_user_of_retired:
+            await _close_crawler(crawler)
+
+async def _check_fetch_error(crawler: AsyncWebCrawler, error: str) -> None:
+    """
+    Fetch errors are swallowed per page, so a crashed browser would otherwise keep
+    being handed out: retire the shared one on a browser-closed error.
+    """
+    error_lower = error.lower()
+    if crawler is _browser and any(m in error_lower for m in _BROWSER_DEAD_MARKERS):
+        await _retire_browser(crawler, error)
+
+@atexit.register
+def _shutdown_scrape_loop() -> None:
+    if _loop is not None and _browser is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(_close_browser(), _loop).result(timeout=5)
+        except Exception:
+            pass
+
 # ----------------------------
 # Utility to normalize URLs
 # ----------------------------
@@ -151,13 +281,17 @@ class WebRecipeScraper:
             if result.success and result.html:
                 return result.html
             else:
-                print(f"    ⚠️ Crawler returned unsuccessful result for {url[:50]}")
+                logger.debug("    ⚠️ Crawler returned unsuccessful result for %.50s", url)
+                error = getattr(result, "error_message", None)
+                if error:
+                    await _check_fetch_error(crawler, error)
                 return None
         except asyncio.TimeoutError:
-            print(f"    ⚠️ Timeout fetching {url[:50]}")
+            logger.debug("    ⚠️ Timeout fetching %.50s", url)
             return None
         except Exception as e:
-            print(f"    ⚠️ Error fetching {url[:50]}: {str(e)[:100]}")
+            logger.debug("    ⚠️ Error fetching %.50s: %.100s", url, e)
+            await _check_fetch_error(crawler, str(e))
             return None
 
     def parse_recipe(self, html_content: str, url: str) -> dict:
@@ -167,7 +301,7 @@ class WebRecipeScraper:
         # Strategy 1: Attempt JSON-LD first (best quality)
         for script in soup.find_all("script", type="application/ld+json"):
             try:
-                data = json.loads(script.string)
+                data = json_loads(script.string)
                 if isinstance(data, list):
                     for item in data:
                         if isinstance(item, dict) and item.get("@type") == "Recipe":
@@ -278,22 +412,28 @@ class WebRecipeScraper:
         
         return None
 
-    async def scrape_recipe_from_url(self, url: str, retries=1) -> dict:
-        """Scrape recipe from URL with retry logic"""
+    async def scrape_recipe_from_url(self, url: str, retries=1, crawler: Optional[AsyncWebCrawler] = None) -> dict:
+        """
+        Scrape recipe from URL with retry logic.
+        Pass a running crawler to reuse its browser; otherwise one is started for this URL.
+        """
         url = normalize_url(url)
         
         for attempt in range(retries):
             try:
-                async with AsyncWebCrawler(config=self.browser_config) as crawler:
+                if crawler is not None:
                     html_content = await self.fetch_page_html(url, crawler)
-                    if html_content:
-                        recipe = self.parse_recipe(html_content, url)
-                        if recipe:
-                            return recipe
-                        else:
-                            print(f"    ⚠️ Could not parse recipe from HTML")
+                else:
+                    async with _crawler_session(self.browser_config) as own_crawler:
+                        html_content = await self.fetch_page_html(url, own_crawler)
+                if html_content:
+                    recipe = self.parse_recipe(html_content, url)
+                    if recipe:
+                        return recipe
+                    else:
+                        logger.debug("    ⚠️ Could not parse recipe from HTML")
             except Exception as e:
-                print(f"    ⚠️ Scraping attempt {attempt + 1} failed: {str(e)[:80]}")
+                logger.debug("    ⚠️ Scraping attempt %s failed: %.80s", attempt + 1, e)
                 if attempt < retries - 1:
                     await asyncio.sleep(1)
                     continue
@@ -319,13 +459,13 @@ def extract_recipes_from_itemlist(item_list_data: dict, collection_url: str, max
     recipes = []
     items = item_list_data.get('itemListElement', [])
     
-    print(f"    → Extracting recipes directly from ItemList ({len(items)} items available)")
+    logger.debug("    → Extracting recipes directly from ItemList (%s items available)", len(items))
     
     for item in items[:max_items]:
         recipe = extract_recipe_from_item_list_entry(item, collection_url)
         if recipe:
             recipes.append(recipe)
-            print(f"    ✓ Extracted: {recipe['title'][:50]}")
+            logger.debug("    ✓ Extracted: %.50s", recipe['title'])
     
     return recipes
 
@@ -369,7 +509,7 @@ def is_fragment_url(url: str, base_url: str) -> bool:
     return full_url.split('#')[0] == base_url.split('#')[0]
 
 
-def extract_recipe_links_from_collection_page(url: str, max_links: int = 5) -> list:
+async def extract_recipe_links_from_collection_page_async(url: str, max_links: int = 5) -> list:
     """
     Extract individual recipe links from a collection/listicle page.
     
@@ -381,207 +521,208 @@ def extract_recipe_links_from_collection_page(url: str, max_links: int = 5) -> l
     scraper = WebRecipeScraper()
 
     try:
-        async def _extract_links():
-            async with AsyncWebCrawler(config=scraper.browser_config) as crawler:
-                html_content = await scraper.fetch_page_html(url, crawler)
-                if not html_content:
-                    return []
-
-                soup = BeautifulSoup(html_content, "html.parser")
-                recipe_links = []
-
-                # Strategy 1: Look for JSON-LD structured data with ItemList
-                print(f"    → Strategy 1: Checking for JSON-LD ItemList...")
-                json_ld_scripts = soup.find_all('script', type='application/ld+json')
-
-                def find_item_lists(obj, found_lists=None):
-                    """Recursively find all ItemList objects in nested JSON-LD structure"""
-                    if found_lists is None:
-                        found_lists = []
-                    
-                    if isinstance(obj, dict):
-                        if obj.get('@type') == 'ItemList':
-                            found_lists.append(obj)
-                        for value in obj.values():
-                            find_item_lists(value, found_lists)
-                    elif isinstance(obj, list):
-                        for item in obj:
-                            find_item_lists(item, found_lists)
-                    
-                    return found_lists
+        async with _crawler_session(scraper.browser_config) as crawler:
+            html_content = await scraper.fetch_page_html(url, crawler)
+            if not html_content:
+                return []
+
+            soup = BeautifulSoup(html_content, "html.parser")
+            recipe_links = []
+
+            # Strategy 1: Look for JSON-LD structured data with ItemList
+            logger.debug("    → Strategy 1: Checking for JSON-LD ItemList...")
+            json_ld_scripts = soup.find_all('script', type='application/ld+json')
+
+            def find_item_lists(obj, found_lists=None):
+                """Recursively find all ItemList objects in nested JSON-LD structure"""
+                if found_lists is None:
+                    found_lists = []
+                
+                if isinstance(obj, dict):
+                    if obj.get('@type') == 'ItemList':
+                        found_lists.append(obj)
+                    for value in obj.values():
+                        find_item_lists(value, found_lists)
+                elif isinstance(obj, list):
+                    for item in obj:
+                        find_item_lists(item, found_lists)
                 
-                for script in json_ld_scripts:
-                    try:
-                        data = json.loads(script.string)
-                        item_lists = find_item_lists(data)
+                return found_lists
+            
+            for script in json_ld_scripts:
+                try:
+                    data = json_loads(script.string)
+                    item_lists = find_item_lists(data)
+                    
+                    for item_list in item_lists:
+                        items = item_list.get('itemListElement', [])
+                        if not items:
+                            continue
                         
-                        for item_list in item_lists:
-                            items = item_list.get('itemListElement', [])
-                            if not items:
-                                continue
-                            
-                            # Check if this is a rich ItemList with embedded recipe data
-                            if is_rich_itemlist(item_list):
-                                print(f"    ✓ Found rich ItemList with {len(items)} recipes")
-                                # Extract recipes directly from ItemList
-                                recipes = extract_recipes_from_itemlist(item_list, url, max_items=max_links)
-                                if recipes:
-                                    # Return special marker indicating direct recipes (not URLs)
-                                    return [('DIRECT_RECIPES', recipes)]
-                            
-                            # Otherwise, try to extract individual recipe URLs
-                            for item in items[:max_links]:
-                                if isinstance(item, dict):
-                                    item_url = (
-                                        item.get('url') or 
-                                        (item.get('item', {}).get('url') if isinstance(item.get('item'), dict) else None)
-                                    )
-                                    item_name = (
-                                        item.get('name') or 
-                                        (item.get('item', {}).get('name') if isinstance(item.get('item'), dict) else None)
-                                    )
-                                    
-                                    if item_url and not is_fragment_url(item_url, url):
-                                        full_url = urljoin(url, item_url)
-                                        recipe_links.append(full_url)
-                                        display_name = item_name[:30] if item_name else 'Unknown'
-                                        print(f"    → Found (JSON-LD): {display_name} → {full_url[:50]}")
-                            
-                            if recipe_links:
-                                print(f"    ✓ Strategy 1 SUCCESS: Extracted {len(recipe_links)} recipe links")
-                                return recipe_links
+                        # Check if this is a rich ItemList with embedded recipe data
+                        if is_rich_itemlist(item_list):
+                            logger.debug("    ✓ Found rich ItemList with %s recipes", len(items))
+                            # Extract recipes directly from ItemList
+                            recipes = extract_recipes_from_itemlist(item_list, url, max_items=max_links)
+                            if recipes:
+                                # Return special marker indicating direct recipes (not URLs)
+                                return [('DIRECT_RECIPES', recipes)]
+                        
+                        # Otherwise, try to extract individual recipe URLs
+                        for item in items[:max_links]:
+                            if isinstance(item, dict):
+                                item_url = (
+                                    item.get('url') or 
+                                    (item.get('item', {}).get('url') if isinstance(item.get('item'), dict) else None)
+                                )
+                                item_name = (
+                                    item.get('name') or 
+                                    (item.get('item', {}).get('name') if isinstance(item.get('item'), dict) else None)
+                                )
                                 
-                    except Exception as e:
-                        continue
-
-                # Strategy 2: Look for recipe cards with links to individual recipes
-                if not recipe_links:
-                    print(f"    → Strategy 2: Looking for recipe cards...")
-                    recipe_cards = soup.find_all(['article', 'div'], class_=re.compile(r'recipe.*card|card.*recipe', re.I))
+                                if item_url and not is_fragment_url(item_url, url):
+                                    full_url = urljoin(url, item_url)
+                                    recipe_links.append(full_url)
+                                    display_name = item_name[:30] if item_name else 'Unknown'
+                                    logger.debug("    → Found (JSON-LD): %s → %.50s", display_name, full_url)
+                        
+                        if recipe_links:
+                            logger.debug("    ✓ Strategy 1 SUCCESS: Extracted %s recipe links", len(recipe_links))
+                            return recipe_links
+                            
+                except Exception as e:
+                    continue
 
-                    if not recipe_cards:
-                        recipe_cards = soup.find_all(['article', 'div'], class_=re.compile(r'recipe-(?:item|post|tile|block)|post-\d+', re.I))
+            # Strategy 2: Look for recipe cards with links to individual recipes
+            if not recipe_links:
+                logger.debug("    → Strategy 2: Looking for recipe cards...")
+                recipe_cards = soup.find_all(['article', 'div'], class_=re.compile(r'recipe.*card|card.*recipe', re.I))
 
-                    if not recipe_cards:
-                        recipe_cards = soup.find_all(['article', 'div'], class_=re.compile(r'recipe|card|post|item', re.I))
+                if not recipe_cards:
+                    recipe_cards = soup.find_all(['article', 'div'], class_=re.compile(r'recipe-(?:item|post|tile|block)|post-\d+', re.I))
 
-                    if recipe_cards:
-                        print(f"    → Found {len(recipe_cards)} potential recipe cards")
-                        for card in recipe_cards:
-                            links = card.find_all('a', href=True)
-                            if not links:
-                                continue
+                if not recipe_cards:
+                    recipe_cards = soup.find_all(['article', 'div'], class_=re.compile(r'recipe|card|post|item', re.I))
 
-                            recipe_link = None
-                            for link in links:
-                                href = link.get('href')
-                                if not href:
-                                    continue
-
-                                link_text = link.get_text(strip=True)
-                                link_text_lower = link_text.lower()
-
-                                # Skip generic links
-                                if link_text and link_text[0].isdigit():
-                                    continue
-
-                                if any(generic in link_text_lower for generic in ['shop now', 'get started', 'read more',
-                                                                            'view all', 'subscribe', 'newsletter',
-                                                                            'author', 'by', 'contributor', 'comments',
-                                                                            'share', 'print', 'save', 'pin']):
-                                    continue
-
-                                if any(skip in href.lower() for skip in ['about', 'contact', 'privacy', 'subscribe',
-                                                                         'newsletter', 'tag', 'category', 'shop',
-                                                                         '#comments', '/search', '/store', 'youtube.com',
-                                                                         # Social media share links - NOT recipe pages!
-                                                                         'facebook.com', 'twitter.com', 'pinterest.com',
-                                                                         'instagram.com', 'linkedin.com', 'reddit.com',
-                                                                         'sharer.php', 'share?', 'intent/tweet',
-                                                                         'whatsapp.com', 'telegram.me', 't.me']):
-                                    continue
-
-                                # Skip collection URLs
-                                if any(cat in href.lower() for cat in ['/collections/', '/collection/', '/roundup/', 
-                                                                       '/best-', '/top-', '-recipes/']):
-                                    continue
-
-                                full_url = urljoin(url, href)
-                                parsed = urlparse(full_url)
-
-                                if parsed.path in ['/', '', '/recipes', '/recipe'] or len(parsed.path) < 15:
-                                    continue
-
-                                path_parts = [p for p in parsed.path.split('/') if p]
-                                if len(path_parts) < 2:
-                                    continue
-
-                                recipe_link = full_url
-                                break
+                if recipe_cards:
+                    logger.debug("    → Found %s potential recipe cards", len(recipe_cards))
+                    for card in recipe_cards:
+                        links = card.find_all('a', href=True)
+                        if not links:
+                            continue
 
-                            if recipe_link and recipe_link not in recipe_links and recipe_link != url:
-                                recipe_links.append(recipe_link)
-                                print(f"    → Candidate: {recipe_link[:70]}")
-                                if len(recipe_links) >= max_links:
-                                    break
+                        recipe_link = None
+                        for link in links:
+                            href = link.get('href')
+                            if not href:
+                                continue
 
-                        if recipe_links:
-                            print(f"    ✓ Strategy 2 SUCCESS: Found {len(recipe_links)} recipe links")
-                            return recipe_links
+                            link_text = link.get_text(strip=True)
+                            link_text_lower = link_text.lower()
 
-                # Strategy 3: Look for links with "recipe" in URL
-                if not recipe_links:
-                    print(f"    → Strategy 3: Trying link-based extraction with 'recipe' in URL")
-                    for link in soup.find_all("a", href=True):
-                        href = link.get("href")
-                        link_text = link.get_text(strip=True)
+                            # Skip generic links
+                            if link_text and link_text[0].isdigit():
+                                continue
 
-                        if 'recipe' not in href.lower():
-                            continue
+                            if any(generic in link_text_lower for generic in ['shop now', 'get started', 'read more',
+                                                                        'view all', 'subscribe', 'newsletter',
+                                                                        'author', 'by', 'contributor', 'comments',
+                                                                        'share', 'print', 'save', 'pin']):
+                                continue
 
-                        if any(skip in href.lower() for skip in ['about', 'contact', 'privacy', 'subscribe', 
-                                                                 'newsletter', 'category', 'tag', 'collection',
-                                                                 # Social media share links
-                                                                 'facebook.com', 'twitter.com', 'pinterest.com',
-                                                                 'instagram.com', 'linkedin.com', 'reddit.com',
-                                                                 'sharer.php', 'share?', 'intent/tweet',
-                                                                 'whatsapp.com', 'telegram.me', 't.me']):
-                            continue
+                            if any(skip in href.lower() for skip in ['about', 'contact', 'privacy', 'subscribe',
+                                                                     'newsletter', 'tag', 'category', 'shop',
+                                                                     '#comments', '/search', '/store', 'youtube.com',
+                                                                     # Social media share links - NOT recipe pages!
+                                                                     'facebook.com', 'twitter.com', 'pinterest.com',
+                                                                     'instagram.com', 'linkedin.com', 'reddit.com',
+                                                                     'sharer.php', 'share?', 'intent/tweet',
+                                                                     'whatsapp.com', 'telegram.me', 't.me']):
+                                continue
 
-                        full_url = urljoin(url, href)
-                        parsed = urlparse(full_url)
+                            # Skip collection URLs
+                            if any(cat in href.lower() for cat in ['/collections/', '/collection/', '/roundup/', 
+                                                                   '/best-', '/top-', '-recipes/']):
+                                continue
 
-                        if len(parsed.path) < 20:
-                            continue
+                            full_url = urljoin(url, href)
+                            parsed = urlparse(full_url)
 
-                        path_parts = [p for p in parsed.path.split('/') if p]
+                            if parsed.path in ['/', '', '/recipes', '/recipe'] or len(parsed.path) < 15:
+                                continue
 
-                        if any(part in ['collection', 'collections', 'roundup', 'roundups'] for part in path_parts):
-                            continue
+                            path_parts = [p for p in parsed.path.split('/') if p]
+                            if len(path_parts) < 2:
+                                continue
 
-                        if any(part.endswith('-recipes') for part in path_parts):
-                            continue
+                            recipe_link = full_url
+                            break
 
-                        if full_url not in recipe_links and full_url != url:
-                            recipe_links.append(full_url)
-                            print(f"    → Found (link-based): {link_text[:40]} → {full_url[:50]}")
+                        if recipe_link and recipe_link not in recipe_links and recipe_link != url:
+                            recipe_links.append(recipe_link)
+                            logger.debug("    → Candidate: %.70s", recipe_link)
                             if len(recipe_links) >= max_links:
                                 break
 
                     if recipe_links:
-                        print(f"    ✓ Strategy 3 SUCCESS: Found {len(recipe_links)} recipe links")
+                        logger.debug("    ✓ Strategy 2 SUCCESS: Found %s recipe links", len(recipe_links))
+                        return recipe_links
+
+            # Strategy 3: Look for links with "recipe" in URL
+            if not recipe_links:
+                logger.debug("    → Strategy 3: Trying link-based extraction with 'recipe' in URL")
+                for link in soup.find_all("a", href=True):
+                    href = link.get("href")
+                    link_text = link.get_text(strip=True)
+
+                    if 'recipe' not in href.lower():
+                        continue
+
+                    if any(skip in href.lower() for skip in ['about', 'contact', 'privacy', 'subscribe', 
+                                                             'newsletter', 'category', 'tag', 'collection',
+                                                             # Social media share links
+                                                             'facebook.com', 'twitter.com', 'pinterest.com',
+                                                             'instagram.com', 'linkedin.com', 'reddit.com',
+                                                             'sharer.php', 'share?', 'intent/tweet',
+                                                             'whatsapp.com', 'telegram.me', 't.me']):
+                        continue
+
+                    full_url = urljoin(url, href)
+                    parsed = urlparse(full_url)
 
-                if not recipe_links:
-                    print(f"    ✗ All strategies failed - no recipe links found")
+                    if len(parsed.path) < 20:
+                        continue
+
+                    path_parts = [p for p in parsed.path.split('/') if p]
+
+                    if any(part in ['collection', 'collections', 'roundup', 'roundups'] for part in path_parts):
+                        continue
+
+                    if any(part.endswith('-recipes') for part in path_parts):
+                        continue
 
-                return recipe_links
+                    if full_url not in recipe_links and full_url != url:
+                        recipe_links.append(full_url)
+                        logger.debug("    → Found (link-based): %.40s → %.50s", link_text, full_url)
+                        if len(recipe_links) >= max_links:
+                            break
+
+                if recipe_links:
+                    logger.debug("    ✓ Strategy 3 SUCCESS: Found %s recipe links", len(recipe_links))
+
+            if not recipe_links:
+                logger.debug("    ✗ All strategies failed - no recipe links found")
 
-        return asyncio.run(_extract_links())
+            return recipe_links
 
     except Exception as e:
-        print(f"  ✗ Error extracting links from collection page: {str(e)[:80]}")
+        logger.warning("  ✗ Error extracting links from collection page: %.80s", e)
         return []
 
+def extract_recipe_links_from_collection_page(url: str, max_links: int = 5) -> list:
+    """Sync wrapper: runs extract_recipe_links_from_collection_page_async on the scrape loop"""
+    return run_scrape(extract_recipe_links_from_collection_page_async(url, max_links))
+
 
 # ----------------------------
 # Entry point for MCP fallback
@@ -589,6 +730,9 @@ def extract_recipe_links_from_collection_page(url: str, max_links: int = 5) -> l
 async def scrape_recipes_parallel(urls: list) -> list:
     """
     Scrape multiple recipe URLs in parallel for faster performance.
+    All pages share one browser (one cold start per batch, not per URL);
+    at most SCRAPE_CONCURRENCY pages load at once. Duplicate URLs are fetched
+    once, and recently scraped pages come from the cache.
 
     Args:
         urls: List of recipe URLs to scrape
@@ -597,35 +741,47 @@ async def scrape_recipes_parallel(urls: list) -> list:
         List of recipe dicts in the same order as input URLs
     """
     scraper = WebRecipeScraper()
+    sem = asyncio.Semaphore(SCRAPE_CONCURRENCY)
 
-    # Create tasks for all URLs
-    tasks = []
-    for url in urls:
-        if not isinstance(url, str):
-            # Skip invalid URLs
-            continue
-        url = unwrap_duckduckgo(url)
-        tasks.append(scraper.scrape_recipe_from_url(url))
-
-    # Run all scraping tasks concurrently
-    recipes = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Filter out exceptions and return valid recipes
-    valid_recipes = []
-    for i, recipe in enumerate(recipes):
-        if isinstance(recipe, Exception):
-            print(f"    ✗ Error scraping URL {i+1}: {str(recipe)[:80]}")
-            valid_recipes.append({
-                "title": "Could not fetch recipe",
-                "ingredients": [],
-                "instructions": [],
-                "facts": {},
-                "source": urls[i] if i < len(urls) else "unknown"
-            })
-        else:
-            valid_recipes.append(recipe)
+    # Skip invalid URLs
+    urls = [unwrap_duckduckgo(url) for url in urls if isinstance(url, str)]
+    if not urls:
+        return []
+
+    by_url = {}
+    if SCRAPE_CACHE_TTL > 0:
+        for url in urls:
+            cached = _scrape_cache.get(url)
+            if cached is not None:
+                by_url[url] = cached
+    to_fetch = [url for url in dict.fromkeys(urls) if url not in by_url]
+
+    if to_fetch:
+        async with _crawler_session(scraper.browser_config) as crawler:
+            async def _one(url: str) -> dict:
+                async with sem:
+                    return await scraper.scrape_recipe_from_url(url, crawler=crawler)
+
+            # Run all scraping tasks concurrently
+            recipes = await asyncio.gather(*[_one(url) for url in to_fetch], return_exceptions=True)
+
+        # Replace exceptions with placeholders; cache real recipes
+        for i, (url, recipe) in enumerate(zip(to_fetch, recipes)):
+            if isinstance(recipe, Exception):
+                logger.debug("    ✗ Error scraping URL %s: %.80s", i+1, recipe)
+                recipe = {
+                    "title": "Could not fetch recipe",
+                    "ingredients": [],
+                    "instructions": [],
+                    "facts": {},
+                    "source": url
+                }
+            elif SCRAPE_CACHE_TTL > 0 and recipe and recipe.get("title") != "Could not fetch recipe":
+                _scrape_cache.set(url, recipe)
+            by_url[url] = recipe
 
-    return valid_recipes
+    # Same order as the input; copies so callers can't edit cached entries
+    return [dict(by_url[url]) for url in urls]
 
 def scrape_recipe_via_mcp(url: str) -> dict:
     """
@@ -634,7 +790,7 @@ def scrape_recipe_via_mcp(url: str) -> dict:
     """
     # Safety check - ensure url is a string
     if not isinstance(url, str):
-        print(f"    ⚠️ Invalid URL type received: {type(url)} - attempting to extract URL")
+        logger.warning("    ⚠️ Invalid URL type received: %s - attempting to extract URL", type(url))
         if isinstance(url, tuple):
             for item in url:
                 if isinstance(item, str) and (item.startswith('http') or item.startswith('//')):
@@ -655,10 +811,10 @@ def scrape_recipe_via_mcp(url: str) -> dict:
     scraper = WebRecipeScraper()
 
     try:
-        recipe = asyncio.run(scraper.scrape_recipe_from_url(url))
+        recipe = run_scrape(scraper.scrape_recipe_from_url(url))
         return recipe
     except Exception as e:
-        print(f"    ⚠️ Fatal error in scrape_recipe_via_mcp: {str(e)[:100]}")
+        logger.warning("    ⚠️ Fatal error in scrape_recipe_via_mcp: %.100s", e)
         return {
             "title": "Could not fetch recipe",
             "ingredients": [],
@@ -668,7 +824,7 @@ def scrape_recipe_via_mcp(url: str) -> dict:
         }
 
 
-def scrape_recipes_from_collection(url: str, max_recipes: int = 5) -> dict:
+async def scrape_recipes_from_collection_async(url: str, max_recipes: int = 5) -> dict:
     """
     Scrape multiple recipes from a collection page.
     Handles both:
@@ -680,12 +836,19 @@ def scrape_recipes_from_collection(url: str, max_recipes: int = 5) -> dict:
         'collection_url': URL of the collection page
         'type': 'rich-itemlist', 'multi-page', or 'unknown'
     """
-    print(f"\n🔍 Analyzing collection page...")
+    logger.debug("🔍 Analyzing collection page...")
+
+    cache_key = f"{max_recipes}|{url}"
+    if SCRAPE_CACHE_TTL > 0:
+        cached = _collection_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("    ⚡ Collection cache hit (%s recipes)", len(cached['recipes']))
+            return {**cached, 'recipes': [dict(r) for r in cached['recipes']]}
     
-    result = extract_recipe_links_from_collection_page(url, max_links=max_recipes)
+    result = await extract_recipe_links_from_collection_page_async(url, max_links=max_recipes)
     
     if not result:
-        print(f"    ⚠️ No recipes found in collection")
+        logger.debug("    ⚠️ No recipes found in collection")
         return {'recipes': [], 'collection_url': url, 'type': 'unknown'}
     
     # Check if we got direct recipes from a rich ItemList
@@ -695,36 +858,57 @@ def scrape_recipes_from_collection(url: str, max_recipes: int = 5) -> dict:
         result[0][0] == 'DIRECT_RECIPES'):
         
         recipes = result[0][1]
-        print(f"    ✓ Extracted {len(recipes)} recipes directly from ItemList")
-        return {
+        logger.debug("    ✓ Extracted %s recipes directly from ItemList", len(recipes))
+        return _cache_collection(cache_key, {
             'recipes': recipes,
             'collection_url': url,
             'type': 'rich-itemlist'
-        }
+        })
     
     # Regular multi-page collection - scrape each recipe URL
     # Filter out any non-string items (tuples, etc.) to prevent errors
     recipe_links = [r for r in result if isinstance(r, str)]
     
     if len(recipe_links) != len(result):
-        print(f"    ⚠️ Filtered out {len(result) - len(recipe_links)} non-URL items")
+        logger.debug("    ⚠️ Filtered out %s non-URL items", len(result) - len(recipe_links))
     
     if not recipe_links:
-        print(f"    ⚠️ No valid recipe URLs found after filtering")
+        logger.debug("    ⚠️ No valid recipe URLs found after filtering")
         return {'recipes': [], 'collection_url': url, 'type': 'multi-page'}
     
-    print(f"    ✓ Found {len(recipe_links)} recipe links to scrape")
+    logger.debug("    ✓ Found %s recipe links to scrape", len(recipe_links))
     recipe_links = recipe_links[:max_recipes]
     
-    recipes = []
-    for i, recipe_url in enumerate(recipe_links, 1):
-        print(f"\n→ Scraping recipe {i}/{len(recipe_links)}: {recipe_url[:60]}...")
-        recipe = scrape_recipe_via_mcp(recipe_url)
-        if recipe and recipe.get('title') != "Could not fetch recipe":
-            recipes.append(recipe)
+    # Scrape the recipe pages concurrently instead of one browser session at a time
+    logger.debug("→ Scraping %s recipes in parallel...", len(recipe_links))
+    scraped = await scrape_recipes_parallel(recipe_links)
+    recipes = [r for r in scraped if r and r.get('title') != "Could not fetch recipe"]
     
-    return {
+    return _cache_collection(cache_key, {
         'recipes': recipes,
         'collection_url': url,
         'type': 'multi-page'
-    }
\ No newline at end of file
+    })
+
+def _cache_collection(cache_key: str, result: dict) -> dict:
+    """Remember a collection result that produced recipes"""
+    if SCRAPE_CACHE_TTL > 0 and result['recipes']:
+        _collection_cache.set(cache_key, {**result, 'recipes': [dict(r) for r in result['recipes']]})
+    return result
+
+def scrape_recipes_from_collection(url: str, max_recipes: int = 5) -> dict:
+    """Sync wrapper: runs scrape_recipes_from_collection_async on the scrape loop"""
+    return run_scrape(scrape_recipes_from_collection_async(url, max_recipes))
+
+async def scrape_collections_parallel(urls: list, max_recipes: int = 5) -> list:
+    """
+    Scrape several collection pages at once (at most COLLECTION_CONCURRENCY).
+    Returns one result per URL, in order; a failed page yields its exception.
+    """
+    sem = asyncio.Semaphore(COLLECTION_CONCURRENCY)
+
+    async def _one(url: str) -> dict:
+        async with sem:
+            return await scrape_recipes_from_collection_async(url, max_recipes=max_recipes)
+
+    return await asyncio.gather(*[_one(url) for url in urls], return_exceptions=True)
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""
+Unit tests for the in-memory caches
+"""
+import numpy as np
+import pytest
+from utils.cache import EmbeddingCache, QuantizedEmbeddingCache, SemanticResultCache, SimpleCache
+
+
+def unit(*values):
+    vec = np.array(values, dtype=np.float32)
+    return vec / np.linalg.norm(vec)
+
+
+class TestSimpleCache:
+    """TTL + LRU behaviour"""
+
+    def test_evicts_least_recently_used(self):
+        cache = SimpleCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "a" is now the most recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_expired_entries_are_dropped(self):
+        cache = SimpleCache(ttl_seconds=-1)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+        assert cache.size() == 0
+
+    def test_unbounded_by_default(self):
+        cache = SimpleCache(ttl_seconds=60)
+        for i in range(100):
+            cache.set(str(i), i)
+        assert cache.size() == 100
+
+
+class TestEmbeddingCaches:
+    """Exact float32 memo vs. the int8 similarity tier"""
+
+    def test_exact_memo_returns_stored_vector(self):
+        cache = EmbeddingCache()
+        vec = np.random.default_rng(0).standard_normal(768).astype(np.float32)
+        stored = cache.set("pasta", vec)
+
+        assert np.array_equal(cache.get("pasta"), vec)
+        assert cache.get("pasta") is stored
+        with pytest.raises(ValueError):
+            stored[0] = 1.0  # Read-only, so callers can't corrupt the memo
+
+    def test_exact_memo_evicts_least_recently_used(self):
+        cache = EmbeddingCache(max_entries=1)
+        cache.set("a", unit(1, 0))
+        cache.set("b", unit(0, 1))
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+    def test_nearest_respects_threshold(self):
+        cache = QuantizedEmbeddingCache()
+        cache.set("x", unit(1, 0, 0))
+        cache.set("y", unit(0, 1, 0))
+
+        assert cache.nearest(unit(1, 0.05, 0), threshold=0.97) == "x"
+        assert cache.nearest(unit(1, 1, 0), threshold=0.97) is None
+
+    def test_nearest_within_prefix(self):
+        cache = QuantizedEmbeddingCache()
+        cache.set("a\0x", unit(1, 0.1, 0))
+        cache.set("b\0x", unit(1, 0, 0))
+        assert cache.nearest(unit(1, 0, 0), prefix="a\0") == "a\0x"
+        assert cache.nearest(unit(1, 0, 0), prefix="c\0") is None
+
+    def test_nearest_on_empty_cache(self):
+        assert QuantizedEmbeddingCache().nearest(unit(1, 0)) is None
+
+
+class TestSemanticResultCache:
+    """Scope, near hits and copy semantics"""
+
+    def test_exact_hit(self):
+        cache = SemanticResultCache()
+        cache.set("5|0.35", "Lamb Curry", unit(1, 0, 0), [{"id": "1"}])
+        assert cache.get("5|0.35", "  lamb curry ", unit(0, 0, 1)) == [{"id": "1"}]
+
+    def test_near_hit_in_same_scope(self):
+        cache = SemanticResultCache(threshold=0.97)
+        cache.set("5|0.35", "lamb curry", unit(1, 0, 0), [{"id": "1"}])
+        assert cache.get("5|0.35", "curry with lamb", unit(1, 0.05, 0)) == [{"id": "1"}]
+
+    def test_near_hit_needs_matching_scope(self):
+        cache = SemanticResultCache(threshold=0.97)
+        cache.set("5|0.35|lamb", "lamb curry", unit(1, 0, 0), [{"id": "1"}])
+        assert cache.get("5|0.35|beef", "beef curry", unit(1, 0.05, 0)) is None
+
+    def test_near_hit_ignores_closer_entry_in_other_scope(self):
+        cache = SemanticResultCache(threshold=0.97)
+        cache.set("5|0.35", "lamb curry", unit(1, 0.1, 0), [{"id": "1"}])
+        cache.set("10|0.35", "lamb curry", unit(1, 0, 0), [{"id": "2"}])
+        assert cache.get("5|0.35", "curry with lamb", unit(1, 0.02, 0)) == [{"id": "1"}]
+
+    def test_dissimilar_query_misses(self):
+        cache = SemanticResultCache(threshold=0.97)
+        cache.set("5|0.35", "lamb curry", unit(1, 0, 0), [{"id": "1"}])
+        assert cache.get("5|0.35", "chocolate cake", unit(0, 1, 0)) is None
+
+    def test_results_are_copies(self):
+        cache = SemanticResultCache()
+        results = [{"id": "1", "score": 0.5}]
+        cache.set("s", "q", unit(1, 0), results)
+        results[0]["score"] = 0.0  # Caller keeps mutating its own list
+
+        first = cache.get("s", "q", unit(1, 0))
+        assert first == [{"id": "1", "score": 0.5}]
+        first[0]["score"] = 1.0  # Callers re-score results in place
+
+        assert cache.get("s", "q", unit(1, 0))[0]["score"] == 0.5
+
+    def test_clear(self):
+        cache = SemanticResultCache()
+        cache.set("s", "q", unit(1, 0), [{"id": "1"}])
+        cache.clear()
+        assert cache.get("s", "q", unit(1, 0)) is None
+        assert cache.size() == 0
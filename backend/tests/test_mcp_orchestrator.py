@@ -0,0 +1,189 @@
+"""
+Unit tests for MCP orchestrator internals: LLM provider racing, in-flight
+query coalescing, the speculative web gate and the keyword classifiers
+"""
+import threading
+import time
+
+import pytest
+from services import mcp_orchestrator
+from services.mcp_orchestrator import MCPOrchestrator, _keyword_re, _match_foods
+
+
+def provider(answer, delay=0.0, calls=None):
+    """Fake Groq/Gemini completion: answers after delay, or times out like the SDK"""
+    def complete(prompt, temperature, max_tokens, timeout):
+        if calls is not None:
+            calls.append(timeout)
+        time.sleep(min(delay, timeout))
+        if delay > timeout:
+            raise TimeoutError("request timed out")
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+    return complete
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    monkeypatch.setattr(mcp_orchestrator, "LLM_PRIMARY_TIMEOUT", 0.1)
+    monkeypatch.setattr(mcp_orchestrator, "LLM_TOTAL_TIMEOUT", 0.5)
+    orch = MCPOrchestrator(rag_engine=None, mcp_tools=None)
+    orch.groq_client = object()
+    orch.gemini_model = object()
+    return orch
+
+
+class TestLLMCall:
+    """Groq first, Gemini as a racing fallback, bounded by LLM_TOTAL_TIMEOUT"""
+
+    def test_primary_answers(self, orchestrator):
+        orchestrator._groq_complete = provider("groq")
+        orchestrator._gemini_complete = provider("gemini")
+        assert orchestrator._llm_call("prompt") == "groq"
+
+    def test_gemini_takes_over_when_groq_is_slow(self, orchestrator):
+        orchestrator._groq_complete = provider("groq", delay=0.4)
+        orchestrator._gemini_complete = provider("gemini", delay=0.05)
+
+        start = time.monotonic()
+        assert orchestrator._llm_call("prompt") == "gemini"
+        assert time.monotonic() - start < 0.3
+
+    def test_gemini_starts_right_away_when_groq_fails(self, orchestrator):
+        orchestrator._groq_complete = provider(RuntimeError("rate limited"))
+        orchestrator._gemini_complete = provider("gemini")
+
+        start = time.monotonic()
+        assert orchestrator._llm_call("prompt") == "gemini"
+        assert time.monotonic() - start < mcp_orchestrator.LLM_PRIMARY_TIMEOUT
+
+    def test_none_after_total_timeout(self, orchestrator):
+        groq_timeouts = []
+        orchestrator._groq_complete = provider("groq", delay=5, calls=groq_timeouts)
+        orchestrator._gemini_complete = provider("gemini", delay=5)
+
+        start = time.monotonic()
+        assert orchestrator._llm_call("prompt") is None
+        assert time.monotonic() - start < 0.8
+        # The SDK call itself is bounded by the race deadline, so it frees its worker
+        assert groq_timeouts and groq_timeouts[0] <= mcp_orchestrator.LLM_TOTAL_TIMEOUT
+
+    def test_queue_time_does_not_count(self, orchestrator):
+        orchestrator._llm_executor.shutdown()
+        orchestrator._llm_executor = mcp_orchestrator.ThreadPoolExecutor(max_workers=1)
+        orchestrator._llm_executor.submit(time.sleep, 0.3)  # Busy worker
+        orchestrator._groq_complete = provider("groq", delay=0.05)
+        orchestrator.gemini_model = None
+
+        assert orchestrator._llm_call("prompt") == "groq"
+
+    def test_answers_are_cached(self, orchestrator):
+        calls = []
+        orchestrator._groq_complete = provider("groq", calls=calls)
+        assert orchestrator._llm_call("prompt") == "groq"
+        assert orchestrator._llm_call("prompt") == "groq"
+        assert len(calls) == 1
+
+
+class TestInflightCoalescing:
+    """Concurrent identical queries share one pipeline run"""
+
+    def test_identical_queries_run_once(self, orchestrator):
+        runs = []
+
+        def slow_pipeline(*args):
+            runs.append(args)
+            time.sleep(0.2)
+            return {"answer": len(runs)}
+
+        orchestrator._process_query = slow_pipeline
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(orchestrator.process_query("Pasta")))
+                   for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(runs) == 1
+        assert results == [{"answer": 1}] * 5
+        assert orchestrator._inflight == {}
+
+    def test_errors_reach_every_waiter(self, orchestrator):
+        def failing_pipeline(*args):
+            time.sleep(0.1)
+            raise RuntimeError("search down")
+
+        orchestrator._process_query = failing_pipeline
+        errors = []
+
+        def call():
+            try:
+                orchestrator.process_query("pasta")
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(errors) == 3
+
+
+class FakeRAGEngine:
+    def __init__(self, results):
+        self.results = results
+
+    def search_recipes(self, query, top_k=10, min_score=0.35):
+        return [dict(r) for r in self.results]
+
+    def build_context_from_results(self, results, detailed=True):
+        return "\n".join(r["metadata"]["title"] for r in results)
+
+
+class TestSpeculationGate:
+    """RAG releases speculative web work as soon as it has recipes, not after facts"""
+
+    def test_rag_hit_set_before_facts(self, orchestrator):
+        orchestrator.rag_engine = FakeRAGEngine([
+            {"id": "1", "score": 0.9, "metadata": {"title": "Lamb Rogan Josh", "ingredients": ["lamb"]}},
+        ])
+        rag_hit = threading.Event()
+        seen = []
+        orchestrator._generate_facts = lambda context, query: seen.append(rag_hit.is_set()) or []
+
+        result = orchestrator._process_rag_pipeline("lamb curry", 10, 0.35, rag_hit=rag_hit)
+        assert result["has_results"] is True
+        assert seen == [True]
+
+    def test_rag_hit_stays_clear_on_miss(self, orchestrator):
+        orchestrator.rag_engine = FakeRAGEngine([])
+        rag_hit = threading.Event()
+
+        result = orchestrator._process_rag_pipeline("lamb curry", 10, 0.35, rag_hit=rag_hit)
+        assert result["has_results"] is False
+        assert not rag_hit.is_set()
+
+
+class TestKeywordClassifiers:
+    """Regex keyword matching used to classify queries and titles"""
+
+    def test_keyword_re_matches_substrings(self):
+        pattern = _keyword_re(["egg", "c++"])
+        assert pattern.search("scrambled eggs")
+        assert pattern.search("c++ cookbook")
+        assert not pattern.search("bacon")
+
+    def test_match_foods_finds_protein_by_priority(self):
+        assert _match_foods("salmon with chicken") == (True, "chicken")
+        assert _match_foods("lamb curry") == (True, "lamb")
+
+    def test_match_foods_dish_without_protein(self):
+        has_dish, protein = _match_foods("creamy pasta")
+        assert has_dish is True
+        assert protein is None
+
+    def test_match_foods_generic_query(self):
+        assert _match_foods("what should i cook tonight?") == (False, None)
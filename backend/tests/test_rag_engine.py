@@ -0,0 +1,69 @@
+"""
+Unit tests for Chroma search keyword scoring and result caching
+"""
+import asyncio
+
+import numpy as np
+import pytest
+from rag_engine import RecipeRAGEngine, _extract_key_terms, _term_matcher
+from utils.cache import EmbeddingCache, SemanticResultCache
+
+
+@pytest.fixture
+def engine():
+    # Scoring needs no Gemini or Chroma connection
+    engine = RecipeRAGEngine.__new__(RecipeRAGEngine)
+    engine._meta_cache = {}
+    return engine
+
+
+def score(engine, query, metadatas):
+    all_terms, ingredient_terms, methods, _ = _extract_key_terms(query)
+    return engine._score_candidates(
+        metadatas, [0.5] * len(metadatas), all_terms, ingredient_terms, methods,
+        top_k=5, filters=None, min_score=0.0,
+    )
+
+
+class TestKeywordMatching:
+    """Query terms are matched as whole words, singular or plural"""
+
+    def test_matcher_accepts_plurals(self):
+        matcher = _term_matcher(("egg", "tomato"))
+        assert matcher.findall("2 eggs, 3 tomatoes") == ["egg", "tomato"]
+        assert matcher.findall("1 egg, 1 tomato") == ["egg", "tomato"]
+
+    def test_matcher_keeps_word_boundaries(self):
+        matcher = _term_matcher(("egg",))
+        assert matcher.findall("roasted eggplant") == []
+
+    def test_singular_query_matches_plural_ingredients(self, engine):
+        [result] = score(engine, "egg fried rice with tomato", [
+            {"id": "1", "title": "Stir fry", "ingredients": ["with eggs", "tomatoes", "onions"]},
+        ])
+        assert result["keyword_match"] is True
+        assert result["match_details"]["ingredient_matches"] == 2
+
+    def test_ingredient_match_boosts_score(self, engine):
+        plural, unrelated = score(engine, "egg fried rice with tomato", [
+            {"id": "1", "title": "Shakshuka", "ingredients": ["4 eggs", "6 tomatoes"]},
+            {"id": "2", "title": "Lemon tart", "ingredients": ["lemons", "sugar"]},
+        ])
+        assert plural["id"] == "1"
+        assert plural["score"] > unrelated["score"]
+
+
+class TestSearchCache:
+    """The sync and async searches share one result cache"""
+
+    def test_async_search_shares_cache(self, engine):
+        ranked = []
+        engine._embedding_cache = EmbeddingCache()
+        engine._embedding_cache.set("lamb curry", np.ones(4, dtype=np.float32))  # No Gemini call
+        engine._search_cache = SemanticResultCache()
+        engine._rank_candidates = lambda *args: ranked.append(args) or [{"id": "1"}]
+
+        assert asyncio.run(engine.asearch_chroma("lamb curry")) == [{"id": "1"}]
+        assert engine.search_chroma("lamb curry") == [{"id": "1"}]
+        assert asyncio.run(engine.asearch_chroma("lamb curry")) == [{"id": "1"}]
+        assert len(ranked) == 1
@@ -0,0 +1,103 @@
+"""
+Unit tests for the scraper's shared browser lifecycle
+"""
+import asyncio
+
+import pytest
+from services import recipe_scraper_pipeline as pipeline
+
+
+class FakeCrawler:
+    """
+    Stands in for AsyncWebCrawler. The URL picks the outcome: "crash" fails with
+    Playwright's closed-target error, "slow" takes a while, "blocked" is a page the
+    site refused. Pages still loading fail once the browser is closed.
+    """
+    instances = []
+
+    def __init__(self, config=None):
+        self.closed = False
+        FakeCrawler.instances.append(self)
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+    async def arun(self, url, config=None):
+        if "slow" in url:
+            await asyncio.sleep(0.1)
+        if "crash" in url or self.closed:
+            raise RuntimeError("Target page, context or browser has been closed")
+        if "blocked" in url:
+            return type("Result", (), {"success": False, "html": "", "error_message": "403 Forbidden"})()
+        return type("Result", (), {"success": True, "html": "<html></html>"})()
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    FakeCrawler.instances = []
+    monkeypatch.setattr(pipeline, "AsyncWebCrawler", FakeCrawler)
+    monkeypatch.setattr(pipeline, "SCRAPE_KEEP_BROWSER", True)
+    pipeline.run_scrape(pipeline._close_browser())
+    yield
+    pipeline.run_scrape(pipeline._close_browser())
+
+
+async def fetch_batch(*urls):
+    """One batch: a crawler session with its pages fetched concurrently"""
+    scraper = pipeline.WebRecipeScraper()
+    async with pipeline._crawler_session(scraper.browser_config) as crawler:
+        pages = await asyncio.gather(*(scraper.fetch_page_html(url, crawler) for url in urls))
+    return crawler, pages
+
+
+class TestSharedBrowser:
+    """A crashed shared browser is replaced without breaking fetches still using it"""
+
+    def test_dead_browser_replaced_on_next_batch(self, fake_browser):
+        first, pages = pipeline.run_scrape(fetch_batch("https://example.com/crash"))
+        assert pages == [None]
+        assert first.closed is True
+
+        second, pages = pipeline.run_scrape(fetch_batch("https://example.com/b"))
+        assert second is not first
+        assert pages == ["<html></html>"]
+
+    def test_browser_kept_while_healthy(self, fake_browser):
+        first, _ = pipeline.run_scrape(fetch_batch("https://example.com/a"))
+        second, _ = pipeline.run_scrape(fetch_batch("https://example.com/b"))
+        assert second is first
+        assert first.closed is False
+
+    def test_site_failures_keep_browser(self, fake_browser):
+        first, pages = pipeline.run_scrape(fetch_batch(*(f"https://example.com/blocked/{i}" for i in range(10))))
+        assert pages == [None] * 10
+
+        second, pages = pipeline.run_scrape(fetch_batch("https://example.com/a"))
+        assert second is first and first.closed is False
+        assert pages == ["<html></html>"]
+
+    def test_retired_browser_closes_after_last_user(self, fake_browser):
+        async def two_batches():
+            scraper = pipeline.WebRecipeScraper()
+            async with pipeline._crawler_session(scraper.browser_config) as crawler:
+                other = asyncio.create_task(fetch_batch("https://example.com/other"))
+                html = await scraper.fetch_page_html("https://example.com/crash", crawler)
+                assert html is None
+                assert pipeline._browser is None and crawler.closed is False
+                other_crawler, _ = await other
+                assert other_crawler is not crawler  # The next session gets a fresh browser
+            return crawler
+
+        crashed = pipeline.run_scrape(two_batches())
+        assert crashed.closed is True
+        assert pipeline._browser is FakeCrawler.instances[-1]
+        assert pipeline._browser.closed is False
+
+    def test_concurrent_fetch_survives_crash(self, fake_browser):
+        crawler, pages = pipeline.run_scrape(fetch_batch("https://example.com/slow", "https://example.com/crash"))
+        assert pages == ["<html></html>", None]
+        assert crawler.closed is True
+        assert pipeline._browser is None
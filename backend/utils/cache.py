@@ -1,35 +1,289 @@
-"""Simple in-memory cache with TTL"""
-from typing import Any, Optional
+"""Simple in-memory caches (TTL values, quantized embeddings, search results)"""
+from typing import Any, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
+import threading
 import hashlib
 import json
+import logging
+import os
+
+import numpy as np
+
+try:
+    import simsimd  # Optional SIMD kernels for int8 cosine
+except ImportError:
+    simsimd = None
+
+try:
+    import redis  # Optional cache shared across workers and restarts
+except ImportError:
+    redis = None
+
+logger = logging.getLogger("CulinaraAI.cache")
+
+@lru_cache(maxsize=1)
+def get_shared_redis():
+    """Redis client for REDIS_URL, or None when unset / redis isn't installed"""
+    url = os.getenv("REDIS_URL")
+    if redis is None or not url:
+        return None
+    return redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.5)
 
 class SimpleCache:
-    def __init__(self, ttl_seconds: int = 3600):
-        self.cache: dict = {}
+    def __init__(self, ttl_seconds: int = 3600, max_entries: Optional[int] = None):
+        self.cache: "OrderedDict[str, dict]" = OrderedDict()
         self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_entries = max_entries  # None = unbounded; otherwise evict least recently used
+        self._lock = threading.Lock()
     
     def get(self, key: str) -> Optional[Any]:
-        if key not in self.cache:
-            return None
-        
-        entry = self.cache[key]
-        if datetime.now() > entry['expires_at']:
-            del self.cache[key]
-            return None
-        
-        return entry['value']
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return None
+
+            if datetime.now() > entry['expires_at']:
+                del self.cache[key]
+                return None
+
+            self.cache.move_to_end(key)
+            return entry['value']
     
     def set(self, key: str, value: Any) -> None:
-        self.cache[key] = {
-            'value': value,
-            'expires_at': datetime.now() + self.ttl
-        }
+        with self._lock:
+            self.cache[key] = {
+                'value': value,
+                'expires_at': datetime.now() + self.ttl
+            }
+            self.cache.move_to_end(key)
+            if self.max_entries is not None and len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self.cache.pop(key, None)
     
     def clear(self) -> None:
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
     
     def size(self) -> int:
         return len(self.cache)
 
+class EmbeddingCache:
+    """
+    Exact LRU memo of float32 embeddings by key. Vectors come back exactly as
+    stored (read-only), so a repeat query searches with the same vector as the first.
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self.cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vec = self.cache.get(key)
+            if vec is not None:
+                self.cache.move_to_end(key)
+            return vec
+
+    def set(self, key: str, vec) -> np.ndarray:
+        """Store vec (as a read-only float32 array) and return the stored array"""
+        vec = np.array(vec, dtype=np.float32)
+        vec.setflags(write=False)
+        with self._lock:
+            self.cache[key] = vec
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+        return vec
+
+    def clear(self) -> None:
+        with self._lock:
+            self.cache.clear()
+
+    def size(self) -> int:
+        return len(self.cache)
+
+class QuantizedEmbeddingCache:
+    """
+    LRU cache of embeddings stored as int8 with a per-vector scale, for the
+    similarity lookups in SemanticResultCache (lossy: exact memos use EmbeddingCache).
+    Cuts memory ~4x vs float32; cosine similarity is scale invariant,
+    so lookups can compare the int8 vectors directly.
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self.cache: "OrderedDict[str, Tuple[np.ndarray, float]]" = OrderedDict()
+        self._matrix: Optional[Tuple[list, np.ndarray]] = None  # (keys, stacked int8 rows) for nearest()
+        self._lock = threading.Lock()  # Shared by search worker threads
+
+    @staticmethod
+    def quantize(vec) -> Tuple[np.ndarray, float]:
+        vec = np.asarray(vec, dtype=np.float32)
+        peak = float(np.max(np.abs(vec))) if vec.size else 0.0
+        scale = 127.0 / peak if peak else 1.0
+        return np.round(vec * scale).astype(np.int8), scale
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return None
+            self.cache.move_to_end(key)
+        q, scale = entry
+        return q.astype(np.float32) / scale
+
+    def set(self, key: str, vec) -> None:
+        entry = self.quantize(vec)
+        with self._lock:
+            self.cache[key] = entry
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+            self._matrix = None
+
+    def nearest(self, vec, threshold: float = 0.97, prefix: Optional[str] = None) -> Optional[str]:
+        """
+        Key of the most similar cached embedding if its cosine >= threshold,
+        only considering keys that start with prefix when one is given
+        """
+        with self._lock:
+            if not self.cache:
+                return None
+            if self._matrix is None:
+                keys = list(self.cache)
+                self._matrix = (keys, np.stack([self.cache[k][0] for k in keys]))
+            keys, matrix = self._matrix
+
+        if prefix is not None:
+            rows = [i for i, k in enumerate(keys) if k.startswith(prefix)]
+            if not rows:
+                return None
+            keys, matrix = [keys[i] for i in rows], matrix[rows]
+
+        q, _ = self.quantize(vec)
+        if simsimd is not None:
+            sims = 1.0 - np.asarray(simsimd.cdist(q[None, :], matrix, metric="cosine"), dtype=np.float32)[0]
+        else:
+            mat = matrix.astype(np.float32)
+            qf = q.astype(np.float32)
+            norms = np.linalg.norm(mat, axis=1) * np.linalg.norm(qf)
+            sims = (mat @ qf) / np.where(norms == 0, 1.0, norms)
+
+        best = int(np.argmax(sims))
+        return keys[best] if sims[best] >= threshold else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self.cache.clear()
+            self._matrix = None
+
+    def size(self) -> int:
+        return len(self.cache)
+
+def _json_default(value):
+    """NumPy scalars/arrays -> plain Python for JSON; anything else as a string"""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    return str(value)
+
+try:
+    import orjson  # Faster (de)serialization of cached result payloads
+    _json_loads = orjson.loads
+
+    def _json_dumps(value) -> bytes:
+        return orjson.dumps(value, default=_json_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(value) -> bytes:
+        return json.dumps(value, default=_json_default).encode("utf-8")
+
+class SemanticResultCache:
+    """
+    Search results cached by (scope, normalized query), with a fallback to the
+    nearest cached query embedding so paraphrases reuse results too.
+    scope holds everything else that shapes the results (top_k, min_score, filters).
+
+    With a namespace and REDIS_URL set, exact hits are also shared through Redis,
+    so other workers (and restarted ones) skip the search. The similarity tier
+    stays in-process.
+    """
+
+    def __init__(self, ttl_seconds: int = 600, max_entries: int = 512, threshold: float = 0.97,
+                 namespace: Optional[str] = None):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.results = SimpleCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self.embeddings = QuantizedEmbeddingCache(max_entries=max_entries)
+        self.namespace = namespace
+        self.shared = get_shared_redis() if namespace else None
+
+    @staticmethod
+    def _key(scope: str, query: str) -> str:
+        return f"{scope}\0{query.strip().lower()}"
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self.namespace}:{hashlib.sha256(key.encode('utf-8')).hexdigest()}"
+
+    def _get_shared(self, key: str) -> Optional[list]:
+        try:
+            raw = self.shared.get(self._shared_key(key))
+            return _json_loads(raw) if raw else None
+        except Exception as e:  # A cache outage must never fail the search
+            logger.debug("Shared cache read failed: %s", e)
+            return None
+
+    def _set_shared(self, key: str, results: list) -> None:
+        try:
+            self.shared.set(self._shared_key(key), _json_dumps(results), ex=self.ttl_seconds)
+        except Exception as e:
+            logger.debug("Shared cache write failed: %s", e)
+
+    def get(self, scope: str, query: str, embedding) -> Optional[list]:
+        key = self._key(scope, query)
+        results = self.results.get(key)
+
+        if results is None and self.shared is not None:
+            results = self._get_shared(key)
+            if results is not None:
+                self.results.set(key, results)
+                self.embeddings.set(key, embedding)
+
+        if results is None:
+            near_key = self.embeddings.nearest(embedding, threshold=self.threshold,
+                                               prefix=self._key(scope, ""))
+            if near_key:
+                results = self.results.get(near_key)
+
+        # Copies, since callers re-score results in place
+        return [dict(r) for r in results] if results is not None else None
+
+    def set(self, scope: str, query: str, embedding, results: list) -> None:
+        key = self._key(scope, query)
+        self.results.set(key, [dict(r) for r in results])
+        self.embeddings.set(key, embedding)
+        if self.shared is not None:
+            self._set_shared(key, results)
+
+    def clear(self) -> None:
+        self.results.clear()
+        self.embeddings.clear()
+        if self.shared is not None:
+            try:
+                keys = list(self.shared.scan_iter(match=f"{self.namespace}:*", count=500))
+                if keys:
+                    self.shared.delete(*keys)
+            except Exception as e:
+                logger.debug("Shared cache clear failed: %s", e)
+
+    def size(self) -> int:
+        return self.results.size()
+
 response_cache = SimpleCache(ttl_seconds=3600)
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""JSON decoding through orjson when it's installed"""
+import json
+
+try:
+    import orjson
+
+    def json_loads(text):
+        # orjson only takes exact str (or bytes); BeautifulSoup hands back NavigableString
+        return orjson.loads(str(text) if isinstance(text, str) else text)
+except ImportError:
+    json_loads = json.loads
@@ -0,0 +1,30 @@
+"""Shared Gemini client setup"""
+import os
+import threading
+from functools import lru_cache
+from typing import Optional
+
+import google.generativeai as genai
+
+_configured_key: Optional[str] = None
+_lock = threading.Lock()
+
+def configure_gemini(api_key: Optional[str] = None) -> None:
+    """
+    Configure google-generativeai once per process.
+    genai.configure() drops the cached API clients, so repeating it for every
+    engine/orchestrator would throw away their warm connections.
+    """
+    global _configured_key
+    key = api_key or os.getenv("GEMINI_API_KEY")
+    with _lock:
+        if key == _configured_key:
+            return
+        genai.configure(api_key=key)
+        _configured_key = key
+
+@lru_cache(maxsize=16)
+def get_generative_model(model_name: str, system_instruction: Optional[str] = None) -> genai.GenerativeModel:
+    """Reusable GenerativeModel handle per (model, system instruction)"""
+    configure_gemini()
+    return genai.GenerativeModel(model_name=model_name, system_instruction=system_instruction)
@@ -14,6 +14,13 @@ import time
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+try:
+    # Optional: pgvector's psycopg2 adapter sends numpy vectors natively
+    import numpy as np
+    from pgvector.psycopg2 import register_vector
+except ImportError:
+    register_vector = None
+
 load_dotenv()
 
 def connect_db():
@@ -109,8 +116,18 @@ def insert_embedding(recipe_id: str, embedding: List[float]) -> bool:
         conn = connect_db()
         cursor = conn.cursor()
 
-        # Convert embedding to string format for pgvector
-        embedding_str = '[' + ','.join(str(x) for x in embedding) + ']'
+        # Store unit-length vectors: search_recipes ranks by inner product
+        norm = sum(x * x for x in embedding) ** 0.5
+        if norm:
+            embedding = [x / norm for x in embedding]
+
+        if register_vector is not None:
+            # Let the pgvector adapter encode the float32 array
+            register_vector(conn)
+            embedding_param = np.asarray(embedding, dtype=np.float32)
+        else:
+            # Fall back to pgvector's text format
+            embedding_param = '[' + ','.join(str(x) for x in embedding) + ']'
 
         cursor.execute("""
             INSERT INTO recipe_embeddings (recipe_id, embedding)
@@ -118,7 +135,7 @@ def insert_embedding(recipe_id: str, embedding: List[float]) -> bool:
             ON CONFLICT (recipe_id) DO UPDATE
             SET embedding = EXCLUDED.embedding,
                 updated_at = NOW()
-        """, (recipe_id, embedding_str))
+        """, (recipe_id, embedding_param))
 
         conn.commit()
         cursor.close()
@@ -0,0 +1,77 @@
+-- Inner-product semantic search
+-- Embeddings are stored at unit length, so cosine similarity equals the dot
+-- product and search can use pgvector's cheaper <#> operator (no per-row norms)
+
+-- =============================================================================
+-- NORMALIZE STORED EMBEDDINGS (one-off)
+-- =============================================================================
+-- Gemini text-embedding-004 vectors are already close to unit length; this makes
+-- it exact for every row (l2_normalize requires pgvector >= 0.7)
+UPDATE recipe_embeddings
+SET embedding = l2_normalize(embedding)
+WHERE abs(vector_norm(embedding) - 1) > 1e-6;
+
+-- =============================================================================
+-- INDEX
+-- =============================================================================
+-- Swap the cosine HNSW index for an inner-product one so <#> stays indexed
+DROP INDEX IF EXISTS idx_recipe_embeddings_vector;
+
+CREATE INDEX IF NOT EXISTS idx_recipe_embeddings_vector_ip
+ON recipe_embeddings
+USING hnsw (embedding vector_ip_ops);
+
+-- =============================================================================
+-- SEMANTIC SEARCH FUNCTION
+-- =============================================================================
+-- Same signature and result shape as before; <#> returns the NEGATIVE inner
+-- product, so similarity = -(a <#> b) for unit vectors
+CREATE OR REPLACE FUNCTION search_recipes(
+    query_embedding VECTOR(768),
+    match_threshold FLOAT DEFAULT 0.3,
+    match_count INT DEFAULT 10
+)
+RETURNS TABLE (
+    id UUID,
+    title TEXT,
+    ingredients JSONB,
+    instructions JSONB,
+    source_url TEXT,
+    source_name TEXT,
+    image_url TEXT,
+    cuisine TEXT,
+    diet_tags TEXT[],
+    prep_time INTEGER,
+    cook_time INTEGER,
+    servings INTEGER,
+    facts JSONB,
+    similarity FLOAT
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        r.id,
+        r.title,
+        r.ingredients,
+        r.instructions,
+        r.source_url,
+        r.source_name,
+        r.image_url,
+        r.cuisine,
+        r.diet_tags,
+        r.prep_time,
+        r.cook_time,
+        r.servings,
+        r.facts,
+        (e.embedding <#> query_embedding) * -1 AS similarity
+    FROM recipes r
+    INNER JOIN recipe_embeddings e ON r.id = e.recipe_id
+    WHERE (e.embedding <#> query_embedding) * -1 > match_threshold
+    ORDER BY e.embedding <#> query_embedding
+    LIMIT match_count;
+END;
+$$;
+
+COMMENT ON FUNCTION search_recipes IS 'Semantic recipe search over unit-length embeddings using inner product';
@@ -0,0 +1,77 @@
+-- HNSW index tuning for semantic search
+-- Builds the inner-product index with explicit graph parameters and lets each
+-- search_recipes call pick its recall/latency trade-off via hnsw.ef_search
+
+-- =============================================================================
+-- INDEX
+-- =============================================================================
+-- m = 16 links per node, ef_construction = 64 (pgvector defaults, made explicit
+-- so rebuilds are reproducible). Raise both for better recall on large tables.
+DROP INDEX IF EXISTS idx_recipe_embeddings_vector_ip;
+
+CREATE INDEX IF NOT EXISTS idx_recipe_embeddings_vector_ip
+ON recipe_embeddings
+USING hnsw (embedding vector_ip_ops)
+WITH (m = 16, ef_construction = 64);
+
+-- =============================================================================
+-- SEMANTIC SEARCH FUNCTION
+-- =============================================================================
+-- Drop first: adding a parameter would otherwise create an overload that
+-- PostgREST can't disambiguate
+DROP FUNCTION IF EXISTS search_recipes(VECTOR(768), FLOAT, INT);
+
+CREATE OR REPLACE FUNCTION search_recipes(
+    query_embedding VECTOR(768),
+    match_threshold FLOAT DEFAULT 0.3,
+    match_count INT DEFAULT 10,
+    ef_search INT DEFAULT 40
+)
+RETURNS TABLE (
+    id UUID,
+    title TEXT,
+    ingredients JSONB,
+    instructions JSONB,
+    source_url TEXT,
+    source_name TEXT,
+    image_url TEXT,
+    cuisine TEXT,
+    diet_tags TEXT[],
+    prep_time INTEGER,
+    cook_time INTEGER,
+    servings INTEGER,
+    facts JSONB,
+    similarity FLOAT
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Candidate list size for this transaction only; never below match_count
+    -- or the index scan can return fewer rows than requested
+    PERFORM set_config('hnsw.ef_search', GREATEST(ef_search, match_count)::TEXT, true);
+
+    RETURN QUERY
+    SELECT
+        r.id,
+        r.title,
+        r.ingredients,
+        r.instructions,
+        r.source_url,
+        r.source_name,
+        r.image_url,
+        r.cuisine,
+        r.diet_tags,
+        r.prep_time,
+        r.cook_time,
+        r.servings,
+        r.facts,
+        (e.embedding <#> query_embedding) * -1 AS similarity
+    FROM recipes r
+    INNER JOIN recipe_embeddings e ON r.id = e.recipe_id
+    WHERE (e.embedding <#> query_embedding) * -1 > match_threshold
+    ORDER BY e.embedding <#> query_embedding
+    LIMIT match_count;
+END;
+$$;
+
+COMMENT ON FUNCTION search_recipes IS 'Semantic recipe search over unit-length embeddings using inner product; ef_search trades recall for latency';
@@ -0,0 +1,82 @@
+-- Batched semantic search
+-- Runs several query embeddings through the HNSW index in one RPC call,
+-- so N questions cost one round trip instead of N
+
+-- =============================================================================
+-- BATCH SEARCH FUNCTION
+-- =============================================================================
+-- query_embeddings is a JSON array of unit-length embeddings; each element's
+-- text form ('[0.1, ...]') is valid pgvector input. query_index is 1-based.
+CREATE OR REPLACE FUNCTION search_recipes_batch(
+    query_embeddings JSONB,
+    match_threshold FLOAT DEFAULT 0.3,
+    match_count INT DEFAULT 10,
+    ef_search INT DEFAULT 40
+)
+RETURNS TABLE (
+    query_index INT,
+    id UUID,
+    title TEXT,
+    ingredients JSONB,
+    instructions JSONB,
+    source_url TEXT,
+    source_name TEXT,
+    image_url TEXT,
+    cuisine TEXT,
+    diet_tags TEXT[],
+    prep_time INTEGER,
+    cook_time INTEGER,
+    servings INTEGER,
+    facts JSONB,
+    similarity FLOAT
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM set_config('hnsw.ef_search', GREATEST(ef_search, match_count)::TEXT, true);
+
+    RETURN QUERY
+    SELECT
+        q.idx::INT AS query_index,
+        m.id,
+        m.title,
+        m.ingredients,
+        m.instructions,
+        m.source_url,
+        m.source_name,
+        m.image_url,
+        m.cuisine,
+        m.diet_tags,
+        m.prep_time,
+        m.cook_time,
+        m.servings,
+        m.facts,
+        m.similarity
+    FROM jsonb_array_elements(query_embeddings) WITH ORDINALITY AS q(emb, idx)
+    CROSS JOIN LATERAL (
+        SELECT
+            r.id,
+            r.title,
+            r.ingredients,
+            r.instructions,
+            r.source_url,
+            r.source_name,
+            r.image_url,
+            r.cuisine,
+            r.diet_tags,
+            r.prep_time,
+            r.cook_time,
+            r.servings,
+            r.facts,
+            (e.embedding <#> (q.emb::TEXT)::VECTOR(768)) * -1 AS similarity
+        FROM recipes r
+        INNER JOIN recipe_embeddings e ON r.id = e.recipe_id
+        WHERE (e.embedding <#> (q.emb::TEXT)::VECTOR(768)) * -1 > match_threshold
+        ORDER BY e.embedding <#> (q.emb::TEXT)::VECTOR(768)
+        LIMIT match_count
+    ) m
+    ORDER BY q.idx, m.similarity DESC;
+END;
+$$;
+
+COMMENT ON FUNCTION search_recipes_batch IS 'Semantic recipe search for several query embeddings in one call';